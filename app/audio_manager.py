@@ -6,14 +6,28 @@ import threading
 import platform
 from typing import Optional, Dict, Any
 
+from hardware.log import get_logger
+
+
+_log = get_logger('audio')
+
+
 class AudioManager:
     """
     FM 라디오의 오디오 제어를 위한 매니저 클래스
     Pop sound 방지 및 호환성 개선을 위한 기능 제공
     """
     
-    def __init__(self, fm_device):
+    def __init__(self, fm_device, inline_fade=False):
+        """
+        Args:
+            fm_device: BesFM 또는 같은 인터페이스의 프록시
+            inline_fade (bool): 페이드 단계를 별도 스레드 없이 호출한 스레드에서 바로 실행
+                (시퀀스를 I/O 워커 작업으로 실행할 때 - 페이드가 뒤따르는 뮤트 / 전원 명령보다
+                먼저 끝나고, 워커 큐를 기다리는 페이드 스레드가 생기지 않음)
+        """
         self.fm = fm_device
+        self.inline_fade = inline_fade
         self.current_volume = 0
         self.target_volume = 0
         self.is_fading = False
@@ -23,6 +37,9 @@ class AudioManager:
         # 플랫폼별 설정
         self.platform_config = self._get_platform_config()
         
+        # 기기가 명령 간격을 스스로 학습하면 고정 볼륨 변경 지연은 생략
+        self._device_paced = fm_device is not None and hasattr(fm_device, 'get_pacing_profile')
+        
     def _get_platform_config(self) -> Dict[str, Any]:
         """플랫폼별 최적 설정 반환"""
         system = platform.system()
@@ -82,7 +99,10 @@ class AudioManager:
         if volume_diff <= 1:
             return self._set_volume_immediate(target_volume)
         
-        # 점진적 볼륨 변경 시작
+        # 점진적 볼륨 변경 시작 (inline_fade면 끝날 때까지 여기서 실행)
+        if self.inline_fade:
+            self._fade_volume()
+            return True
         self.fade_thread = threading.Thread(target=self._fade_volume)
         self.fade_thread.daemon = True
         self.fade_thread.start()
@@ -98,14 +118,16 @@ class AudioManager:
                 steps = self.platform_config['fade_steps']
                 delay = self.platform_config['fade_delay']
                 
-                volume_diff = self.target_volume - self.current_volume
+                # 단계마다 current_volume이 바뀌므로 시작 볼륨 기준으로 계산
+                start_volume = self.current_volume
+                volume_diff = self.target_volume - start_volume
                 step_size = volume_diff / steps
                 
                 for i in range(steps):
                     if not self.is_fading:  # 중단 요청 시
                         break
                         
-                    new_volume = self.current_volume + (step_size * (i + 1))
+                    new_volume = start_volume + (step_size * (i + 1))
                     new_volume = max(0, min(15, round(new_volume)))
                     
                     if self._set_volume_immediate(new_volume):
@@ -118,7 +140,7 @@ class AudioManager:
                     self._set_volume_immediate(self.target_volume)
                     
             except Exception as e:
-                print(f"Volume fade error: {e}")
+                _log.warning("Volume fade error: %s", e)
             finally:
                 self.is_fading = False
     
@@ -127,12 +149,18 @@ class AudioManager:
         try:
             self.fm.set_volume(volume)
             self.current_volume = volume
-            time.sleep(self.platform_config['volume_change_delay'])
+            if not self._device_paced:
+                time.sleep(self.platform_config['volume_change_delay'])
             return True
         except Exception as e:
-            print(f"Volume set error: {e}")
+            _log.warning("Volume set error: %s", e)
             return False
     
+    def _wait_fade(self, seconds):
+        """페이드 스레드가 끝나기를 기다림 (inline_fade면 이미 끝났으므로 대기 없음)"""
+        if not self.inline_fade:
+            time.sleep(seconds)
+    
     def _stop_fade(self):
         """페이딩 중단"""
         self.is_fading = False
@@ -158,7 +186,7 @@ class AudioManager:
                 self.current_volume = self.fm.get_volume()
                 if self.current_volume > 0:
                     self.set_volume_smooth(0)
-                    time.sleep(self.platform_config['mute_fade_time'])
+                    self._wait_fade(self.platform_config['mute_fade_time'])
                 
                 # 하드웨어 뮤트 설정
                 self.fm.set_mute(True)
@@ -178,7 +206,7 @@ class AudioManager:
             return True
             
         except Exception as e:
-            print(f"Soft mute error: {e}")
+            _log.warning("Soft mute error: %s", e)
             return False
     
     def frequency_change_prepare(self):
@@ -193,10 +221,10 @@ class AudioManager:
             # 볼륨을 점진적으로 낮춤
             if self._saved_volume > 3:
                 self.set_volume_smooth(3)
-                time.sleep(0.05)  # 50ms 대기
+                self._wait_fade(0.05)  # 50ms 대기
                 
         except Exception as e:
-            print(f"Frequency change prepare error: {e}")
+            _log.warning("Frequency change prepare error: %s", e)
     
     def frequency_change_complete(self):
         """주파수 변경 후 복원"""
@@ -212,7 +240,7 @@ class AudioManager:
                 self.set_volume_smooth(self._saved_volume)
                 
         except Exception as e:
-            print(f"Frequency change complete error: {e}")
+            _log.warning("Frequency change complete error: %s", e)
     
     def power_on_sequence(self) -> bool:
         """전원 켜기 시퀀스 (pop sound 최소화)"""
@@ -220,6 +248,14 @@ class AudioManager:
             return False
         
         try:
+            if self._device_paced:
+                # 볼륨 0 -> 전원 -> 뮤트 해제를 한 트랜잭션으로 (이미 같은 값은 생략,
+                # 전원 안정화 대기는 뮤트 해제 직전에만)
+                self.fm.apply(self._power_config({'volume': 0, 'power': True, 'mute': False}))
+                self.current_volume = 0
+                self.set_volume_smooth(6)
+                return True
+
             # 1. 볼륨을 0으로 설정
             self.fm.set_volume(0)
             time.sleep(0.02)
@@ -238,9 +274,15 @@ class AudioManager:
             return True
             
         except Exception as e:
-            print(f"Power on sequence error: {e}")
+            _log.warning("Power on sequence error: %s", e)
             return False
     
+    def _power_config(self, config):
+        """녹음 모드에서는 전원을 바꾸지 않음 (set_power()와 같은 규칙)"""
+        if self.fm.get_recording():
+            config.pop('power')
+        return config
+
     def power_off_sequence(self) -> bool:
         """전원 끄기 시퀀스 (pop sound 최소화)"""
         if self.fm is None:
@@ -251,8 +293,13 @@ class AudioManager:
             current_vol = self.fm.get_volume()
             if current_vol > 0:
                 self.set_volume_smooth(0)
-                time.sleep(0.15)  # 페이딩 완료 대기
+                self._wait_fade(0.15)  # 페이딩 완료 대기
             
+            if self._device_paced:
+                # 뮤트 -> 전원 끄기 (간격은 기기 pacing이 관리)
+                self.fm.apply(self._power_config({'mute': True, 'power': False}))
+                return True
+
             # 2. 뮤트 설정
             self.fm.set_mute(True)
             time.sleep(0.02)
@@ -263,7 +310,7 @@ class AudioManager:
             return True
             
         except Exception as e:
-            print(f"Power off sequence error: {e}")
+            _log.warning("Power off sequence error: %s", e)
             return False
     
     def recording_start_sequence(self) -> bool:
@@ -282,7 +329,7 @@ class AudioManager:
             return True
             
         except Exception as e:
-            print(f"Recording start sequence error: {e}")
+            _log.warning("Recording start sequence error: %s", e)
             return False
     
     def recording_stop_sequence(self) -> bool:
@@ -293,7 +340,7 @@ class AudioManager:
         try:
             # 볼륨을 먼저 낮춤
             self.set_volume_smooth(0)
-            time.sleep(0.1)
+            self._wait_fade(0.1)
             
             # 레코딩 중지
             self.fm.set_recording(False)
@@ -301,7 +348,7 @@ class AudioManager:
             return True
             
         except Exception as e:
-            print(f"Recording stop sequence error: {e}")
+            _log.warning("Recording stop sequence error: %s", e)
             return False
     
     def cleanup(self):
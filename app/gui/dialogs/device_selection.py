@@ -5,16 +5,29 @@ import besfm
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QGroupBox, QListWidget, QListWidgetItem, 
                                QPushButton, QTextEdit, QMessageBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
+
+from hardware.hotplug import get_hotplug_watcher
 
 
 class DeviceSelectionDialog(QDialog):
+    # 핫플러그 감시 스레드에서 GUI 스레드로 목록 갱신 요청
+    devices_changed = Signal()
+    # 문자열 디스크립터 스레드에서 GUI 스레드로 상세 정보 갱신 요청
+    descriptors_loaded = Signal()
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_device = None
         self.available_devices = []
+        self.available_infos = []
+        self.hotplug = get_hotplug_watcher()
         self.init_ui()
-        self.scan_devices()
+        # 캐시된 목록을 바로 표시하고 이후 연결/분리는 자동 반영
+        self.devices_changed.connect(self.populate_devices)
+        self.descriptors_loaded.connect(self.on_selection_changed)
+        self.hotplug.subscribe(self.on_hotplug)
+        self.populate_devices()
     
     def init_ui(self):
         self.setWindowTitle("FM Radio Device Selection")
@@ -148,16 +161,39 @@ class DeviceSelectionDialog(QDialog):
         layout.addLayout(button_layout)
     
     def scan_devices(self):
-        """USB 기기 스캔"""
+        """USB 기기 다시 스캔 (Refresh 버튼)"""
+        self.hotplug.refresh()
+        self.populate_devices()
+    
+    def on_hotplug(self, event, info):
+        """핫플러그 감시 스레드에서 호출 - GUI 스레드로 넘김"""
+        self.devices_changed.emit()
+    
+    def done(self, result):
+        """다이얼로그 종료 시 핫플러그 콜백 해제"""
+        self.hotplug.unsubscribe(self.on_hotplug)
+        super().done(result)
+    
+    def populate_devices(self):
+        """핫플러그 캐시로 기기 목록 표시 (선택 유지)"""
+        current_item = self.device_list.currentItem()
+        selected_location = None
+        if current_item is not None:
+            index = current_item.data(Qt.UserRole)
+            if index is not None and 0 <= index < len(self.available_infos):
+                selected = self.available_infos[index]
+                selected_location = (selected['bus'], selected['address'])
+        
         self.device_list.clear()
         self.available_devices.clear()
+        self.available_infos.clear()
         
         try:
-            # besfm의 정적 메서드 사용
-            device_infos = besfm.BesFM.find_all_devices()
+            device_infos = self.hotplug.devices()
             
             for device_info in device_infos:
                 self.available_devices.append(device_info['device'])
+                self.available_infos.append(device_info)
                 
                 # 기기 이름 생성 (besfm의 get_device_name 사용)
                 device_name = besfm.BesFM.get_device_name(device_info['product_id'])
@@ -166,6 +202,8 @@ class DeviceSelectionDialog(QDialog):
                 item = QListWidgetItem(device_name)
                 item.setData(Qt.UserRole, len(self.available_devices) - 1)  # 기기 인덱스 저장
                 self.device_list.addItem(item)
+                if (device_info['bus'], device_info['address']) == selected_location:
+                    self.device_list.setCurrentItem(item)
             
             if not self.available_devices:
                 item = QListWidgetItem("No FM Radio devices found")
@@ -196,8 +234,18 @@ class DeviceSelectionDialog(QDialog):
         
         if 0 <= device_index < len(self.available_devices):
             device = self.available_devices[device_index]
+            device_info = self.available_infos[device_index]
             self.connect_btn.setEnabled(True)
             
+            # 문자열 디스크립터는 백그라운드에서 읽는 중이면 다 읽은 뒤 다시 표시
+            if not device_info.is_loaded():
+                device_info.add_done_callback(lambda _: self.descriptors_loaded.emit())
+                serial = manufacturer = product = 'Loading...'
+            else:
+                serial = device_info.peek('serial_number') or 'N/A'
+                manufacturer = device_info.peek('manufacturer')
+                product = device_info.peek('product')
+            
             # 상세 정보 표시
             info = f"""Device Information:
 Vendor ID: 0x{device.idVendor:04x}
@@ -206,9 +254,9 @@ Bus: {device.bus}
 Address: {device.address}
 USB Version: {device.bcdUSB}
 Device Class: {device.bDeviceClass}
-Serial Number: {device.serial_number if device.serial_number else 'N/A'}
-Manufacturer: {device.manufacturer if device.manufacturer else 'Samsung'}
-Product: {device.product if device.product else 'FM Radio'}"""
+Serial Number: {serial}
+Manufacturer: {manufacturer}
+Product: {product}"""
             
             self.device_info.setPlainText(info)
         else:
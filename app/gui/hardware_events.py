@@ -0,0 +1,66 @@
+"""
+BesFM 알림 이벤트를 Qt 이벤트 루프로 전달하는 노티파이어
+"""
+from PySide6.QtCore import QObject, Signal
+
+from hardware.event_dispatcher import (BesFMEventDispatcher, EVENT_SEEK, EVENT_TUNE,
+                                       EVENT_RDS, EVENT_RSSI)
+
+
+class FMEventNotifier(QObject):
+    """
+    알림 엔드포인트 이벤트를 종류별 Qt 시그널로 변환
+
+    디스패처 스레드가 인터럽트 엔드포인트에서 블로킹으로 기다리다가 데이터가
+    도착했을 때만 시그널을 보내므로(queued connection), GUI 스레드는 타이머 없이
+    실제 이벤트가 있을 때만 깨어난다. 신호 강도는 값이 바뀐 경우에만 전달한다.
+    기기가 알림을 보내지 않으면 디스패처가 FALLBACK_POLL_INTERVAL마다 상태를 직접 조회해
+    신호 강도 / RDS를 전달한다.
+    """
+
+    seek_completed = Signal(object)  # get_status() seek 결과 dict
+    tune_completed = Signal(object)  # get_status() tune 결과 dict
+    rds_received = Signal(object)    # 바이트 순서를 정리한 RDS 데이터 (bytes)
+    rssi_changed = Signal(int)       # 신호 강도
+
+    # 알림 대기 타임아웃 (ms) - 길수록 유휴 시 깨어나는 횟수가 적음 (중지 응답 시간과 절충)
+    WAIT_TIMEOUT = 2000
+
+    def __init__(self, fm, worker=None, parent=None):
+        super().__init__(parent)
+        self.dispatcher = BesFMEventDispatcher(fm, worker, wait_timeout=self.WAIT_TIMEOUT)
+        self._last_rssi = None
+        self.dispatcher.subscribe(EVENT_SEEK, self._on_seek)
+        self.dispatcher.subscribe(EVENT_TUNE, self._on_tune)
+        self.dispatcher.subscribe(EVENT_RDS, self._on_rds)
+        self.dispatcher.subscribe(EVENT_RSSI, self._on_rssi)
+
+    def start(self):
+        """알림 수신 시작 (알림 엔드포인트가 없으면 False)"""
+        return self.dispatcher.start()
+
+    def stop(self):
+        """알림 수신 중지"""
+        self.dispatcher.stop(timeout=self.WAIT_TIMEOUT / 1000 + 0.5)
+
+    def is_running(self):
+        """알림 수신 여부"""
+        return self.dispatcher.is_running()
+
+    # 아래 콜백은 디스패처 스레드에서 호출됨 - 시그널만 보냄
+    def _on_seek(self, event):
+        self.seek_completed.emit(event.data)
+
+    def _on_tune(self, event):
+        self.tune_completed.emit(event.data)
+
+    def _on_rds(self, event):
+        data = event.data.get('data', b'')
+        if data:
+            self.rds_received.emit(data)
+
+    def _on_rssi(self, event):
+        strength = event.data['strength']
+        if strength != self._last_rssi:
+            self._last_rssi = strength
+            self.rssi_changed.emit(strength)
@@ -1,14 +1,27 @@
 """
 메인 라디오 애플리케이션 윈도우
 """
+import os
 import sys
+import time
 import besfm
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QSlider, QPushButton, QGroupBox, QScrollArea,
                                QFrame, QMessageBox, QDialog, QApplication)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, Signal
 
 from audio_manager import AudioManager
+from hardware.io_worker import PRIORITY_POLL, PRIORITY_TUNE, PRIORITY_USER
+from hardware.write_coalescer import WriteCoalescer
+from hardware.metrics import METRICS_ENV
+from hardware.hotplug import stop_hotplug_watcher
+from hardware.device_info import DeviceInfo
+from hardware.session_pool import SessionPool
+from hardware.io_server import io_process_enabled
+from hardware.reconnect import RECONNECT_LOST, RECONNECT_RESTORED
+from hardware.log import get_logger
+from hardware.calibration import SeekCalibration
+from gui.hardware_events import FMEventNotifier
 from gui.dialogs import DeviceSelectionDialog
 from gui.widgets import FrequencyDisplayWidget, SignalStrengthWidget, PresetButtonsWidget
 from gui.styles.stylesheets import get_main_stylesheet
@@ -16,6 +29,24 @@ from utils.settings_manager import SettingsManager
 from utils.language_manager import LanguageManager
 
 
+_log = get_logger('gui')
+
+# 기기 변경 / 종료 시 전원 끄기 시퀀스를 기다리는 최대 시간 (초)
+_RELEASE_TIMEOUT = 3.0
+
+
+class HardwareBridge(QObject):
+    """I/O 워커 스레드의 결과를 GUI 스레드로 전달하는 시그널 브리지"""
+    status_ready = Signal(object)
+    channel_ready = Signal(float)
+    session_ready = Signal(object)
+    reconnect_event = Signal(str, object)
+    calibration_ready = Signal(object)
+    command_done = Signal(object, object)  # (on_done 콜백, Future) - run_hardware() 완료
+    snapshot_ready = Signal(object)
+    scan_done = Signal(object)
+
+
 class ModernRadioApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -34,12 +65,44 @@ class ModernRadioApp(QWidget):
         
         # 하드웨어 초기화
         self.fm = None
+        self.io_worker = None
+        self.write_coalescer = None
+        self.event_notifier = None
+        self.event_dispatcher = None
         self.selected_device = None
         self.audio_manager = None
         
+        # 기기 세션 풀 - 기기 변경 시 새 기기를 백그라운드에서 준비, 최근 기기는 열어 둠
+        # (섀도 레지스터 캐시로 반복 GET 왕복 제거)
+        # BESFM_IO_PROCESS가 설정되어 있으면 USB 전송은 별도 I/O 서버 프로세스에서 처리
+        self.session_pool = SessionPool(use_cache=True,
+                                        metrics=bool(os.environ.get(METRICS_ENV)),
+                                        out_of_process=io_process_enabled())
+        
+        # 워커 결과를 GUI 스레드에서 받기 위한 브리지
+        self.hw_bridge = HardwareBridge()
+        self.hw_bridge.status_ready.connect(self.on_status_polled)
+        self.hw_bridge.channel_ready.connect(self.on_channel_verified)
+        self.hw_bridge.session_ready.connect(self.on_session_ready)
+        self.hw_bridge.reconnect_event.connect(self.on_reconnect_event)
+        self.hw_bridge.calibration_ready.connect(self.on_calibration_ready)
+        self.hw_bridge.command_done.connect(self.on_command_done)
+        self.hw_bridge.snapshot_ready.connect(self.on_snapshot_ready)
+        self.hw_bridge.scan_done.connect(self.on_scan_done)
+        self._status_future = None
+        self._snapshot_future = None
+        self._scan_future = None
+        self._hw_snapshot = None
+        self._server_state = None
+        
         # 프리셋 및 스테이션 데이터
         self.presets = [None] * 6
         
+        # 기기별 설정 (학습된 명령 간격, 위치별 시크 임계값 보정 등)
+        self.device_settings = {}
+        self.location = 'default'
+        self._calibration_future = None
+        
         # 스캔 관련
         self.scan_progress = None
         
@@ -48,6 +111,9 @@ class ModernRadioApp(QWidget):
         self.rds_timer.timeout.connect(self.check_rds_data)
         self.signal_timer = QTimer()
         self.signal_timer.timeout.connect(self.update_signal_strength)
+        # I/O 서버 프로세스 모드에서 공유 메모리 상태 블록 확인 (시스템 호출 없음)
+        self.state_block_timer = QTimer()
+        self.state_block_timer.timeout.connect(self.check_state_block)
         
         # 설정 로드
         self.load_settings()
@@ -62,8 +128,8 @@ class ModernRadioApp(QWidget):
         # 하드웨어가 있으면 초기 상태 업데이트
         if self.fm is not None:
             self.update_from_hardware()
-            # 정기적 업데이트 시작
-            self.signal_timer.start(2000)  # 2초마다 신호 강도 업데이트
+            # 알림 수신이 안 되는 경우에만 정기적 폴링
+            self.start_signal_polling()
     
     def show_device_selection(self):
         """기기 선택 다이얼로그 표시"""
@@ -83,47 +149,13 @@ class ModernRadioApp(QWidget):
     def init_hardware(self):
         """하드웨어 초기화"""
         try:
-            print(f"Initializing hardware with device: {self.selected_device}")
-            self.fm = besfm.BesFM(self.selected_device)
-            
-            # 연결 상태 확인
-            if not self.fm.is_connected():
-                raise Exception("Device not responding")
-                
-            print("Hardware connected successfully!")
-            
-            # 오디오 매니저 초기화
-            try:
-                self.audio_manager = AudioManager(self.fm)
-                print("Audio manager initialized")
-            except Exception as e:
-                print(f"Audio manager initialization failed: {e}")
-                self.audio_manager = None
-            
-            # 하드웨어 초기 상태 가져오기
-            try:
-                self.is_powered = self.fm.get_power()
-                self.is_recording = self.fm.get_recording()
-                
-                if self.is_powered or self.is_recording:
-                    # 하드웨어에서 현재 값들 읽어오기
-                    channel = self.fm.get_channel()
-                    self.current_freq = channel
-                    self.volume = self.fm.get_volume()
-                    self.is_muted = self.fm.get_mute()
-                    print(f"Hardware state: freq={self.current_freq:.1f}MHz, vol={self.volume}, muted={self.is_muted}")
-                else:
-                    print("Hardware is powered off")
-                    
-            except Exception as e:
-                print(f"Warning: Could not read initial hardware state: {e}")
-                # 기본값 사용
-                self.current_freq = 88.5
-                self.volume = 8
-                self.is_muted = False
-            
+            _log.info("Initializing hardware with device: %s", self.selected_device)
+            # 기기 열기 / 응답 확인 / 이전 세션 설정(명령 간격, 대역, 간격, 볼륨, 시크 임계값) 적용은 세션 풀에서
+            session = self.session_pool.open(self.selected_device, self.device_state)
+            self.attach_session(session)
+            _log.info("Hardware connected successfully!")
         except PermissionError as e:
-            print(f"Permission error: {e}")
+            _log.error("Permission error: %s", e)
             error_msg = f"USB Device Access Permission Denied\\n\\n{str(e)}\\n\\n"
             error_msg += "Try running the application with:\\n"
             error_msg += "sudo python3 ic100_radio_gui.py\\n\\n"
@@ -131,7 +163,7 @@ class ModernRadioApp(QWidget):
             QMessageBox.critical(self, "Permission Error", error_msg)
             sys.exit(1)
         except Exception as e:
-            print(f"Hardware initialization failed: {e}")
+            _log.error("Hardware initialization failed: %s", e)
             error_msg = f"Failed to initialize hardware:\\n{str(e)}\\n\\n"
             error_msg += "Please check:\\n"
             error_msg += "1. USB device is properly connected\\n"
@@ -140,6 +172,76 @@ class ModernRadioApp(QWidget):
             QMessageBox.critical(self, "Hardware Error", error_msg)
             sys.exit(1)
     
+    def attach_session(self, session):
+        """준비된 기기 세션을 현재 기기로 연결"""
+        self.session_pool.activate(session)
+        
+        # 모든 USB 전송은 세션 전용 I/O 워커 스레드에서 직렬화
+        self.io_worker = session.worker
+        self.fm = session.proxy
+        # 케이블 순간 단선 등으로 기기가 다시 연결되면 상태 표시 갱신
+        if session.supervisor is not None:
+            session.supervisor.subscribe(self._on_reconnect_callback)
+        
+        if session.fm is None:
+            # I/O 서버 프로세스가 알림 이벤트를 받아 상태 블록에 게시
+            self._server_state = self.io_worker.state()
+            self.state_block_timer.start(100)
+            # 슬라이더 드래그 / 연속 주파수 클릭은 최신 값만 전송 (주파수는 튜닝 완료 상태로 확정)
+            self.write_coalescer = WriteCoalescer(self.io_worker, tune=True)
+            self.attach_audio_manager(session)
+            return
+        
+        # 알림 엔드포인트 기반 이벤트 수신 (RDS / 시크 / 튠 / RSSI)
+        self.event_notifier = FMEventNotifier(session.fm, self.io_worker, self)
+        self.event_notifier.seek_completed.connect(self.on_tune_completed)
+        self.event_notifier.tune_completed.connect(self.on_tune_completed)
+        self.event_notifier.rds_received.connect(self.on_rds_received)
+        self.event_notifier.rssi_changed.connect(self.on_rssi_changed)
+        if self.event_notifier.start():
+            self.event_dispatcher = self.event_notifier.dispatcher
+        else:
+            _log.warning("Notify endpoint unavailable, falling back to timer polling")
+            self.event_notifier.deleteLater()
+            self.event_notifier = None
+        # 슬라이더 드래그 / 연속 주파수 클릭은 최신 값만 전송
+        # (알림이 없으면 주파수 쓰기가 튜닝 완료 상태를 직접 기다림)
+        self.write_coalescer = WriteCoalescer(self.io_worker, tune=self.event_dispatcher is None)
+        self.attach_audio_manager(session)
+    
+    def attach_audio_manager(self, session):
+        """오디오 매니저 초기화 및 세션 스냅샷으로 상태 설정"""
+        # 오디오 매니저 초기화
+        try:
+            # 시퀀스는 모두 run_hardware()로 워커에서 실행하므로 페이드도 같은 작업 안에서
+            self.audio_manager = AudioManager(self.fm, inline_fade=True)
+            _log.info("Audio manager initialized")
+        except Exception as e:
+            _log.warning("Audio manager initialization failed: %s", e)
+            self.audio_manager = None
+        
+        # 하드웨어 초기 상태 (세션을 준비할 때 읽은 스냅샷)
+        snapshot = session.snapshot
+        if snapshot is None:
+            _log.warning("Could not read initial hardware state")
+            # 기본값 사용
+            self.is_powered = False
+            self.is_recording = False
+            self.current_freq = 88.5
+            self.volume = 8
+            self.is_muted = False
+            return
+        self.is_powered = snapshot.power
+        self.is_recording = snapshot.recording
+        if self.is_powered or self.is_recording:
+            # 하드웨어에서 현재 값들 읽어오기
+            self.current_freq = snapshot.channel
+            self.volume = snapshot.volume
+            self.is_muted = snapshot.mute
+            _log.info("Hardware state: freq=%.1fMHz, vol=%d, muted=%s", self.current_freq, self.volume, self.is_muted)
+        else:
+            _log.info("Hardware is powered off")
+    
     def setup_animations(self):
         """애니메이션 설정"""
         # 레코딩 애니메이션을 위한 타이머
@@ -399,22 +501,111 @@ class ModernRadioApp(QWidget):
         self.language_manager.set_language(language)
         
         self.rds_enabled = settings.get('rds_enabled', False)
+        self.device_settings = settings.get('device_settings') or {}
+        self.location = settings.get('location') or 'default'
+    
+    def save_settings(self, wait=False):
+        """
+        설정 저장 - 현재 기기 설정은 워커에서 읽은 뒤 반영해 다시 저장 (wait면 기다렸다가 한 번에)
+        """
+        if wait:
+            self.store_device_settings(wait=True)
+        else:
+            self.store_device_settings(on_stored=self.write_settings)
+        self.write_settings()
     
-    def save_settings(self):
-        """설정 저장"""
+    def write_settings(self):
+        """현재 설정을 파일에 기록"""
         settings = {
             'presets': self.presets,
             'last_frequency': self.current_freq,
             'last_volume': self.volume,
             'language': self.language_manager.get_current_language(),
             'rds_enabled': self.rds_enabled,
+            'device_settings': self.device_settings,
+            'location': self.location,
         }
         self.settings_manager.save_settings(settings)
     
+    def device_settings_key(self, device=None, wait=False):
+        """
+        기기별 설정 키 (시리얼 번호, 없으면 VID:PID)
+
+        wait가 False면 문자열 디스크립터를 기다리지 않는다 (아직 못 읽었으면 None - GUI 스레드용).
+        """
+        if device is None:
+            device = self.selected_device
+        if device is None:
+            return None
+        # 기기당 한 번만 읽어 둔 문자열 디스크립터 사용
+        info = DeviceInfo(device)
+        if not wait and not info.is_loaded():
+            return None
+        serial = info['serial_number']
+        return serial or f"{device.idVendor:04x}:{device.idProduct:04x}"
+    
+    def device_state(self, device=None):
+        """
+        세션을 열 때 적용할 기기별 설정 (현재 위치의 시크 임계값 보정 값 포함)
+
+        시리얼 번호를 기다리므로 세션 풀에 함수로 넘겨 세션 열기 스레드에서 호출되게 한다.
+        """
+        state = dict(self.device_settings.get(self.device_settings_key(device, wait=True)) or {})
+        calibration = (state.pop('seek_calibration', None) or {}).get(self.location)
+        if calibration:
+            state.update(SeekCalibration.from_dict(calibration).thresholds())
+        return state
+    
+    def seek_calibration(self):
+        """현재 기기 / 위치의 시크 보정 결과 (없거나 기기 키를 아직 모르면 None)"""
+        entry = self.device_settings.get(self.device_settings_key()) or {}
+        calibration = (entry.get('seek_calibration') or {}).get(self.location)
+        return SeekCalibration.from_dict(calibration) if calibration else None
+    
+    def store_device_settings(self, wait=False, on_stored=None):
+        """
+        현재 기기의 학습된 명령 간격 / 대역 / 채널 간격 / 볼륨을 기기별 설정에 반영
+
+        값은 워커에서 읽고 GUI 스레드에서 반영한 뒤 on_stored()를 호출한다.
+        wait가 True면 (종료 시) 읽기를 기다렸다가 바로 반영한다.
+        """
+        key = self.device_settings_key()
+        if self.fm is None or key is None or self.io_worker is None:
+            return
+        fm, volume = self.fm, self.volume
+        
+        def read():
+            # 대역 / 간격은 GUI에서 바꾸지 않으므로 캐시된 값으로 충분
+            snapshot = fm.get_snapshot(fields=('band', 'spacing'), fresh=False)
+            return {'pacing': fm.get_pacing_profile(), 'band': snapshot.band,
+                    'spacing': snapshot.spacing, 'volume': volume}
+        
+        def done(future):
+            try:
+                data = future.result()
+            except Exception as e:
+                _log.warning("Could not store device settings: %s", e)
+                return
+            settings = {'device_settings': self.device_settings}
+            self.settings_manager.merge_device_settings(settings, key, data)
+            self.device_settings = settings['device_settings']
+            if on_stored is not None:
+                on_stored()
+        
+        if not wait:
+            self.run_hardware(read, on_done=done)
+            return
+        future = self.io_worker.submit(PRIORITY_USER, read)
+        try:
+            future.result(_RELEASE_TIMEOUT)
+        except Exception:
+            pass
+        done(future)
+    
     def change_frequency(self, step):
         """주파수 변경"""
         if not self.is_powered:
-            print("Hardware not powered, cannot change frequency")
+            _log.info("Hardware not powered, cannot change frequency")
             return
         
         new_freq = self.current_freq + step
@@ -439,43 +630,188 @@ class ModernRadioApp(QWidget):
         if self.fm is None:
             return
         
-        try:
-            self.fm.set_channel(frequency)
-            # 실제 설정된 주파수 확인
-            actual_freq = self.fm.get_channel()
-            if abs(actual_freq - frequency) > 0.01:
-                self.current_freq = actual_freq
-                self.freq_display.update_frequency(actual_freq)
-        except Exception as e:
-            print(f"Hardware frequency change failed: {e}")
+        if self.write_coalescer is None:
+            self.tune_hardware(frequency)
+            return
+        
+        # 연속 클릭은 마지막 주파수로 병합되고, 튜닝 완료 상태로 확정 (확인 읽기 없음)
+        future = self.write_coalescer.set_channel(frequency)
+        future.add_done_callback(self._on_channel_written)
+    
+    def tune_hardware(self, frequency):
+        """
+        주파수 설정 후 튜닝 완료 상태의 실제 주파수를 channel_ready로 UI에 반영 (GUI 스레드를 막지 않음)
+
+        Returns:
+            concurrent.futures.Future: 튜닝 결과
+        """
+        if self.event_dispatcher is not None:
+            # 알림을 디스패처가 받고 있으므로 튜닝 완료 알림으로 확정
+            future = self.event_dispatcher.tune(frequency)
+        else:
+            future = self.io_worker.submit(PRIORITY_TUNE, 'tune', frequency)
+        future.add_done_callback(self._on_tuned)
+        return future
+    
+    def _on_tuned(self, future):
+        """워커 / 타이머 스레드에서 호출 - 튜닝 결과를 GUI 스레드로 전달"""
+        worker = self.io_worker
+        if not future.cancelled() and isinstance(future.exception(), TimeoutError) and worker is not None:
+            # 주파수는 이미 전송했으므로 표시를 되돌리지 않고 실제 주파수를 한 번 읽어 확정
+            _log.info("Tune status not received, reading channel instead")
+            worker.submit(PRIORITY_TUNE, 'get_channel').add_done_callback(self._on_channel_read)
+            return
+        self._on_channel_written(future)
+    
+    def _on_channel_read(self, future):
+        """워커 스레드에서 호출 - 읽은 주파수를 GUI 스레드로 전달"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            _log.warning("Channel read failed: %s", future.exception())
+            return
+        self.hw_bridge.channel_ready.emit(future.result())
+    
+    def _on_channel_written(self, future):
+        """워커 스레드에서 호출 - 튜닝 상태가 있으면 GUI 스레드로 전달"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            _log.warning("Hardware frequency change failed: %s", future.exception())
+            return
+        status = future.result()
+        # 알림 디스패처가 있으면 튜닝 완료 알림이 on_tune_completed로 전달됨
+        if isinstance(status, dict):
+            self.hw_bridge.channel_ready.emit(status['freq'])
+    
+    def on_channel_verified(self, actual_freq):
+        """확인된 실제 주파수를 UI에 반영"""
+        if self.write_coalescer is not None and self.write_coalescer.has_pending('SET_CHANNEL'):
+            return
+        if abs(actual_freq - self.current_freq) > 0.01:
+            self.current_freq = actual_freq
+            self.freq_display.update_frequency(actual_freq)
     
     def update_from_hardware(self):
-        """하드웨어에서 현재 상태 읽어와서 UI 업데이트"""
-        if self.fm is None:
+        """하드웨어에서 현재 상태 읽기 요청 (워커에서 읽고 on_snapshot_ready에서 UI 업데이트)"""
+        if self.io_worker is None:
+            return
+        # 이전 요청이 아직 처리 중이면 중복 요청하지 않음
+        if self._snapshot_future is not None and not self._snapshot_future.done():
+            return
+        # 한 번의 배치로 읽고 이전 스냅샷 대비 바뀐 필드만 처리
+        self._snapshot_future = self.io_worker.submit(
+            PRIORITY_POLL, 'get_snapshot', fields=('channel', 'volume', 'mute'),
+            previous=self._hw_snapshot
+        )
+        self._snapshot_future.add_done_callback(self.hw_bridge.snapshot_ready.emit)
+    
+    def on_snapshot_ready(self, future):
+        """상태 스냅샷을 UI에 반영 (GUI 스레드)"""
+        if future is not self._snapshot_future:
             return
-        
         try:
+            snapshot = future.result()
+            self._hw_snapshot = snapshot
+            
             # 주파수 업데이트
-            channel = self.fm.get_channel()
-            if abs(channel - self.current_freq) > 0.01:
+            channel = snapshot.channel
+            if snapshot.is_changed('channel') and abs(channel - self.current_freq) > 0.01:
                 self.current_freq = channel
                 self.freq_display.update_frequency(self.current_freq)
             
             # 볼륨 업데이트
-            volume = self.fm.get_volume()
-            if volume != self.volume:
+            volume = snapshot.volume
+            if snapshot.is_changed('volume') and volume != self.volume:
                 self.volume = volume
                 self.vol_value.setText(str(self.volume))
                 self.volume_slider.setValue(self.volume)
             
             # 뮤트 상태 업데이트
-            muted = self.fm.get_mute()
-            if muted != self.is_muted:
+            muted = snapshot.mute
+            if snapshot.is_changed('mute') and muted != self.is_muted:
                 self.is_muted = muted
                 self.update_mute_state()
             
         except Exception as e:
-            print(f"Hardware state update failed: {e}")
+            _log.warning("Hardware state update failed: %s", e)
+    
+    def run_hardware(self, func, *args, on_done=None):
+        """
+        하드웨어 명령 / 시퀀스를 I/O 워커에서 실행하고 바로 반환 (GUI 스레드는 기다리지 않음)
+
+        워커 스레드에서는 self.fm 호출이 큐를 거치지 않고 바로 실행되므로 여러 명령으로 된
+        시퀀스도 다른 명령이 끼어들지 않고 한 번에 처리된다. 완료되면 on_done(future)을 GUI
+        스레드에서 호출한다 (없으면 실패만 기록).
+
+        결과를 기다리는 경로는 기기 변경 / 종료 시의 release_current_device() (세션을 넘기기 전에
+        전원 끄기 완료 확인)와 종료 시의 설정 저장뿐이다.
+        """
+        if self.io_worker is None:
+            return None
+        future = self.io_worker.submit(PRIORITY_USER, func, *args)
+        future.add_done_callback(lambda f: self.hw_bridge.command_done.emit(on_done, f))
+        return future
+    
+    def on_command_done(self, callback, future):
+        """run_hardware() 완료 (GUI 스레드)"""
+        if callback is not None:
+            callback(future)
+        elif future.exception() is not None:
+            _log.warning("Hardware command failed: %s", future.exception())
+    
+    def _write_volume(self, value):
+        """워커에서 실행 - 오디오 매니저를 통한 부드러운 볼륨 변경 (실패하면 직접 설정)"""
+        audio_manager = self.audio_manager
+        if audio_manager:
+            if audio_manager.set_volume_smooth(value):
+                return
+            _log.warning("Failed to set volume smoothly, trying direct method")
+        self.fm.set_volume(value)
+    
+    def _write_mute(self, muted):
+        """워커에서 실행 - 부드러운 뮤트 / 언뮤트 (실패하면 직접 설정)"""
+        audio_manager = self.audio_manager
+        if not audio_manager or not audio_manager.soft_mute(muted):
+            self.fm.set_mute(muted)
+    
+    def _write_reset(self, freq, volume):
+        """워커에서 실행 - 현재 주파수 / 볼륨 설정, 뮤트 해제"""
+        self.fm.set_channel(freq)
+        self.fm.set_volume(volume)
+        self.fm.set_mute(False)
+    
+    def _write_power(self, on, freq, volume):
+        """워커에서 실행 - 파워 온 / 오프 시퀀스 (오디오 매니저가 실패하면 기존 방식)"""
+        audio_manager = self.audio_manager
+        if not on:
+            if not audio_manager or not audio_manager.power_off_sequence():
+                self.fm.set_power(False)
+            return
+        if audio_manager and audio_manager.power_on_sequence():
+            return
+        self.fm.set_power(True)
+        time.sleep(0.2)
+        self.fm.set_volume(6)
+        self._write_reset(freq, volume)
+    
+    def _write_recording(self, on, freq, volume):
+        """워커에서 실행 - 레코딩 시작 / 중지 시퀀스 (오디오 매니저가 실패하면 기존 방식)"""
+        audio_manager = self.audio_manager
+        if audio_manager:
+            if on:
+                success = audio_manager.recording_start_sequence()
+            else:
+                success = audio_manager.recording_stop_sequence()
+            if success:
+                return
+        if not on:
+            self.fm.set_recording(False)
+            return
+        self.fm.set_recording(True)
+        time.sleep(0.2)
+        self.fm.set_volume(15)
+        self._write_reset(freq, volume)
     
     def on_volume_changed(self, value):
         """볼륨 슬라이더 변경"""
@@ -485,192 +821,126 @@ class ModernRadioApp(QWidget):
         self.volume = value
         self.vol_value.setText(str(value))
         
-        # 오디오 매니저를 통한 부드러운 볼륨 변경
-        if self.audio_manager:
-            success = self.audio_manager.set_volume_smooth(value)
-            if not success:
-                print("Failed to set volume smoothly, trying direct method")
-                try:
-                    self.fm.set_volume(value)
-                except Exception as e:
-                    print(f"Hardware volume change failed: {e}")
+        # 슬라이더 드래그 중에는 페이드 없이 최신 값만 병합 전송
+        if self.write_coalescer is not None and self.volume_slider.isSliderDown():
+            self.write_coalescer.set_volume(value)
         else:
-            # 기존 방식 (오디오 매니저 없을 때)
-            try:
-                self.fm.set_volume(value)
-            except Exception as e:
-                print(f"Hardware volume change failed: {e}")
+            # 오디오 매니저를 통한 부드러운 볼륨 변경 (워커에서)
+            self.run_hardware(self._write_volume, value, on_done=self._on_volume_written)
         
         # 뮤트 상태이면 자동으로 해제
         if self.is_muted and value > 0:
             self.is_muted = False
             self.update_mute_state()
-            if self.audio_manager:
-                self.audio_manager.soft_mute(False)
-            else:
-                try:
-                    self.fm.set_mute(False)
-                except Exception as e:
-                    print(f"Hardware unmute failed: {e}")
+            self.run_hardware(self._write_mute, False, on_done=self._on_unmute_written)
+    
+    def _on_volume_written(self, future):
+        if future.exception() is not None:
+            _log.warning("Hardware volume change failed: %s", future.exception())
+    
+    def _on_unmute_written(self, future):
+        if future.exception() is not None:
+            _log.warning("Hardware unmute failed: %s", future.exception())
     
     def toggle_power(self):
-        """파워 토글"""
+        """파워 토글 - 화면은 바로 바꾸고 시퀀스는 워커에서 (실패하면 완료 시 이전 상태로 복원)"""
         if self.fm is None:
-            print("Hardware not initialized")
+            _log.info("Hardware not initialized")
             return
             
         old_powered = self.is_powered
+        old_recording = self.is_recording
         
-        try:
-            if self.is_powered:
-                # 파워 오프 (오디오 매니저 사용)
-                print("Turning power OFF")
-                self.is_powered = False
-                if self.audio_manager:
-                    success = self.audio_manager.power_off_sequence()
-                    if not success:
-                        # 기존 방식으로 fallback
-                        self.fm.set_power(False)
-                else:
-                    # 기존 방식
-                    self.fm.set_power(False)
-                    
-            elif self.is_recording:
-                # 레코딩 중이면 레코딩 중지
-                print("Stopping recording")
-                self.is_recording = False
-                if self.audio_manager:
-                    success = self.audio_manager.recording_stop_sequence()
-                    if not success:
-                        self.fm.set_recording(False)
-                else:
-                    self.fm.set_recording(False)
-            else:
-                # 파워 온 (오디오 매니저 사용)
-                print("Turning power ON")
-                self.is_powered = True
-                if self.audio_manager:
-                    success = self.audio_manager.power_on_sequence()
-                    if not success:
-                        # 기존 방식으로 fallback
-                        self.fm.set_power(True)
-                        import time
-                        time.sleep(0.2)
-                        self.fm.set_volume(6)
-                        self.reset_hardware()
-                else:
-                    # 기존 방식
-                    self.fm.set_power(True)
-                    import time
-                    time.sleep(0.2)
-                    self.fm.set_volume(6)
-                    self.reset_hardware()
-            
-            print(f"Power state changed: powered={self.is_powered}, recording={self.is_recording}")
-            self.update_power_state()
-            
-            # 파워 오프 시 레코딩 중지
-            if not self.is_powered and self.is_recording:
-                self.toggle_record()
-                
-        except Exception as e:
-            print(f"Power toggle failed: {e}")
-            # 실패 시 이전 상태로 복원
-            self.is_powered = old_powered
-            self.update_power_state()
+        if self.is_powered:
+            # 파워 오프 (오디오 매니저 사용)
+            _log.info("Turning power OFF")
+            self.is_powered = False
+            self.run_hardware(self._write_power, False, self.current_freq, self.volume,
+                              on_done=lambda f: self._on_power_written(f, old_powered, old_recording))
+        elif self.is_recording:
+            # 레코딩 중이면 레코딩 중지
+            _log.info("Stopping recording")
+            self.is_recording = False
+            self.run_hardware(self._write_recording, False, self.current_freq, self.volume,
+                              on_done=lambda f: self._on_power_written(f, old_powered, old_recording))
+        else:
+            # 파워 온 (오디오 매니저 사용)
+            _log.info("Turning power ON")
+            self.is_powered = True
+            self.is_muted = False
+            self.update_mute_state()
+            self.run_hardware(self._write_power, True, self.current_freq, self.volume,
+                              on_done=lambda f: self._on_power_written(f, old_powered, old_recording))
+        
+        _log.info("Power state changed: powered=%s, recording=%s", self.is_powered, self.is_recording)
+        self.update_power_state()
+        self.update_record_state()
+        
+        # 파워 오프 시 레코딩 중지
+        if not self.is_powered and self.is_recording:
+            self.toggle_record()
+    
+    def _on_power_written(self, future, old_powered, old_recording):
+        if future.exception() is None:
+            return
+        _log.warning("Power toggle failed: %s", future.exception())
+        # 실패 시 이전 상태로 복원
+        self.is_powered = old_powered
+        self.is_recording = old_recording
+        self.update_power_state()
+        self.update_record_state()
     
     def reset_hardware(self):
-        """하드웨어 리셋"""
+        """하드웨어 리셋 (워커에서 실행)"""
         if self.fm is None:
             return
-            
-        try:
-            # 현재 주파수 설정
-            self.fm.set_channel(self.current_freq)
-            
-            # 볼륨 업데이트
-            self.fm.set_volume(self.volume)
-            
-            # 뮤트 해제
-            self.is_muted = False
-            self.fm.set_mute(False)
-            self.update_mute_state()
-            
-        except Exception as e:
-            print(f"Hardware reset failed: {e}")
+        self.is_muted = False
+        self.update_mute_state()
+        self.run_hardware(self._write_reset, self.current_freq, self.volume,
+                          on_done=self._on_reset_written)
+    
+    def _on_reset_written(self, future):
+        if future.exception() is not None:
+            _log.warning("Hardware reset failed: %s", future.exception())
     
     def toggle_mute(self):
-        """뮤트 토글"""
+        """뮤트 토글 - 화면은 바로 바꾸고 실패하면 완료 시 복원"""
         if not self.is_powered:
             return
         
         old_muted = self.is_muted
         self.is_muted = not self.is_muted
         
-        # 오디오 매니저를 통한 부드러운 뮤트/언뮤트
-        if self.audio_manager:
-            success = self.audio_manager.soft_mute(self.is_muted)
-            if not success:
-                # 기존 방식으로 fallback
-                try:
-                    self.fm.set_mute(self.is_muted)
-                except Exception as e:
-                    print(f"Hardware mute toggle failed: {e}")
-                    self.is_muted = old_muted
-        else:
-            # 기존 방식
-            try:
-                self.fm.set_mute(self.is_muted)
-            except Exception as e:
-                print(f"Hardware mute toggle failed: {e}")
-                self.is_muted = old_muted
-        
+        # 오디오 매니저를 통한 부드러운 뮤트/언뮤트 (워커에서)
+        self.run_hardware(self._write_mute, self.is_muted,
+                          on_done=lambda f: self._on_mute_written(f, old_muted))
+        self.update_mute_state()
+    
+    def _on_mute_written(self, future, old_muted):
+        if future.exception() is None:
+            return
+        _log.warning("Hardware mute toggle failed: %s", future.exception())
+        self.is_muted = old_muted
         self.update_mute_state()
     
     def toggle_record(self):
-        """레코드 토글"""
+        """레코드 토글 - 화면은 바로 바꾸고 실패하면 완료 시 복원"""
         if not self.is_powered:
             return
         
         old_recording = self.is_recording
         self.is_recording = not self.is_recording
         
-        # 오디오 매니저를 통한 부드러운 레코딩 시작/중지
-        if self.audio_manager:
-            if self.is_recording:
-                success = self.audio_manager.recording_start_sequence()
-            else:
-                success = self.audio_manager.recording_stop_sequence()
-            
-            if not success:
-                # 기존 방식으로 fallback
-                try:
-                    if self.is_recording:
-                        self.fm.set_recording(True)
-                        import time
-                        time.sleep(0.2)
-                        self.fm.set_volume(15)
-                        self.reset_hardware()
-                    else:
-                        self.fm.set_recording(False)
-                except Exception as e:
-                    print(f"Hardware recording toggle failed: {e}")
-                    self.is_recording = old_recording
-        else:
-            # 기존 방식
-            try:
-                if self.is_recording:
-                    self.fm.set_recording(True)
-                    import time
-                    time.sleep(0.2)
-                    self.fm.set_volume(15)
-                    self.reset_hardware()
-                else:
-                    self.fm.set_recording(False)
-            except Exception as e:
-                print(f"Hardware recording toggle failed: {e}")
-                self.is_recording = old_recording
-        
+        # 오디오 매니저를 통한 부드러운 레코딩 시작/중지 (워커에서)
+        self.run_hardware(self._write_recording, self.is_recording, self.current_freq, self.volume,
+                          on_done=lambda f: self._on_record_written(f, old_recording))
+        self.update_record_state()
+    
+    def _on_record_written(self, future, old_recording):
+        if future.exception() is None:
+            return
+        _log.warning("Hardware recording toggle failed: %s", future.exception())
+        self.is_recording = old_recording
         self.update_record_state()
     
     def update_power_state(self):
@@ -732,55 +1002,116 @@ class ModernRadioApp(QWidget):
                 self.record_btn.setStyleSheet(current_style + "background-color: #7f1d1d;")
     
     def change_device(self):
-        """기기 변경"""
-        # 현재 연결 해제
-        if self.fm is not None:
-            try:
-                if self.is_powered:
-                    if self.audio_manager:
-                        self.audio_manager.power_off_sequence()
-                    else:
-                        self.fm.set_power(False)
-                if self.is_recording:
-                    if self.audio_manager:
-                        self.audio_manager.recording_stop_sequence()
-                    else:
-                        self.fm.set_recording(False)
-            except:
-                pass
-            
-            # 오디오 매니저 정리
-            if self.audio_manager:
-                self.audio_manager.cleanup()
-                self.audio_manager = None
-            
-            self.fm = None
-        
-        # 새 기기 선택
+        """기기 변경 - 새 기기를 백그라운드에서 준비하는 동안 현재 기기는 계속 동작"""
         dialog = DeviceSelectionDialog(self)
-        if dialog.exec() == QDialog.Accepted:
-            self.selected_device = dialog.selected_device
-            self.init_hardware()
+        if dialog.exec() != QDialog.Accepted or dialog.selected_device is None:
+            return
+        device = dialog.selected_device
+        
+        # 현재 기기의 학습 결과 / 설정 보존
+        self.store_device_settings(on_stored=self.write_settings)
+        
+        self.device_status_label.setStyleSheet("color: #d97706;")
+        self.device_status_label.setText("🟡 Switching Device...")
+        future = self.session_pool.prepare(device, self.device_state)
+        # 준비가 끝나면 GUI 스레드에서 교체
+        future.add_done_callback(self.hw_bridge.session_ready.emit)
+    
+    def on_session_ready(self, future):
+        """새 기기 세션 준비 완료 - 현재 기기와 교체 (실패하면 현재 기기 유지)"""
+        try:
+            session = future.result()
+        except Exception as e:
+            _log.warning("Device switch failed: %s", e)
+            if self.selected_device is not None:
+                self.update_device_info()
+            QMessageBox.warning(self, "Hardware Error",
+                                f"Failed to open the selected device:\n{str(e)}")
+            return
+        if session is self.session_pool.active:
             self.update_device_info()
-            
-            # 상태 초기화
-            self.is_powered = False
-            self.is_recording = False
-            self.is_muted = False
-            self.current_freq = 88.5
-            self.volume = 8
-            
-            # GUI 업데이트
-            self.freq_display.update_frequency(self.current_freq)
-            self.vol_value.setText(str(self.volume))
-            self.volume_slider.setValue(self.volume)
-            self.update_power_state()
-            self.update_mute_state()
-            self.update_record_state()
-            
-            # 하드웨어가 있으면 초기 상태 업데이트
-            if self.fm is not None:
-                self.update_from_hardware()
+            return
+        
+        # 현재 기기 정지 (세션은 닫지 않고 풀에 보관해 다시 선택하면 바로 전환)
+        self.release_current_device()
+        
+        self.selected_device = session.device
+        self.attach_session(session)
+        self.update_device_info()
+        self.start_signal_polling()
+        
+        # GUI 업데이트
+        self.freq_display.update_frequency(self.current_freq)
+        self.vol_value.setText(str(self.volume))
+        self.volume_slider.setValue(self.volume)
+        self.update_power_state()
+        self.update_mute_state()
+        self.update_record_state()
+        
+        # 하드웨어에서 현재 상태 업데이트
+        self.update_from_hardware()
+    
+    def release_current_device(self):
+        """현재 기기 전원 / 녹음 끄고 GUI와의 연결 해제 (세션은 풀에 남음)"""
+        if self.fm is None:
+            return
+        # 전원 끄기 / 녹음 중지는 워커에서 한 시퀀스로 실행하고 세션을 넘기기 전에 완료 확인
+        powered, recording = self.is_powered, self.is_recording
+        freq, volume = self.current_freq, self.volume
+        
+        def release():
+            if powered:
+                self._write_power(False, freq, volume)
+            if recording:
+                self._write_recording(False, freq, volume)
+        
+        if self.io_worker is not None and (powered or recording):
+            try:
+                self.io_worker.submit(PRIORITY_USER, release).result(_RELEASE_TIMEOUT)
+            except Exception as e:
+                _log.debug("Device release sequence failed: %s", e)
+        
+        # 오디오 매니저 정리
+        if self.audio_manager:
+            self.audio_manager.cleanup()
+            self.audio_manager = None
+        
+        self.detach_session()
+        self.fm = None
+        self.is_powered = False
+        self.is_recording = False
+    
+    def detach_session(self):
+        """이벤트 수신 중지, 현재 세션의 I/O 워커 참조 해제"""
+        session = self.session_pool.active
+        if session is not None and session.supervisor is not None:
+            session.supervisor.unsubscribe(self._on_reconnect_callback)
+        if self.event_notifier is not None:
+            self.event_notifier.stop()
+            self.event_notifier.deleteLater()
+            self.event_notifier = None
+        self.event_dispatcher = None
+        self.state_block_timer.stop()
+        self._server_state = None
+        if self.io_worker is not None:
+            self.dump_hardware_metrics()
+            self.io_worker = None
+        self.write_coalescer = None
+        self._status_future = None
+        self._snapshot_future = None
+        self._scan_future = None
+        self._hw_snapshot = None
+    
+    def dump_hardware_metrics(self):
+        """BESFM_METRICS가 설정되어 있으면 명령별 지연 지표 출력 / 저장"""
+        target = os.environ.get(METRICS_ENV)
+        if not target or self.io_worker is None:
+            return
+        path = None if target.lower() in ('1', 'true', 'yes', 'on') else target
+        try:
+            self.io_worker.fm.dump_metrics(path)
+        except Exception as e:
+            _log.warning("Failed to dump hardware metrics: %s", e)
     
     def update_device_info(self):
         """기기 정보 업데이트"""
@@ -793,16 +1124,107 @@ class ModernRadioApp(QWidget):
         self.device_status_label.setText(device_status)
         self.device_info_label.setText(device_info)
     
+    def _on_reconnect_callback(self, event, detail):
+        """재연결 감시 스레드에서 호출 - GUI 스레드로 전달"""
+        self.hw_bridge.reconnect_event.emit(event, detail)
+    
+    def on_reconnect_event(self, event, detail):
+        """재연결 감시기 상태를 UI에 반영"""
+        if event == RECONNECT_LOST:
+            self.device_status_label.setStyleSheet("color: #d97706;")
+            self.device_status_label.setText("🟡 Reconnecting...")
+        elif event == RECONNECT_RESTORED:
+            self.selected_device = detail['device']
+            self.update_device_info()
+            self.update_from_hardware()
+        else:
+            self.device_status_label.setStyleSheet("color: #dc2626;")
+            self.device_status_label.setText("🔴 Hardware Disconnected")
+    
+    def start_signal_polling(self):
+        """알림 수신 여부에 따라 폴링 타이머 설정 (알림이 동작하면 유휴 시 타이머 없음)"""
+        if self.state_block_timer.isActive() or (
+                self.event_notifier is not None and self.event_notifier.is_running()):
+            self.signal_timer.stop()
+            self.rds_timer.stop()
+        else:
+            self.signal_timer.start(2000)
+    
+    def check_state_block(self):
+        """I/O 서버 프로세스 상태 블록에서 바뀐 값만 UI에 반영"""
+        if self.io_worker is None:
+            return
+        state = self.io_worker.state()
+        previous = self._server_state
+        if state is None or (previous is not None and state.seq == previous.seq):
+            return
+        self._server_state = state
+        if previous is None:
+            return
+        if state.tune_count != previous.tune_count:
+            self.on_tune_completed({'success': True, 'freq': state.channel})
+        if state.rds_count != previous.rds_count:
+            self.on_rds_received(state.rds_data)
+        if state.rssi != previous.rssi:
+            self.on_rssi_changed(state.rssi)
+    
+    def on_tune_completed(self, status):
+        """시크 / 튠 완료 알림을 UI에 반영"""
+        if status.get('success') and abs(status['freq'] - self.current_freq) > 0.01:
+            self.current_freq = status['freq']
+            self.freq_display.update_frequency(self.current_freq)
+    
+    def on_rds_received(self, data):
+        """RDS 알림을 UI에 반영"""
+        if self.rds_enabled:
+            try:
+                self.parse_rds_data(data)
+            except Exception as e:
+                _log.warning("RDS event handling failed: %s", e)
+    
+    def on_rssi_changed(self, strength):
+        """신호 강도 변경 알림을 UI에 반영"""
+        if self.is_powered:
+            self.signal_strength.update_signal(strength)
+    
     def update_signal_strength(self):
         """신호 강도 업데이트"""
         if self.fm is not None and self.is_powered:
-            try:
-                status = self.fm.get_status()
-                if 'strength' in status:
-                    strength = status['strength']
-                    self.signal_strength.update_signal(strength)
-            except Exception as e:
-                print(f"Signal strength update failed: {e}")
+            self.poll_status()
+    
+    def poll_status(self):
+        """백그라운드 우선순위로 상태 조회 요청 (GUI 스레드를 막지 않음)"""
+        if self.io_worker is None:
+            return
+        # 이전 폴링이 아직 처리 중이면 중복 요청하지 않음
+        if self._status_future is not None and not self._status_future.done():
+            return
+        self._status_future = self.io_worker.submit(PRIORITY_POLL, 'get_status')
+        self._status_future.add_done_callback(self._on_status_future_done)
+    
+    def _on_status_future_done(self, future):
+        """워커 스레드에서 호출 - 결과를 GUI 스레드로 전달"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            _log.warning("Status poll failed: %s", error)
+            return
+        self.hw_bridge.status_ready.emit(future.result())
+    
+    def on_status_polled(self, status):
+        """폴링된 상태를 UI에 반영"""
+        if not isinstance(status, dict):
+            return
+        try:
+            if self.is_powered and 'strength' in status:
+                self.signal_strength.update_signal(status['strength'])
+            if self.rds_enabled and status.get('type') == 'rds':
+                rds_data = status.get('data', b'')
+                if rds_data:
+                    self.parse_rds_data(rds_data)
+        except Exception as e:
+            _log.warning("Status update failed: %s", e)
     
     def recall_preset(self, index):
         """프리셋 호출"""
@@ -811,24 +1233,15 @@ class ModernRadioApp(QWidget):
             
         if 0 <= index < len(self.presets) and self.presets[index] is not None:
             freq = self.presets[index]
-            old_freq = self.current_freq
             self.current_freq = freq
             self.freq_display.update_frequency(freq)
             
-            # 하드웨어에 설정
+            # 하드웨어에 설정 (튜닝 완료 상태의 실제 주파수는 on_channel_verified로 반영)
             if self.fm is not None:
                 try:
-                    self.fm.set_channel(freq)
-                    
-                    # 실제 설정된 주파수 확인
-                    actual_freq = self.fm.get_channel()
-                    self.current_freq = actual_freq
-                    self.freq_display.update_frequency(actual_freq)
-                        
+                    self.tune_hardware(freq)
                 except Exception as e:
-                    print(f"Preset recall failed: {e}")
-                    self.current_freq = old_freq
-                    self.freq_display.update_frequency(old_freq)
+                    _log.warning("Preset recall failed: %s", e)
     
     def save_preset_menu(self, index):
         """프리셋 저장"""
@@ -841,99 +1254,50 @@ class ModernRadioApp(QWidget):
     
     def scan_up(self):
         """위쪽 주파수 스캔"""
-        if not self.is_powered or self.fm is None:
-            print(f"Scan up blocked: powered={self.is_powered}, fm_available={self.fm is not None}")
-            return
-        
-        print(f"Starting scan up from {self.current_freq:.1f} MHz")
-        
-        try:
-            # 현재 주파수 저장
-            start_freq = self.current_freq
-            max_attempts = 10  # 안전장치: 최대 10번 시도
-            
-            for attempt in range(max_attempts):
-                print(f"Scan up attempt {attempt + 1}/{max_attempts}")
-                
-                # 스캔 실행
-                self.fm.seek_up()
-                
-                # 점진적으로 더 오래 대기
-                import time
-                wait_time = min(0.5 + (attempt * 0.2), 2.0)
-                time.sleep(wait_time)
-                
-                # 새 주파수 읽기
-                actual_freq = self.fm.get_channel()
-                print(f"Scan up attempt {attempt + 1} result: {actual_freq:.1f} MHz")
-                
-                # 주파수가 실제로 변경되었는지 확인
-                if abs(actual_freq - start_freq) > 0.05:
-                    print(f"✅ Frequency successfully changed from {start_freq:.1f} to {actual_freq:.1f} MHz")
-                    
-                    # 주파수 업데이트
-                    self.current_freq = actual_freq
-                    self.freq_display.update_frequency(actual_freq)
-                    
-                    return  # 성공적으로 변경되었으므로 종료
-                else:
-                    print(f"❌ No frequency change in attempt {attempt + 1}")
-                    if attempt < max_attempts - 1:
-                        print("🔄 Retrying scan with longer wait time...")
-                        time.sleep(0.1)  # 재시도 전 잠시 대기
-                    else:
-                        print(f"⚠️ Maximum attempts ({max_attempts}) reached for scan up")
-                        
-        except Exception as e:
-            print(f"Scan up failed: {e}")
+        self.scan(up=True)
     
     def scan_down(self):
         """아래쪽 주파수 스캔"""
+        self.scan(up=False)
+    
+    def scan(self, up):
+        """
+        주파수가 바뀔 때까지 시크 반복 - 알림 디스패처(없으면 I/O 워커)에서 실행하고 결과는 scan_done으로
+        """
+        direction = "up" if up else "down"
         if not self.is_powered or self.fm is None:
-            print(f"Scan down blocked: powered={self.is_powered}, fm_available={self.fm is not None}")
+            _log.debug("Scan %s blocked: powered=%s, fm_available=%s",
+                       direction, self.is_powered, self.fm is not None)
+            return
+        if self._scan_future is not None:
+            _log.debug("Scan %s ignored: previous scan still running", direction)
             return
         
-        print(f"Starting scan down from {self.current_freq:.1f} MHz")
-        
+        _log.debug("Starting scan %s from %.1f MHz", direction, self.current_freq)
+        # 보정 결과가 있으면 그 임계값보다 약한 헛멈춤은 건너뛰고 시크 횟수도 보정 값으로 정함
+        calibration = self.seek_calibration()
+        if self.event_dispatcher is not None:
+            # 시크 완료 알림은 디스패처가 받으므로 디스패처 쪽에서 반복
+            future = self.event_dispatcher.seek_station(up, calibration=calibration)
+        else:
+            future = self.io_worker.submit(PRIORITY_TUNE, 'seek_station', up,
+                                           calibration=calibration)
+        self._scan_future = future
+        future.add_done_callback(self.hw_bridge.scan_done.emit)
+    
+    def on_scan_done(self, future):
+        """스캔 완료 (GUI 스레드) - 바뀐 주파수 반영"""
+        if future is not self._scan_future:
+            return
+        self._scan_future = None
         try:
-            # 현재 주파수 저장
-            start_freq = self.current_freq
-            max_attempts = 10  # 안전장치: 최대 10번 시도
-            
-            for attempt in range(max_attempts):
-                print(f"Scan down attempt {attempt + 1}/{max_attempts}")
-                
-                # 스캔 실행
-                self.fm.seek_down()
-                
-                # 점진적으로 더 오래 대기
-                import time
-                wait_time = min(0.5 + (attempt * 0.2), 2.0)
-                time.sleep(wait_time)
-                
-                # 새 주파수 읽기
-                actual_freq = self.fm.get_channel()
-                print(f"Scan down attempt {attempt + 1} result: {actual_freq:.1f} MHz")
-                
-                # 주파수가 실제로 변경되었는지 확인
-                if abs(actual_freq - start_freq) > 0.05:
-                    print(f"✅ Frequency successfully changed from {start_freq:.1f} to {actual_freq:.1f} MHz")
-                    
-                    # 주파수 업데이트
-                    self.current_freq = actual_freq
-                    self.freq_display.update_frequency(actual_freq)
-                    
-                    return  # 성공적으로 변경되었으므로 종료
-                else:
-                    print(f"❌ No frequency change in attempt {attempt + 1}")
-                    if attempt < max_attempts - 1:
-                        print("🔄 Retrying scan with longer wait time...")
-                        time.sleep(0.1)  # 재시도 전 잠시 대기
-                    else:
-                        print(f"⚠️ Maximum attempts ({max_attempts}) reached for scan down")
-                        
+            status = future.result()
         except Exception as e:
-            print(f"Scan down failed: {e}")
+            _log.warning("Scan failed: %s", e)
+            return
+        if status['success'] and abs(status['freq'] - self.current_freq) > 0.01:
+            self.current_freq = status['freq']
+            self.freq_display.update_frequency(status['freq'])
     
     def toggle_rds(self):
         """RDS 토글"""
@@ -941,21 +1305,30 @@ class ModernRadioApp(QWidget):
             return
         
         if self.fm is not None:
-            try:
-                current_rds = self.fm.get_rds()
-                self.fm.set_rds(not current_rds)
-                self.rds_enabled = not current_rds
-                self.update_rds_button()
-                
-                if self.rds_enabled:
-                    self.rds_timer.start(2000)  # 2초마다 RDS 체크
-                else:
-                    self.rds_timer.stop()
-                    self.rds_station.setText(self.language_manager.get_text('rds_disabled'))
-                    self.rds_text.setText("")
-                    
-            except Exception as e:
-                print(f"RDS toggle failed: {e}")
+            self.run_hardware(self._write_rds_toggle, on_done=self._on_rds_toggled)
+    
+    def _write_rds_toggle(self):
+        """워커에서 실행 - RDS 상태 반전 후 새 상태 반환"""
+        enabled = not self.fm.get_rds()
+        self.fm.set_rds(enabled)
+        return enabled
+    
+    def _on_rds_toggled(self, future):
+        try:
+            self.rds_enabled = future.result()
+        except Exception as e:
+            _log.warning("RDS toggle failed: %s", e)
+            return
+        self.update_rds_button()
+        
+        if self.rds_enabled:
+            # 알림 디스패처 / 상태 블록이 없을 때만 2초마다 RDS 체크
+            if self.event_dispatcher is None and not self.state_block_timer.isActive():
+                self.rds_timer.start(2000)
+        else:
+            self.rds_timer.stop()
+            self.rds_station.setText(self.language_manager.get_text('rds_disabled'))
+            self.rds_text.setText("")
     
     def update_rds_button(self):
         """RDS 버튼 상태 업데이트"""
@@ -972,14 +1345,7 @@ class ModernRadioApp(QWidget):
     def check_rds_data(self):
         """RDS 데이터 정기적 체크"""
         if self.fm is not None and self.rds_enabled:
-            try:
-                status = self.fm.get_status()
-                if status.get('type') == 'rds':
-                    rds_data = status.get('data', b'')
-                    if rds_data:
-                        self.parse_rds_data(rds_data)
-            except Exception as e:
-                print(f"RDS data check failed: {e}")
+            self.poll_status()
     
     def parse_rds_data(self, rds_data):
         """RDS 데이터 파싱 및 표시"""
@@ -999,39 +1365,66 @@ class ModernRadioApp(QWidget):
                         self.rds_text.setText(radio_text)
                         
         except Exception as e:
-            print(f"RDS parsing failed: {e}")
+            _log.warning("RDS parsing failed: %s", e)
     
     def show_settings(self):
         """설정 다이얼로그 표시"""
         # 간단한 설정 다이얼로그를 위해 메시지박스 사용
-        from PySide6.QtWidgets import QMessageBox
-        QMessageBox.information(self, 
-                              self.language_manager.get_text('settings'),
-                              self.language_manager.get_text('settings_coming_soon'))
+        box = QMessageBox(self)
+        box.setWindowTitle(self.language_manager.get_text('settings'))
+        box.setText(self.language_manager.get_text('settings_coming_soon'))
+        calibrate_btn = box.addButton(self.language_manager.get_text('calibrate_seek'),
+                                      QMessageBox.ActionRole)
+        calibrate_btn.setEnabled(self.is_powered and self._calibration_future is None)
+        box.addButton(QMessageBox.Close)
+        box.exec()
+        if box.clickedButton() is calibrate_btn:
+            self.calibrate_seek()
+    
+    def calibrate_seek(self):
+        """현재 위치의 잡음 바닥을 측정해 시크 임계값 보정 (워커에서 대역 전체를 훑음)"""
+        if self.io_worker is None or not self.is_powered:
+            return
+        self.device_status_label.setStyleSheet("color: #d97706;")
+        self.device_status_label.setText("🟡 Calibrating Seek...")
+        if self.event_dispatcher is not None:
+            # 튜닝 완료 알림은 디스패처가 받으므로 디스패처로 채널마다 튜닝을 확인
+            self._calibration_future = self.event_dispatcher.calibrate_seek()
+        else:
+            self._calibration_future = self.io_worker.submit(PRIORITY_USER, 'calibrate_seek')
+        self._calibration_future.add_done_callback(self.hw_bridge.calibration_ready.emit)
+    
+    def on_calibration_ready(self, future):
+        """시크 보정 완료 - 기기 / 위치별로 저장하고 결과 표시"""
+        self._calibration_future = None
+        self.update_device_info()
+        try:
+            calibration = future.result()
+        except Exception as e:
+            _log.warning("Seek calibration failed: %s", e)
+            QMessageBox.warning(self, "Hardware Error", f"Seek calibration failed:\n{str(e)}")
+            return
+        key = self.device_settings_key()
+        if key is not None:
+            entry = self.device_settings.setdefault(key, {})
+            entry.setdefault('seek_calibration', {})[self.location] = calibration.to_dict()
+            self.save_settings()
+        QMessageBox.information(
+            self, self.language_manager.get_text('settings'),
+            self.language_manager.get_text(
+                'calibration_result', calibration.rssi_threshold, calibration.noise_floor,
+                len(calibration.stations), calibration.false_stops_per_seek * 100
+            )
+        )
     
     def closeEvent(self, event):
         """애플리케이션 종료시 설정 저장"""
-        self.save_settings()
+        self.save_settings(wait=True)
         
-        # 하드웨어 정리
-        if self.fm is not None:
-            try:
-                if self.is_powered:
-                    if self.audio_manager:
-                        self.audio_manager.power_off_sequence()
-                    else:
-                        self.fm.set_power(False)
-                if self.is_recording:
-                    if self.audio_manager:
-                        self.audio_manager.recording_stop_sequence()
-                    else:
-                        self.fm.set_recording(False)
-            except:
-                pass
-        
-        # 오디오 매니저 정리
-        if self.audio_manager:
-            self.audio_manager.cleanup()
+        # 하드웨어 정리 (보관 중인 기기 세션까지 모두 닫음)
+        self.release_current_device()
+        self.session_pool.close_all()
+        stop_hotplug_watcher()
         
         # 타이머 정리
         if hasattr(self, 'rds_timer'):
@@ -5,5 +5,37 @@
 from .besfm_core import BesFM
 from .besfm_enums import BesCmd, BesFM_Enums
 from .device_manager import DeviceManager
+from .io_worker import BesFMWorker, PRIORITY_USER, PRIORITY_TUNE, PRIORITY_POLL
+from .write_coalescer import WriteCoalescer
+from .register_cache import RegisterCache
+from .event_dispatcher import BesFMEventDispatcher, FMEvent
+from .snapshot import BesFMSnapshot
+from .async_besfm import AsyncBesFM
+from .retry_policy import RetryPolicy, RetryEngine, CircuitBreaker, DeviceDisconnectedError
+from .usb_trace import RecordingDevice, ReplayDevice, read_trace
+from .simulator import SimulatedBesFMDevice, SimStation
+from .metrics import CommandMetrics, LatencyHistogram
+from .tuner_pool import TunerPool, Tuner
+from .device_info import DeviceInfo
+from .hotplug import HotplugWatcher, get_hotplug_watcher, HOTPLUG_ATTACH, HOTPLUG_DETACH
+from .session_pool import SessionPool, DeviceSession
+from .reconnect import ReconnectSupervisor
+from .capabilities import DeviceCapabilities, UnsupportedCommandError
+from .registers import Register, REGISTERS
+from .transaction import ApplyReport, ApplyStep
+from .io_server import IOServer, SharedStateBlock, ServerState
+from .calibration import SeekCalibration
+from .log import get_logger, configure_logging, dump_log
 
-__all__ = ['BesFM', 'BesCmd', 'BesFM_Enums', 'DeviceManager']
\ No newline at end of file
+__all__ = ['BesFM', 'BesCmd', 'BesFM_Enums', 'DeviceManager',
+           'BesFMWorker', 'PRIORITY_USER', 'PRIORITY_TUNE', 'PRIORITY_POLL',
+           'WriteCoalescer', 'RegisterCache', 'BesFMEventDispatcher', 'FMEvent',
+           'RetryPolicy', 'RetryEngine', 'CircuitBreaker', 'DeviceDisconnectedError',
+           'BesFMSnapshot', 'AsyncBesFM', 'RecordingDevice', 'ReplayDevice', 'read_trace',
+           'SimulatedBesFMDevice', 'SimStation', 'CommandMetrics', 'LatencyHistogram',
+           'TunerPool', 'Tuner', 'HotplugWatcher', 'get_hotplug_watcher',
+           'HOTPLUG_ATTACH', 'HOTPLUG_DETACH', 'DeviceInfo', 'SessionPool', 'DeviceSession',
+           'ReconnectSupervisor', 'DeviceCapabilities', 'UnsupportedCommandError',
+           'Register', 'REGISTERS', 'ApplyReport', 'ApplyStep',
+           'IOServer', 'SharedStateBlock', 'ServerState', 'SeekCalibration',
+           'get_logger', 'configure_logging', 'dump_log']
@@ -0,0 +1,307 @@
+"""
+asyncio용 BesFM 래퍼 - 모든 USB 호출은 기기 I/O 워커에서 실행하고 결과를 await
+"""
+import asyncio
+import time
+
+from .event_dispatcher import (BesFMEventDispatcher, FMEvent, EVENT_TYPES,
+                               EVENT_SEEK, EVENT_TUNE, EVENT_RDS, EVENT_RSSI)
+from .calibration import SURVEY_SAMPLES
+from .io_worker import BesFMWorker, PRIORITY_USER, PRIORITY_TUNE, PRIORITY_POLL
+from .log import get_logger
+
+
+_log = get_logger('worker')
+
+# 코루틴으로 노출하는 BesFM 메서드와 워커 우선순위
+_METHODS = {
+    'is_connected': PRIORITY_USER,
+    'set_power': PRIORITY_USER,
+    'get_power': PRIORITY_USER,
+    'set_recording': PRIORITY_USER,
+    'get_recording': PRIORITY_USER,
+    'set_band': PRIORITY_USER,
+    'get_band': PRIORITY_USER,
+    'set_rssi_threshold': PRIORITY_USER,
+    'get_rssi_threshold': PRIORITY_USER,
+    'set_channel_spacing': PRIORITY_USER,
+    'get_channel_spacing': PRIORITY_USER,
+    'set_mute': PRIORITY_USER,
+    'get_mute': PRIORITY_USER,
+    'set_volume': PRIORITY_USER,
+    'get_volume': PRIORITY_USER,
+    'set_mono': PRIORITY_USER,
+    'get_mono': PRIORITY_USER,
+    'seek_up': PRIORITY_TUNE,
+    'seek_down': PRIORITY_TUNE,
+    'seek_stop': PRIORITY_TUNE,
+    'set_channel': PRIORITY_TUNE,
+    'get_channel': PRIORITY_TUNE,
+    'get_rssi': PRIORITY_POLL,
+    'get_protocol_version': PRIORITY_USER,
+    'get_ic_info': PRIORITY_USER,
+    'get_ic_number': PRIORITY_USER,
+    'probe_capabilities': PRIORITY_USER,
+    'set_rds': PRIORITY_USER,
+    'get_rds': PRIORITY_USER,
+    'set_dc_threshold': PRIORITY_USER,
+    'get_dc_threshold': PRIORITY_USER,
+    'set_spike_threshold': PRIORITY_USER,
+    'get_spike_threshold': PRIORITY_USER,
+    'calibrate_seek': PRIORITY_USER,
+    'get_snapshot': PRIORITY_USER,
+    'apply': PRIORITY_USER,
+    'get_status': PRIORITY_POLL,
+}
+
+
+def _async_method(name, priority):
+    async def method(self, *args, **kwargs):
+        return await self._call(priority, name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncBesFM.{name}"
+    method.__doc__ = f"BesFM.{name}()의 코루틴 버전"
+    return method
+
+
+class AsyncBesFM:
+    """
+    BesFM을 asyncio에서 사용하기 위한 파사드
+
+    USB 전송은 기기당 하나인 BesFMWorker 스레드에서 직렬화되므로
+    여러 태스크가 동시에 호출해도 안전하며 이벤트 루프를 막지 않는다.
+
+        async with AsyncBesFM(fm) as radio:
+            await radio.set_power(True)
+            status = await radio.tune(95.1)
+            async for event in radio.rds_groups():
+                ...
+    """
+
+    def __init__(self, fm, worker=None, dispatcher=None,
+                 poll_interval=0.5, queue_size=64):
+        """
+        Args:
+            fm (BesFM): 대상 기기
+            worker (BesFMWorker): 공유할 I/O 워커 (없으면 새로 만들고 close()에서 중지)
+            dispatcher (BesFMEventDispatcher): 공유할 이벤트 디스패처 (없으면 새로 만듦)
+            poll_interval (float): 알림 엔드포인트를 쓸 수 없을 때 상태 폴링 주기 (초)
+            queue_size (int): 비동기 이터레이터별 최대 대기 이벤트 수 (넘치면 오래된 것부터 버림)
+        """
+        self.fm = fm
+        self._owns_worker = worker is None
+        self._worker = worker or BesFMWorker(fm, name="AsyncBesFMWorker")
+        self._dispatcher = dispatcher
+        self._owns_dispatcher = dispatcher is None
+        self._poll_interval = poll_interval
+        self._queue_size = queue_size
+        self._loop = None
+        self._poll_task = None
+        self._waiters = {event_type: [] for event_type in EVENT_TYPES}
+        self._queues = {event_type: [] for event_type in EVENT_TYPES}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """이벤트 수신 시작 (알림 엔드포인트가 없으면 상태 폴링으로 대체)"""
+        self._loop = asyncio.get_running_loop()
+        if self._dispatcher is None:
+            self._dispatcher = BesFMEventDispatcher(self.fm, self._worker)
+        for event_type in EVENT_TYPES:
+            self._dispatcher.subscribe(event_type, self._on_dispatcher_event)
+        if not self._dispatcher.is_running() and not self._dispatcher.start():
+            self._poll_task = self._loop.create_task(self._poll_status())
+
+    async def close(self):
+        """이벤트 수신 중지 및 소유한 워커 정리"""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+        if self._dispatcher is not None:
+            for event_type in EVENT_TYPES:
+                self._dispatcher.unsubscribe(event_type, self._on_dispatcher_event)
+            if self._owns_dispatcher:
+                await asyncio.get_running_loop().run_in_executor(None, self._dispatcher.stop)
+        if self._owns_worker:
+            self._worker.stop()
+        for waiters in self._waiters.values():
+            for future, _ in waiters:
+                future.cancel()
+            waiters.clear()
+
+    async def _call(self, priority, name, *args, **kwargs):
+        """워커에서 BesFM 메서드를 실행하고 결과를 await"""
+        future = self._worker.submit(priority, name, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    async def wait_for_event(self, event_type, timeout=None):
+        """
+        다음 이벤트 한 번을 기다림
+
+        Returns:
+            FMEvent: 수신한 이벤트
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 이벤트가 오지 않은 경우
+        """
+        future = self._expect(event_type)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._discard_waiter(event_type, future)
+
+    async def seek(self, up=True, timeout=5.0):
+        """
+        시크를 시작하고 완료를 기다림
+
+        Returns:
+            dict: get_status()의 seek 결과 (success / freq / strength / seconds)
+        """
+        return await self._command(EVENT_SEEK, 'seek_up' if up else 'seek_down', (), timeout)
+
+    async def tune(self, freq, timeout=2.0):
+        """
+        주파수를 설정하고 튜닝 완료를 기다림
+
+        Returns:
+            dict: get_status()의 tune 결과 (success / freq / strength / seconds)
+        """
+        # 이전 튜닝의 늦은 알림은 건너뜀 (실패 상태는 원래 주파수를 담고 있음)
+        return await self._command(
+            EVENT_TUNE, 'set_channel', (freq,), timeout,
+            lambda status: not status['success'] or abs(status['freq'] - freq) < 0.005
+        )
+
+    async def _command(self, event_type, name, args, timeout, accept=None):
+        """
+        명령을 보내고 event_type 이벤트로 결과 확정 (tune() / seek() 공용)
+
+        디스패처 경로와 같이 지연을 fm.record_event(event_type)로 기록한다.
+        """
+        started = time.monotonic()
+        future = self._expect(event_type, accept)
+        try:
+            await self._call(PRIORITY_TUNE, name, *args)
+            event = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.fm.record_event(event_type, time.monotonic() - started, False)
+            raise
+        finally:
+            self._discard_waiter(event_type, future)
+        seconds = time.monotonic() - started
+        self.fm.record_event(event_type, seconds, event.data['success'])
+        return dict(event.data, seconds=seconds)
+
+    async def seek_station(self, up=True, attempts=None, calibration=None):
+        """
+        주파수가 바뀔 때까지 시크 반복 (디스패처가 동작 중이면 시크 완료 알림으로 확인)
+
+        calibration(SeekCalibration)을 주면 그 임계값보다 약한 곳은 건너뜀
+
+        Returns:
+            dict: {'success', 'freq', 'strength', 'attempts'}
+        """
+        if self._dispatcher is not None and self._dispatcher.is_running():
+            return await asyncio.wrap_future(
+                self._dispatcher.seek_station(up, attempts, calibration))
+        return await self._call(PRIORITY_TUNE, 'seek_station', up, attempts, calibration)
+
+    async def calibrate_seek(self, samples=SURVEY_SAMPLES):
+        """
+        시크 임계값 보정 (디스패처가 동작 중이면 채널마다 튜닝 완료 알림으로 확인)
+
+        Returns:
+            SeekCalibration: 보정 결과
+        """
+        if self._dispatcher is not None and self._dispatcher.is_running():
+            return await asyncio.wrap_future(self._dispatcher.calibrate_seek(samples))
+        return await self._call(PRIORITY_USER, 'calibrate_seek', samples)
+
+    def rds_groups(self):
+        """RDS 그룹 이벤트 비동기 이터레이터"""
+        return self.events(EVENT_RDS)
+
+    def rssi_updates(self):
+        """신호 강도 이벤트 비동기 이터레이터"""
+        return self.events(EVENT_RSSI)
+
+    async def events(self, event_type):
+        """지정한 종류의 이벤트를 계속 전달하는 비동기 이터레이터"""
+        queue = asyncio.Queue(self._queue_size)
+        self._queues[event_type].append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues[event_type].remove(queue)
+
+    def _expect(self, event_type, accept=None):
+        """
+        이벤트 대기 future 등록 (명령 전송 전에 호출해야 결과를 놓치지 않음)
+
+        accept(status)가 False인 이벤트로는 완료되지 않고 다음 이벤트를 계속 기다린다.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[event_type].append((future, accept))
+        return future
+
+    def _discard_waiter(self, event_type, future):
+        waiters = self._waiters[event_type]
+        waiters[:] = [waiter for waiter in waiters if waiter[0] is not future]
+
+    def _on_dispatcher_event(self, event):
+        """디스패처 스레드에서 호출 - 이벤트 루프로 넘김"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event):
+        """이벤트 루프에서 대기자와 이터레이터에 이벤트 전달"""
+        waiters = self._waiters[event.type]
+        pending = []
+        for future, accept in waiters:
+            if future.done():
+                continue
+            if accept is not None and not accept(event.data):
+                pending.append((future, accept))
+                continue
+            future.set_result(event)
+        waiters[:] = pending
+        for queue in self._queues[event.type]:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _poll_status(self):
+        """알림 엔드포인트가 없을 때 상태 폴링으로 이벤트 생성"""
+        while True:
+            try:
+                status = await self._call(PRIORITY_POLL, 'get_status')
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _log.warning("Async status poll failed: %s", e)
+                status = None
+            if isinstance(status, dict):
+                timestamp = time.monotonic()
+                if status.get('type') in (EVENT_SEEK, EVENT_TUNE, EVENT_RDS):
+                    self._deliver(FMEvent(status['type'], status, timestamp))
+                if 'strength' in status:
+                    self._deliver(FMEvent(EVENT_RSSI, status, timestamp))
+            await asyncio.sleep(self._poll_interval)
+
+
+for _name, _priority in _METHODS.items():
+    # 이벤트 기반으로 직접 구현한 메서드(tune 등)는 덮어쓰지 않음
+    if _name not in AsyncBesFM.__dict__:
+        setattr(AsyncBesFM, _name, _async_method(_name, _priority))
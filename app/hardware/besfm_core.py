@@ -1,28 +1,88 @@
 """
 BesFM 라디오 하드웨어 핵심 클래스
 """
+import array
+import threading
 import usb.core
 import struct
 import platform
 import time
 from .besfm_enums import BesCmd, BesFM_Enums
+from .register_cache import RegisterCache
+from .pacing import PacingController, set_key, get_key
+from .retry_policy import RetryEngine, classify_usb_error, ERROR_TIMEOUT
+from .snapshot import BesFMSnapshot, DEFAULT_FIELDS, ALL_FIELDS
+from .registers import REGISTERS, REPLAYED_REGISTERS
+from .transaction import ApplyReport, plan_writes
+from .calibration import calibrate, seek_station, SURVEY_SAMPLES, SEEK_TIMEOUT
+from .usb_trace import RecordingDevice
+from .simulator import simulated_devices
+from .metrics import CommandMetrics
+from .device_info import DeviceInfo
+from .log import get_logger
+from .capabilities import (probe_capabilities, CapabilityCache, UnsupportedCommandError,
+                           CAPABILITY_CACHE_FILE)
+
+
+_log = get_logger('usb')
+
+# 전송 경로에서 반복 사용하는 값들 (Enum.value 조회 / 포맷 문자열 파싱을 매번 하지 않도록)
+_REQUEST_TYPE = BesCmd.READ.value
+_REQUEST_SET = BesCmd.SET.value
+_REQUEST_GET = BesCmd.GET.value
+_REQUEST_QUERY = BesCmd.QUERY.value
+_GET_INDEX = BesCmd.GET_FM_INDEX.value
+_SET_LENGTH = BesCmd.SET_DATA_LENGTH.value
+_GET_LENGTH = BesCmd.GET_DATA_LENGTH.value
+_QUERY_LENGTH = 12
+
+_POWER_OFF = BesCmd.SET_FM_IC_POWER_OFF.value
+_SET_CHANNEL = BesCmd.SET_CHANNEL.value
+_GET_CHANNEL = BesCmd.GET_CURRENT_CHANNEL.value
+
+# 재연결 후 다시 보내는 SET 명령 (레지스터 표 순서) - 전원 / 녹음 모드가 먼저 켜져야 나머지가 적용됨
+_REPLAYED_SETS = tuple(reg.set for reg in REPLAYED_REGISTERS)
+_REPLAYED = frozenset(_REPLAYED_SETS)
+_POWER_SETS = frozenset((REGISTERS['power'].set, REGISTERS['recording'].set))
+
+_U16 = struct.Struct('<H')
+_SEEK_TUNE = struct.Struct('<?HB')  # success, freq, strength
+
+# 알림 엔드포인트가 없을 때 tune()의 상태 조회 간격 (초, 처음 값에서 두 배씩 최대값까지)
+_TUNE_POLL_INITIAL = 0.002
+_TUNE_POLL_MAX = 0.01
+_RDS_WORDS_LE = struct.Struct('<4H')  # RDS 블록 4개 (리틀 엔디언으로 도착)
+_RDS_WORDS_BE = struct.Struct('>4H')
 
 
 class BesFM:
     """Samsung BesFM 라디오 하드웨어 제어 클래스"""
     
-    def __init__(self, dev: usb.core.Device):
+    def __init__(self, dev: usb.core.Device, use_cache=False, cache_ttls=None,
+                 retry_policy=None, metrics=False):
         self._dev = dev
-        self._device_info = {
-            'vendor_id': dev.idVendor,
-            'product_id': dev.idProduct,
-            'bus': dev.bus,
-            'address': dev.address,
-            'serial_number': dev.serial_number,
-            'manufacturer': dev.manufacturer,
-            'product': dev.product
-        }
+        # 선택적 섀도 레지스터 캐시 (GET 왕복 감소)
+        self._cache = RegisterCache(cache_ttls) if use_cache else None
+        # 명령 종류별 적응형 전송 간격
+        self._pacer = PacingController()
+        # 오류 분류 / 백오프 / 서킷 브레이커
+        self._retry = RetryEngine(retry_policy)
+        # 명령별 지연 히스토그램 (사용하지 않으면 None)
+        self._metrics = CommandMetrics() if metrics else None
+        # 스레드별로 재사용하는 전송 버퍼 (명령마다 bytearray를 새로 만들지 않음)
+        self._buffers = threading.local()
+        # 문자열 디스크립터는 백그라운드에서 읽음 (초기화 경로에서 control transfer 3회 제거)
+        self._device_info = DeviceInfo(dev)
+        
+        # 마지막으로 보낸 상태 SET 값 (SET 코드 -> 값) - 재연결 후 재적용
+        self._last_state = {}
+        # 기능 탐지 결과 (probe_capabilities() 전에는 모든 명령을 지원한다고 가정)
+        self._capabilities = None
         
+        self._attach()
+    
+    def _attach(self):
+        """커널 드라이버 분리, configuration 설정, 알림 엔드포인트 확보"""
         # macOS에서 권한 문제 해결을 위한 추가 처리
         try:
             # 기존 커널 드라이버 분리
@@ -30,7 +90,7 @@ class BesFM:
                 self._dev.detach_kernel_driver(4)
         except usb.core.USBError as e:
             if platform.system() == "Darwin":  # macOS
-                print(f"Warning: Could not detach kernel driver (this is normal on macOS): {e}")
+                _log.info("Could not detach kernel driver (this is normal on macOS): %s", e)
             else:
                 raise e
         
@@ -76,25 +136,34 @@ class BesFM:
         compatible_devices = []
         try:
             devices = list(usb.core.find(find_all=True, idVendor=0x04e8))
+        except Exception as e:
+            _log.warning("Error scanning for devices: %s", e)
+            devices = []
+        # BESFM_SIMULATOR 환경 변수가 설정되어 있으면 가상 기기도 포함
+        devices.extend(simulated_devices())
+        try:
             for device in devices:
                 if device.idProduct in [0xa054, 0xa059, 0xa05b]:
-                    device_info = {
-                        'device': device,
-                        'vendor_id': device.idVendor,
-                        'product_id': device.idProduct,
-                        'bus': device.bus,
-                        'address': device.address,
-                        'serial_number': device.serial_number,
-                        'manufacturer': device.manufacturer or 'Samsung',
-                        'product': device.product or 'FM Radio',
-                        'description': f"Samsung FM Radio (0x{device.idProduct:04x})"
-                    }
-                    compatible_devices.append(device_info)
+                    compatible_devices.append(BesFM.describe_device(device))
         except Exception as e:
-            print(f"Error scanning for devices: {e}")
+            _log.warning("Error scanning for devices: %s", e)
         
         return compatible_devices
     
+    @staticmethod
+    def describe_device(device):
+        """
+        USB 기기 정보 생성 (find_all_devices 항목 형식)
+
+        문자열 디스크립터는 백그라운드에서 기기당 한 번만 읽으므로 바로 반환된다.
+        """
+        return DeviceInfo(
+            device,
+            defaults={'manufacturer': 'Samsung', 'product': 'FM Radio'},
+            description=getattr(device, 'description', None)
+                        or f"Samsung FM Radio (0x{device.idProduct:04x})"
+        )
+    
     @staticmethod
     def get_device_name(product_id):
         """Product ID에 따른 기기 이름 반환"""
@@ -107,188 +176,492 @@ class BesFM:
     
     def get_device_info(self):
         """현재 기기 정보 반환"""
-        return self._device_info.copy()
+        return {key: value for key, value in self._device_info.items() if key != 'device'}
     
     def is_connected(self):
         """기기 연결 상태 확인"""
         try:
-            # 간단한 명령을 보내서 기기가 응답하는지 확인
-            self._get(BesCmd.GET_FM_IC_POWER_ON_STATE.value)
+            # 간단한 명령을 보내서 기기가 응답하는지 확인 (캐시 우회)
+            self._get(BesCmd.GET_FM_IC_POWER_ON_STATE.value, use_cache=False)
             return True
         except:
             return False
 
+    def _buffer(self, key, size):
+        """현재 스레드의 명령별 전송 버퍼 반환 (최초 1회만 할당)"""
+        buffers = self._buffers.__dict__
+        buf = buffers.get(key)
+        if buf is None:
+            buf = buffers[key] = array.array('B', bytes(size))
+        return buf
+
+    def _transfer(self, key, request, value, index, buf):
+        """
+        pacing을 적용한 단일 control transfer (재시도는 _retry가 담당)
+
+        array.array 버퍼를 넘기면 pyusb가 새 배열을 만들지 않고 그 자리에 채운다.
+        """
+        # 이전 명령의 안정화 간격이 남아 있으면 대기
+        started = self._pacer.wait_ready()
+        try:
+            self._dev.ctrl_transfer(_REQUEST_TYPE, request, value, index, buf)
+        except usb.core.USBError:
+            self._pacer.record(key, started, time.monotonic(), False)
+            raise
+        self._pacer.record(key, started, time.monotonic(), True)
+        return buf
+
+    def _execute(self, key, transfer, *args):
+        """재시도 정책으로 전송 실행 (지표 수집 중이면 재시도를 포함한 호출 시간 기록)"""
+        metrics = self._metrics
+        if metrics is None:
+            return self._retry.execute(key, transfer, *args)
+        started = time.perf_counter()
+        try:
+            result = self._retry.execute(key, transfer, *args)
+        except usb.core.USBError:
+            metrics.record(key, time.perf_counter() - started, False)
+            raise
+        metrics.record(key, time.perf_counter() - started)
+        return result
+
     def _set(self, cmd, value):
         """USB 명령 전송 with retry mechanism"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                self._dev.ctrl_transfer(
-                    BesCmd.READ.value,
-                    BesCmd.SET.value,
-                    cmd, value, bytearray(BesCmd.SET_DATA_LENGTH.value)
-                )
-                # 작은 지연으로 USB 안정성 향상
-                time.sleep(0.001)  # 1ms
-                return
-            except usb.core.USBError as e:
-                if attempt < max_retries - 1:
-                    time.sleep(0.01)  # 10ms 대기 후 재시도
-                    continue
-                raise e
-
-    def _get(self, cmd):
-        """USB 명령 수신 with retry mechanism"""
-        max_retries = 3
-        for attempt in range(max_retries):
+        key = set_key(cmd)
+        try:
+            self._execute(
+                key, self._transfer,
+                key, _REQUEST_SET, cmd, value, self._buffer('set', _SET_LENGTH)
+            )
+        except usb.core.USBError:
+            if self._cache is not None:
+                self._cache.invalidate_for_set(cmd)
+            raise
+        if self._cache is not None:
+            self._cache.write_through(cmd, value)
+        if cmd in _REPLAYED:
+            self._last_state[cmd] = value
+
+    def _get(self, cmd, use_cache=True):
+        """
+        USB 명령 수신 with retry mechanism
+
+        반환된 버퍼는 같은 스레드의 다음 같은 명령 호출에서 재사용되므로 바로 디코딩해야 함
+        """
+        if use_cache and self._cache is not None:
+            cached = self._cache.get(cmd)
+            if cached is not None:
+                return cached
+        
+        key = get_key(cmd)
+        try:
+            result = self._execute(
+                key, self._transfer,
+                key, _REQUEST_GET, cmd, _GET_INDEX, self._buffer(cmd, _GET_LENGTH)
+            )
+        except usb.core.USBError:
+            if self._cache is not None:
+                self._cache.invalidate(cmd)
+            raise
+        if self._cache is not None:
+            self._cache.put(cmd, result)
+        return result
+
+    def probe_command(self, request, cmd, index):
+        """재시도 / 캐시 없이 명령을 한 번만 전송 (기능 탐지용, 실패하면 USBError)"""
+        if request == _REQUEST_SET:
+            key, length = set_key(cmd), _SET_LENGTH
+        else:
+            key, length = get_key(cmd), _GET_LENGTH
+        return self._transfer(key, request, cmd, index, array.array('B', bytes(length)))
+
+    def probe_capabilities(self, cache_path=CAPABILITY_CACHE_FILE):
+        """
+        기기가 지원하는 명령 탐지 (같은 시리얼 / 펌웨어는 디스크 캐시 사용)
+
+        Args:
+            cache_path (str): 캐시 파일 경로 (None이면 캐시하지 않음)
+
+        Returns:
+            DeviceCapabilities: 탐지 결과
+        """
+        cache = CapabilityCache(cache_path) if cache_path else None
+        self._capabilities = probe_capabilities(
+            self, self._dev.idProduct, self._device_info['serial_number'], cache
+        )
+        return self._capabilities
+
+    def get_capabilities(self):
+        """기능 탐지 결과 (탐지 전이면 None)"""
+        return self._capabilities
+
+    def supports(self, feature):
+        """기능 지원 여부 (탐지 전이면 True)"""
+        return self._capabilities is None or self._capabilities.supports(feature)
+
+    def _require(self, feature):
+        """지원하지 않는 기능이면 전송 없이 UnsupportedCommandError"""
+        if self._capabilities is not None and not self._capabilities.supports(feature):
+            raise UnsupportedCommandError(feature)
+
+    def invalidate_cache(self, *cmds):
+        """섀도 레지스터 캐시 무효화 (GET 코드 지정, 인자가 없으면 전체)"""
+        if self._cache is not None:
+            self._cache.invalidate(*cmds)
+
+    def get_cache_stats(self):
+        """캐시 적중 통계 반환 (캐시 미사용 시 None)"""
+        if self._cache is None:
+            return None
+        return self._cache.get_stats()
+
+    def get_pacing_profile(self):
+        """학습된 명령 간격 반환 (설정 저장용)"""
+        return self._pacer.to_dict()
+
+    def load_pacing_profile(self, profile):
+        """저장된 명령 간격 적용"""
+        self._pacer.load(profile)
+
+    def get_retry_stats(self):
+        """전송 재시도 / 실패 / 오류 분류 통계 반환"""
+        return self._retry.get_stats()
+
+    def enable_metrics(self, enabled=True):
+        """명령별 지연 / 오류 지표 수집 켜기/끄기"""
+        if enabled and self._metrics is None:
+            self._metrics = CommandMetrics()
+        elif not enabled:
+            self._metrics = None
+
+    def get_metrics(self):
+        """
+        명령별 지연 히스토그램 요약 반환 (수집하지 않으면 None)
+
+        Returns:
+            dict: {BesCmd 이름: {count, failures, errors, retries, mean_ms, p50_ms, ...}}
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.report(self._retry.get_stats())
+
+    def dump_metrics(self, path=None):
+        """명령별 지표를 JSON 파일로 저장 (path가 없으면 표로 출력)"""
+        if self._metrics is None:
+            return None
+        return self._metrics.dump(path, self._retry.get_stats())
+
+    def reset_metrics(self):
+        """수집한 지표 초기화"""
+        if self._metrics is not None:
+            self._metrics.reset()
+
+    def reset_circuit(self):
+        """기기 분리로 열린 서킷 브레이커 닫기"""
+        self._retry.breaker.reset()
+
+    def set_disconnect_callback(self, callback):
+        """기기 분리 오류 발생 시 호출할 callback(error) 등록 (None이면 해제)"""
+        self._retry.on_device_gone = callback
+
+    def record_event(self, key, seconds, ok=True):
+        """지표 수집 중이면 전송 외 작업(재연결 등)의 소요 시간 기록"""
+        if self._metrics is not None:
+            self._metrics.record(key, seconds, ok)
+
+    def capture_state(self):
+        """현재 하드웨어 상태를 읽어 재연결 시 복원할 상태로 기록"""
+        snapshot = self.get_snapshot(ALL_FIELDS, fresh=False)
+        for reg in REPLAYED_REGISTERS:
+            # 스냅샷에 없는 레지스터(시크 임계값)는 마지막으로 쓴 값 유지
+            if reg.name not in ALL_FIELDS:
+                continue
             try:
-                result = self._dev.ctrl_transfer(
-                    BesCmd.READ.value,
-                    BesCmd.GET.value,
-                    cmd, BesCmd.GET_FM_INDEX.value,
-                    bytearray(BesCmd.GET_DATA_LENGTH.value)
-                )
-                # 작은 지연으로 USB 안정성 향상
-                time.sleep(0.001)  # 1ms
-                return result
-            except usb.core.USBError as e:
-                if attempt < max_retries - 1:
-                    time.sleep(0.01)  # 10ms 대기 후 재시도
-                    continue
-                raise e
+                self._last_state[reg.set] = reg.encode(getattr(snapshot, reg.name))
+            except ValueError:
+                # 꺼진 기기의 주파수 0 등 다시 쓸 수 없는 값은 제외
+                pass
+
+    def replay_state(self):
+        """
+        마지막으로 알려진 상태를 순서대로 다시 전송 (전원, 대역, 간격, 주파수, 모노, RDS, 볼륨, 뮤트)
+
+        Returns:
+            int: 전송한 명령 수
+        """
+        sent = 0
+        for cmd in _REPLAYED_SETS:
+            value = self._last_state.get(cmd)
+            if value is None:
+                continue
+            # 다시 연결된 기기는 꺼진 상태로 시작하므로 끄기 명령은 생략
+            if cmd in _POWER_SETS and value == _POWER_OFF:
+                continue
+            self._set(cmd, value)
+            sent += 1
+        return sent
+
+    def reopen(self, dev, replay=True):
+        """
+        분리 후 다시 나타난 같은 기기로 교체하고 마지막 상태 재적용
+
+        캐시 / 학습된 명령 간격 / 지표는 그대로 유지된다.
+
+        Args:
+            dev: 다시 찾은 usb.core.Device
+            replay (bool): 마지막 상태 재전송 여부
+
+        Returns:
+            int: 재전송한 명령 수
+        """
+        if isinstance(self._dev, RecordingDevice):
+            self.stop_trace()
+        self._dev = dev
+        self._attach()
+        self._device_info = DeviceInfo(dev)
+        self._retry.breaker.reset()
+        self.invalidate_cache()
+        # 실제로 응답하는지 확인 (실패하면 USBError)
+        self._get(BesCmd.GET_FM_IC_POWER_ON_STATE.value, use_cache=False)
+        return self.replay_state() if replay else 0
+
+    def start_trace(self, path):
+        """
+        모든 control / 인터럽트 전송을 바이너리 트레이스 파일로 기록 시작
+
+        기록한 파일은 ReplayDevice로 기기 없이 재생할 수 있다.
+        """
+        if isinstance(self._dev, RecordingDevice):
+            self.stop_trace()
+        recorder = RecordingDevice(self._dev, path)
+        self._notify_ep = recorder.wrap_endpoint(self._notify_ep)
+        self._dev = recorder
+
+    def stop_trace(self):
+        """
+        트레이스 기록 중지
+
+        Returns:
+            int: 기록한 레코드 수 (기록 중이 아니면 None)
+        """
+        recorder = self._dev
+        if not isinstance(recorder, RecordingDevice):
+            return None
+        self._dev = recorder.device
+        if self._notify_ep is not None:
+            self._notify_ep = self._notify_ep._endpoint
+        recorder.close()
+        return recorder.writer.records
 
     def _query(self):
         """USB 쿼리 명령"""
-        return self._dev.ctrl_transfer(
-            BesCmd.READ.value,
-            BesCmd.QUERY.value,
-            0, 0,
-            bytearray(12)
+        return self._execute(
+            'query', self._transfer,
+            'query', _REQUEST_QUERY, 0, 0, self._buffer('query', _QUERY_LENGTH)
         )
 
     def _wait(self, timeout=None):
         """USB 알림 대기"""
-        try:
-            resp = self._notify_ep.read(5, timeout=timeout).tobytes()
-        except usb.core.USBError as e:
-                if e.errno != 110:
+        def read():
+            try:
+                return self._notify_ep.read(5, timeout=timeout).tobytes()
+            except usb.core.USBError as e:
+                # 타임아웃은 알림 없음으로 처리 (재시도 대상 아님)
+                if classify_usb_error(e) != ERROR_TIMEOUT:
                     raise e
-        else:
-            if resp[0:3] == b'\\x01\\x00\\x08':
-                return True
+                return None
+
+        resp = self._execute('notify', read)
+        if resp is not None and resp[0:3] == b'\x01\x00\x08':
+            return True
+        return False
+
+    def wait_notify(self, timeout=None):
+        """
+        알림 엔드포인트에서 새 데이터 알림 대기
+
+        Args:
+            timeout (int): 대기 시간 (ms)
+
+        Returns:
+            bool: 새 상태가 있으면 True (이후 get_status()로 조회)
+        """
+        return bool(self._wait(timeout))
+
+    def read(self, *names, fresh=False):
+        """
+        레지스터 여러 개를 한 번의 배치로 읽기
+
+        Args:
+            names: 레지스터 이름 (registers.REGISTERS 키)
+            fresh (bool): True면 캐시를 우회해 하드웨어에서 직접 읽음
+
+        Returns:
+            dict: {이름: 값}
+        """
+        return {name: self._read(name, fresh) for name in names}
+
+    def write(self, values=None, **kwargs):
+        """
+        레지스터 여러 개를 레지스터 표 순서대로 쓰기 (전원 -> 대역 -> 간격 -> 주파수 -> ... -> 뮤트)
+
+        Args:
+            values (dict): {이름: 값} (키워드 인자로 줘도 됨)
+        """
+        values = dict(values or {}, **kwargs)
+        for name in REGISTERS:
+            if name in values:
+                self._write(name, values.pop(name))
+        if values:
+            raise KeyError(f"Unknown registers: {', '.join(values)}")
+
+    def apply(self, config, skip_unchanged=True):
+        """
+        설정 여러 개를 하나의 트랜잭션으로 적용 (I/O 워커에서 호출하면 다른 명령이 끼어들지 않음)
+
+        - 모든 값을 먼저 검증하므로 범위를 벗어난 값이 있으면 아무것도 쓰지 않음
+        - 주어진 순서를 따르되 의존 레지스터를 먼저 씀 (대역 / 간격 -> 주파수)
+        - 캐시된 값과 같은 레지스터는 전송 생략
+        - 고정 sleep 없이, 켜기 후 준비 시간이 필요한 레지스터(전원) 다음 쓰기만 남은 시간만큼 대기
+          (일반 안정화 간격은 pacing 컨트롤러가 관리)
+
+        Args:
+            config (dict): {레지스터 이름: 값}
+            skip_unchanged (bool): 캐시 값과 같으면 전송 생략
+
+        Returns:
+            ApplyReport: 단계별 전송 여부 / 대기 / 소요 시간
+        """
+        started = time.monotonic()
+        order = plan_writes(config)
+        values = {name: REGISTERS[name].encode(config[name]) for name in order}
+        report = ApplyReport()
+        ready_at = 0.0
+        for name in order:
+            reg = REGISTERS[name]
+            raw = values[name]
+            if skip_unchanged and self._cached_raw(reg) == raw:
+                report.add(name, config[name], True)
+                continue
+            waited = max(0.0, ready_at - time.monotonic())
+            if waited:
+                time.sleep(waited)
+            step_started = time.monotonic()
+            self._write_raw(reg, raw)
+            finished = time.monotonic()
+            if reg.ready and raw:
+                ready_at = finished + reg.ready
+            report.add(name, config[name], False, waited, finished - step_started)
+        report.elapsed = time.monotonic() - started
+        self.record_event('apply', report.elapsed)
+        return report
+
+    def _cached_raw(self, reg):
+        """캐시된 레지스터 값 (전송 값 기준, 없거나 만료되면 None)"""
+        if self._cache is None or reg.get is None:
+            return None
+        cached = self._cache.get(reg.get)
+        if cached is None:
+            return None
+        try:
+            return reg.encode(reg.decode(cached))
+        except ValueError:
+            return None
+
+    def _read(self, name, fresh=False):
+        """레지스터 하나 읽기 (지원하지 않는 레지스터는 전송 없이 실패)"""
+        reg = REGISTERS[name]
+        if reg.get is None:
+            raise UnsupportedCommandError(name)
+        if reg.probe:
+            self._require(name)
+        return reg.decode(self._get(reg.get, use_cache=not fresh))
+
+    def _write(self, name, value):
+        """레지스터 하나 쓰기 (범위를 벗어나면 ValueError)"""
+        reg = REGISTERS[name]
+        self._write_raw(reg, reg.encode(value))
+
+    def _write_raw(self, reg, raw):
+        """인코딩된 값 쓰기 (지원하지 않는 레지스터는 전송 없이 실패)"""
+        if reg.set is None:
+            raise UnsupportedCommandError(f"set_{reg.name}")
+        if reg.probe:
+            self._require(f"set_{reg.name}")
+        self._set(reg.set, raw)
 
     def set_power(self, b):
         """전원 설정"""
         if self.get_recording():
             return
-        # 전원 변경 시 지연 추가 (pop sound 방지)
-        if b:
-            self._set(
-                BesCmd.SET_POWER_STATE.value,
-                BesCmd.SET_FM_IC_POWER_ON.value
-            )
-        else:
-            self._set(
-                BesCmd.SET_POWER_STATE.value,
-                BesCmd.SET_FM_IC_POWER_OFF.value
-            )
-        time.sleep(0.010)  # 10ms 지연
+        # 전원 변경 후 안정화 간격은 pacing 컨트롤러가 관리 (pop sound 방지)
+        self._write('power', b)
 
     def get_power(self):
         """전원 상태 조회"""
-        if self._get(BesCmd.GET_FM_IC_POWER_ON_STATE.value)[0]:
-            return True
-        else:
-            return False
+        return self._read('power')
 
     def set_recording(self, b):
         """녹음 모드 설정"""
         if self.get_power():
             return
-        if b:
-            self._set(
-                BesCmd.SET_RECORDING_MODE.value,
-                BesCmd.SET_FM_IC_POWER_ON.value
-            )
-        else:
-            self._set(
-                BesCmd.SET_RECORDING_MODE.value,
-                BesCmd.SET_FM_IC_POWER_OFF.value
-            )
+        self._write('recording', b)
 
     def get_recording(self):
         """녹음 모드 상태 조회"""
-        if self._get(BesCmd.GET_FM_RECORDING_MODE_STATUS.value)[0]:
-            return True
-        else:
-            return False
+        return self._read('recording')
 
     def set_band(self, band):
         """주파수 대역 설정"""
         assert band in BesFM_Enums
-        self._set(BesCmd.SET_FM_BAND.value, band.value)
+        self._write('band', band)
 
     def get_band(self):
         """주파수 대역 조회"""
-        return self._get(BesCmd.GET_CURRENT_FM_BAND.value)[0]
+        return self._read('band')
 
     def set_rssi_threshold(self, value):
-        """RSSI 임계값 설정 (미구현)"""
-        raise NotImplementedError
+        """시크가 멈추는 최소 RSSI 설정"""
+        self._write('rssi_threshold', value)
 
     def get_rssi_threshold(self):
-        """RSSI 임계값 조회 (미구현)"""
-        raise NotImplementedError
+        """마지막으로 설정한 RSSI 임계값 (읽기 명령이 없으므로 설정 전이면 None)"""
+        return self._last_state.get(REGISTERS['rssi_threshold'].set)
 
     def set_channel_spacing(self, spacing):
         """채널 간격 설정"""
         assert spacing in BesFM_Enums
-        self._set(BesCmd.SET_CHAN_SPACING.value, spacing.value)
+        self._write('spacing', spacing)
 
     def get_channel_spacing(self):
         """채널 간격 조회"""
-        return self._get(BesCmd.GET_CURRENT_SPACING.value)[0]
+        return self._read('spacing')
 
     def set_mute(self, b):
         """음소거 설정"""
-        # 뮤트 변경 시 지연 추가 (pop sound 방지)
-        if b:
-            self._set(BesCmd.SET_MUTE.value, 1)
-        else:
-            self._set(BesCmd.SET_MUTE.value, 0)
-        time.sleep(0.003)  # 3ms 지연
+        # 뮤트 변경 후 안정화 간격은 pacing 컨트롤러가 관리 (pop sound 방지)
+        self._write('mute', b)
 
     def get_mute(self):
         """음소거 상태 조회"""
-        if self._get(BesCmd.GET_MUTE_STATE.value)[0]:
-            return True
-        else:
-            return False
+        return self._read('mute')
 
     def set_volume(self, volume):
         """볼륨 설정 (0-15)"""
-        assert 0 <= volume <= 15
-        # 볼륨 변경 시 약간의 지연 추가 (pop sound 방지)
-        self._set(BesCmd.SET_VOLUME.value, volume)
-        time.sleep(0.002)  # 2ms 지연
+        # 볼륨 변경 후 안정화 간격은 pacing 컨트롤러가 관리 (pop sound 방지)
+        self._write('volume', volume)
 
     def get_volume(self):
         """볼륨 조회"""
-        return self._get(BesCmd.GET_CURRENT_VOLUME.value)[0]
+        return self._read('volume')
 
     def set_mono(self, b):
         """모노 모드 설정"""
-        if b:
-            self._set(BesCmd.SET_MONO_MODE.value, 1)
-        else:
-            self._set(BesCmd.SET_MONO_MODE.value, 0)
+        self._write('mono', b)
 
     def get_mono(self):
         """모노 모드 상태 조회"""
-        if self._get(BesCmd.GET_FORCED_MONO_STATE.value)[0]:
-            return True
-        else:
-            return False
+        return self._read('mono')
 
     def _set_seek(self, seek):
         """시크 명령 설정"""
@@ -308,58 +681,195 @@ class BesFM:
 
     def set_channel(self, freq):
         """주파수 설정"""
-        # 주파수 변경 시 지연 추가 (pop sound 방지)
-        self._set(
-            BesCmd.SET_CHANNEL.value, int(freq * 100)
-            )
-        time.sleep(0.005)  # 5ms 지연
+        # 주파수 변경 후 안정화 간격은 pacing 컨트롤러가 관리 (pop sound 방지)
+        self._write('channel', freq)
 
     def get_channel(self):
         """현재 주파수 조회"""
-        return struct.unpack('<H',self._get(BesCmd.GET_CURRENT_CHANNEL.value))[0] / 100
+        return self._read('channel')
+
+    def tune(self, freq, timeout=0.5):
+        """
+        주파수 설정 후 기기의 튜닝 완료 상태로 확정 (확인용 get_channel 읽기 없음)
+
+        기다리는 동안 온 RDS 상태는 버린다. 알림 디스패처가 동작 중이면 알림을 나눠 받지 않도록
+        BesFMEventDispatcher.tune()을 사용해야 한다.
+
+        Returns:
+            dict: {'success', 'freq', 'strength', 'seconds'} (timeout 안에 튜닝 상태가 없으면 TimeoutError)
+        """
+        started = time.monotonic()
+        self._write('channel', freq)
+        # 이전 튜닝의 늦은 상태는 건너뜀 (실패 상태는 원래 주파수를 담고 있음)
+        return self._await_status(
+            'tune', started, timeout,
+            lambda status: not status['success'] or abs(status['freq'] - freq) < 0.005
+        )
+
+    def _await_status(self, kind, started, timeout, accept=None):
+        """
+        kind('tune' / 'seek') 완료 상태를 기다려 반환하고 지연 기록 (tune() / seek() 공용)
+
+        알림 엔드포인트가 있으면 알림을 기다려 상태를 읽고, 없으면 간격을 늘려 가며 상태를 조회한다.
+        accept(status)가 False인 상태와 다른 종류의 상태는 버린다.
+        """
+        deadline = started + timeout
+        interval = _TUNE_POLL_INITIAL
+        polled = False
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.record_event(kind, time.monotonic() - started, False)
+                raise TimeoutError(f"No {kind} status within {timeout:.2f} s")
+            if self._notify_ep is not None:
+                if not self._wait(max(1, int(remaining * 1000))):
+                    continue
+            elif polled:
+                # 제어 전송을 연달아 보내지 않도록 조회 사이에 대기
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 2, _TUNE_POLL_MAX)
+            polled = True
+            status = self.get_status()
+            if (isinstance(status, dict) and status['type'] == kind
+                    and (accept is None or accept(status))):
+                break
+        seconds = time.monotonic() - started
+        self.record_event(kind, seconds, status['success'])
+        return dict(status, seconds=seconds)
+
+    def seek(self, up=True, timeout=SEEK_TIMEOUT):
+        """
+        시크를 한 번 시작하고 기기의 시크 완료 상태로 확정
+
+        알림 디스패처가 동작 중이면 BesFMEventDispatcher.seek()을 사용해야 한다.
+
+        Returns:
+            dict: {'success', 'freq', 'strength', 'seconds'} (timeout 안에 시크 상태가 없으면 TimeoutError)
+        """
+        started = time.monotonic()
+        self._set_seek(BesCmd.SET_SEEK_UP if up else BesCmd.SET_SEEK_DOWN)
+        return self._await_status('seek', started, timeout)
+
+    def seek_station(self, up=True, attempts=None, calibration=None):
+        """
+        주파수가 바뀔 때까지 시크를 반복 (GUI 스캔 버튼) - 워커 스레드에서 호출
+
+        calibration(SeekCalibration)을 주면 그 임계값보다 약한 곳은 건너뛰고 시크 횟수도 그에 맞춘다.
+        알림 디스패처가 동작 중이면 BesFMEventDispatcher.seek_station()을 사용해야 한다.
+
+        Returns:
+            dict: {'success', 'freq', 'strength', 'attempts'} (success는 주파수가 바뀌었는지)
+        """
+        started = time.monotonic()
+        try:
+            result = seek_station(self, up, attempts, calibration=calibration)
+        except Exception:
+            self.record_event('seek_station', time.monotonic() - started, False)
+            raise
+        self.record_event('seek_station', time.monotonic() - started, result['success'])
+        return result
+
+    def get_rssi(self):
+        """현재 주파수의 신호 강도 조회"""
+        return self._read('rssi')
+
+    def get_protocol_version(self):
+        """FM 프로토콜(펌웨어) 버전 조회"""
+        return self._read('protocol_version')
+
+    def get_ic_info(self):
+        """FM IC 정보 조회"""
+        return self._read('ic_info')
+
+    def get_ic_number(self):
+        """FM IC 번호 조회"""
+        return self._read('ic_number')
 
     def set_rds(self, b):
         """RDS 설정"""
-        if b:
-            self._set(BesCmd.SET_RDS.value, 1)
-        else:
-            self._set(BesCmd.SET_RDS.value, 0)
+        self._write('rds', b)
 
     def get_rds(self):
         """RDS 상태 조회"""
-        if self._get(BesCmd.GET_RDS_STATUS.value)[0]:
-            return True
-        else:
-            return False
+        return self._read('rds')
 
     def set_dc_threshold(self, value):
-        """DC 임계값 설정 (미구현)"""
-        raise NotImplementedError
+        """시크 DC 임계값 설정"""
+        self._write('dc_threshold', value)
 
     def get_dc_threshold(self):
-        """DC 임계값 조회 (미구현)"""
-        raise NotImplementedError
+        """시크 DC 임계값 조회"""
+        return self._read('dc_threshold')
 
     def set_spike_threshold(self, value):
-        """Spike 임계값 설정 (미구현)"""
-        raise NotImplementedError
+        """시크 spike 임계값 설정"""
+        self._write('spike_threshold', value)
 
     def get_spike_threshold(self):
-        """Spike 임계값 조회 (미구현)"""
-        raise NotImplementedError
+        """시크 spike 임계값 조회"""
+        return self._read('spike_threshold')
+
+    def calibrate_seek(self, samples=SURVEY_SAMPLES):
+        """
+        대역 전체의 잡음 바닥을 측정해 헛멈춤이 가장 적은 시크 임계값을 골라 적용
+
+        측정 중에는 뮤트하고 끝나면 원래 주파수로 돌아온다. 대역 전체를 훑으므로 몇 초 걸린다.
+        채널마다 tune()으로 튜닝 완료를 확인하므로 알림 디스패처가 동작 중이면
+        BesFMEventDispatcher.calibrate_seek()을 사용해야 한다.
+
+        Returns:
+            SeekCalibration: 보정 결과 (기기 / 위치별로 저장해 다음 연결 때 apply(thresholds()))
+        """
+        started = time.monotonic()
+        try:
+            calibration = calibrate(self, samples)
+        except Exception:
+            self.record_event('calibrate_seek', time.monotonic() - started, False)
+            raise
+        self.record_event('calibrate_seek', time.monotonic() - started)
+        return calibration
+
+    def get_snapshot(self, fields=None, fresh=True, previous=None):
+        """
+        여러 상태 레지스터를 한 번의 배치로 읽어 불변 스냅샷 반환
+
+        Args:
+            fields (tuple): 읽을 필드 (기본: power, recording, channel, volume, mute)
+            fresh (bool): True면 캐시를 우회해 하드웨어에서 직접 읽음
+            previous (BesFMSnapshot): 주어지면 snapshot.changed에 바뀐 필드 기록
+
+        Returns:
+            BesFMSnapshot: 상태 스냅샷
+        """
+        values = {}
+        latencies = {}
+        timestamp = time.monotonic()
+        for field in fields or DEFAULT_FIELDS:
+            reg = REGISTERS[field]
+            started = time.perf_counter()
+            raw = self._get(reg.get, use_cache=not fresh)
+            latencies[field] = time.perf_counter() - started
+            values[field] = reg.decode(raw)
+        return BesFMSnapshot(values, timestamp, latencies, previous)
 
     def get_status(self):
         """하드웨어 상태 조회"""
         res = self._query()
-        if res[0] == 0:
-            success, freq, strength = struct.unpack('<?HB', res[1:5])
-            return {'type': 'seek', 'success':success, 'freq':freq/100, 'strength':strength}
-        elif res[0] == 1:
-            success, freq, strength = struct.unpack('<?HB', res[1:5])
-            return {'type': 'tune', 'success':success, 'freq':freq/100, 'strength':strength}
-        elif res[0] == 2:
-            error, strength = struct.unpack('<BB', res[1:3])
-            rds = res[3:-1].tobytes()
-            return {'type': 'rds', 'error':error, 'strength':strength, 'data':rds[1::-1]+rds[3:1:-1]+rds[5:3:-1]+rds[7:5:-1]}
+        kind = res[0]
+        if kind == 0 or kind == 1:
+            success, freq, strength = _SEEK_TUNE.unpack_from(res, 1)
+            self._update_cached_channel(freq)
+            return {'type': 'seek' if kind == 0 else 'tune',
+                    'success': success, 'freq': freq / 100, 'strength': strength}
+        elif kind == 2:
+            # RDS 블록 4개는 16비트 단위로 바이트 순서가 뒤집혀 도착
+            data = _RDS_WORDS_BE.pack(*_RDS_WORDS_LE.unpack_from(res, 3))
+            return {'type': 'rds', 'error': res[1], 'strength': res[2], 'data': data}
         else:
-            return res
+            return res[:]
+
+    def _update_cached_channel(self, freq):
+        """시크/튠 결과로 캐시된 주파수 / 재연결 시 복원할 주파수 갱신"""
+        self._last_state[_SET_CHANNEL] = freq
+        if self._cache is not None:
+            self._cache.put(_GET_CHANNEL, _U16.pack(freq))
@@ -0,0 +1,311 @@
+"""
+BesFM 시크 임계값 보정 - 대역 전체의 신호 강도를 측정해 잡음 바닥을 구하고 헛멈춤이 가장 적은 임계값 선택
+
+스캔 버튼의 반복 시크(seek_station)도 여기서 정의한다.
+"""
+import math
+import statistics
+import time
+
+from .log import get_logger
+from .registers import BAND_LIMITS, SPACING_STEPS
+
+
+_log = get_logger('calibration')
+
+
+# 채널마다 읽는 RSSI 표본 수 (잡음 순간값으로 멈추는지 보려면 2개 이상)
+SURVEY_SAMPLES = 3
+
+# 방송국으로 볼 최소 신호 (잡음 바닥 + max(잡음 폭 * 6, 10))
+_STATION_SPREAD = 6
+_STATION_MARGIN = 10
+
+# 방송국은 좌우 이만큼의 채널(간격 단위) 안에서 가장 강한 채널
+_PEAK_WINDOW = 2
+
+# 스캔 한 번에 허용하는 시크 횟수 (주파수가 그대로면 다시 시크) - 보정 결과가 있으면 seek_attempts()
+SEEK_ATTEMPTS = 10
+
+# 보정 결과로 시크 횟수를 정할 때 헛멈춤만 이어져 방송국에 닿지 못할 확률의 상한
+_SEEK_MISS_PROBABILITY = 0.01
+
+# 시크 한 번의 완료 대기 (초) - 첫 시도는 _SEEK_WAIT_INITIAL부터 시도마다 늘려 최대 SEEK_TIMEOUT
+SEEK_TIMEOUT = 2.0
+_SEEK_WAIT_INITIAL = 0.5
+_SEEK_WAIT_STEP = 0.2
+
+# 다시 시크하기 전 대기 (초)
+_SEEK_RETRY_DELAY = 0.1
+
+# 이만큼(MHz) 이상 움직여야 시크가 주파수를 바꾼 것으로 봄
+_SEEK_MIN_STEP = 0.05
+
+
+class SeekCalibration:
+    """보정 결과 (기기 / 위치별로 저장)"""
+
+    def __init__(self, rssi_threshold, dc_threshold=None, spike_threshold=None, noise_floor=0.0,
+                 noise_spread=0.0, stations=(), false_stops_per_seek=0.0, band=0, spacing=1,
+                 calibrated_at=None):
+        """
+        Args:
+            rssi_threshold (int): 시크가 멈추는 최소 RSSI
+            dc_threshold (int): 보정 시점의 DC 임계값 (지원하지 않으면 None)
+            spike_threshold (int): 보정 시점의 spike 임계값 (지원하지 않으면 None)
+            noise_floor (float): 잡음 바닥 (빈 채널 RSSI 중앙값)
+            noise_spread (float): 잡음 폭 (빈 채널 RSSI의 MAD 기반 표준편차 추정)
+            stations (list): 찾은 방송국 주파수 (MHz)
+            false_stops_per_seek (float): 측정한 대역에서 시크 1회가 방송국이 아닌 곳에서 멈출 비율
+            band / spacing (int): 측정한 대역 / 채널 간격 레지스터 값
+            calibrated_at (float): time.time()
+        """
+        self.rssi_threshold = rssi_threshold
+        self.dc_threshold = dc_threshold
+        self.spike_threshold = spike_threshold
+        self.noise_floor = noise_floor
+        self.noise_spread = noise_spread
+        self.stations = list(stations)
+        self.false_stops_per_seek = false_stops_per_seek
+        self.band = band
+        self.spacing = spacing
+        self.calibrated_at = time.time() if calibrated_at is None else calibrated_at
+
+    def thresholds(self):
+        """기기에 쓸 임계값 ({레지스터 이름: 값}, 알 수 없는 값은 제외) - BesFM.apply()에 전달"""
+        values = {'rssi_threshold': self.rssi_threshold, 'dc_threshold': self.dc_threshold,
+                  'spike_threshold': self.spike_threshold}
+        return {name: value for name, value in values.items() if value is not None}
+
+    def to_dict(self):
+        return {
+            'rssi_threshold': self.rssi_threshold,
+            'dc_threshold': self.dc_threshold,
+            'spike_threshold': self.spike_threshold,
+            'noise_floor': round(self.noise_floor, 2),
+            'noise_spread': round(self.noise_spread, 2),
+            'stations': self.stations,
+            'false_stops_per_seek': round(self.false_stops_per_seek, 4),
+            'band': self.band,
+            'spacing': self.spacing,
+            'calibrated_at': self.calibrated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def __repr__(self):
+        return (f"SeekCalibration(rssi_threshold={self.rssi_threshold}, "
+                f"noise_floor={self.noise_floor:.1f}, stations={len(self.stations)}, "
+                f"false_stops_per_seek={self.false_stops_per_seek:.2f})")
+
+
+def survey_band(fm, band, spacing, samples=SURVEY_SAMPLES, tune=None):
+    """
+    대역의 모든 채널에서 RSSI 측정
+
+    채널마다 튜닝 완료 상태를 기다린 뒤 표본을 읽는다 (set_channel 직후에는 이전 채널이나
+    튜닝 중의 RSSI가 읽힘).
+
+    Args:
+        tune: 주파수(MHz)를 받아 튜닝 완료까지 기다리는 함수 (기본 fm.tune)
+
+    Returns:
+        dict: {채널 (10kHz 단위): [RSSI 표본]}
+    """
+    if tune is None:
+        tune = fm.tune
+    low, high = BAND_LIMITS.get(band, BAND_LIMITS[0])
+    step = SPACING_STEPS.get(spacing, 10)
+    survey = {}
+    for channel in range(low, high + 1, step):
+        try:
+            tune(channel / 100)
+        except TimeoutError:
+            _log.debug("No tune status for %.2f MHz, sampling anyway", channel / 100)
+        survey[channel] = [fm.get_rssi() for _ in range(samples)]
+    return survey
+
+
+def estimate_noise(survey):
+    """
+    잡음 바닥 / 잡음 폭 추정
+
+    대부분의 채널은 비어 있으므로 채널별 평균 RSSI의 중앙값을 잡음 바닥으로,
+    중앙값 절대 편차(MAD)를 표준편차로 환산한 값을 잡음 폭으로 쓴다.
+    """
+    levels = [statistics.mean(samples) for samples in survey.values()]
+    floor = statistics.median(levels)
+    spread = statistics.median(abs(level - floor) for level in levels) * 1.4826
+    return floor, max(spread, 1.0)
+
+
+def find_stations(survey, floor, spread):
+    """방송국 채널 (잡음보다 충분히 강하고 주변 채널 중 가장 강한 채널)"""
+    channels = sorted(survey)
+    levels = [statistics.mean(survey[channel]) for channel in channels]
+    minimum = floor + max(spread * _STATION_SPREAD, _STATION_MARGIN)
+    stations = []
+    for i, level in enumerate(levels):
+        if level < minimum:
+            continue
+        window = levels[max(0, i - _PEAK_WINDOW):i + _PEAK_WINDOW + 1]
+        # 같은 세기가 이어지면 첫 채널만
+        if level >= max(window) and (i == 0 or levels[i - 1] < level or levels[i - 1] < minimum):
+            stations.append(channels[i])
+    return stations
+
+
+def count_stops(survey, stations, threshold):
+    """
+    임계값으로 대역을 한 바퀴 시크할 때의 결과
+
+    채널의 RSSI 표본 중 하나라도 임계값 이상이면 그 채널에서 멈출 수 있다고 본다
+    (시크는 순간값으로 판단하므로 잡음 최대값 기준).
+
+    Returns:
+        tuple: (방송국이 아닌 곳에서 멈추는 수, 놓치는 방송국 수)
+    """
+    station_set = set(stations)
+    false_stops = sum(1 for channel, samples in survey.items()
+                      if channel not in station_set and max(samples) >= threshold)
+    missed = sum(1 for channel in stations if statistics.mean(survey[channel]) < threshold)
+    return false_stops, missed
+
+
+def choose_threshold(survey, stations, floor, spread):
+    """
+    헛멈춤 + 놓친 방송국 수가 가장 적은 RSSI 임계값 (같으면 약한 방송국을 살리도록 낮은 값)
+
+    Returns:
+        tuple: (임계값, 시크 1회당 헛멈춤 비율)
+    """
+    highest = max(max(samples) for samples in survey.values())
+    best = None
+    for threshold in range(int(floor + spread) + 1, int(highest) + 2):
+        false_stops, missed = count_stops(survey, stations, threshold)
+        cost = false_stops + missed
+        if best is None or cost < best[0]:
+            seeks = len(stations) - missed + false_stops
+            best = (cost, threshold, false_stops / seeks if seeks else 0.0)
+    if best is None:
+        return int(floor + spread) + 1, 0.0
+    return best[1], best[2]
+
+
+def calibrate(fm, samples=SURVEY_SAMPLES, tune=None):
+    """
+    시크 임계값 보정 - 워커 스레드에서 호출 (알림 디스패처가 동작 중이면
+    BesFMEventDispatcher.calibrate_seek()이 워커 밖에서 디스패처로 튜닝을 확인하며 호출)
+
+    측정하는 동안 뮤트하고, 끝나면 원래 주파수 / 뮤트 상태로 돌아간다. 선택한 RSSI 임계값은 바로
+    기기에 쓴다. 기기는 DC / spike 측정값을 채널별로 알려 주지 않으므로 두 임계값은 현재 값을
+    함께 기록해 같은 프로필을 복원할 때 다시 쓰도록 한다.
+
+    Args:
+        fm (BesFM): 전원이 켜진 기기
+        samples (int): 채널별 RSSI 표본 수
+        tune: 주파수를 받아 튜닝 완료까지 기다리는 함수 (기본 fm.tune)
+
+    Returns:
+        SeekCalibration: 보정 결과
+    """
+    state = fm.read('power', 'band', 'spacing', 'channel', 'mute', fresh=True)
+    if not state['power']:
+        raise RuntimeError("FM radio must be powered on to calibrate seek thresholds")
+    fm.apply({'mute': True})
+    try:
+        survey = survey_band(fm, state['band'], state['spacing'], samples, tune)
+    finally:
+        fm.apply({'channel': state['channel'], 'mute': state['mute']})
+
+    floor, spread = estimate_noise(survey)
+    stations = find_stations(survey, floor, spread)
+    threshold, false_rate = choose_threshold(survey, stations, floor, spread)
+    current = {}
+    for name in ('dc_threshold', 'spike_threshold'):
+        if fm.supports(name):
+            current[name] = fm.read(name)[name]
+    calibration = SeekCalibration(
+        threshold, current.get('dc_threshold'), current.get('spike_threshold'),
+        floor, spread, [channel / 100 for channel in stations], false_rate,
+        state['band'], state['spacing'],
+    )
+    fm.apply({name: value for name, value in calibration.thresholds().items()
+              if fm.supports(f'set_{name}')})
+    return calibration
+
+
+def seek_attempts(calibration=None):
+    """
+    스캔 한 번의 최대 시크 횟수
+
+    보정 결과가 있으면 시크 1회당 헛멈춤 비율로 헛멈춤만 이어질 확률이 _SEEK_MISS_PROBABILITY
+    아래가 되는 횟수에 제자리 재시도 1회를 더한다 (SEEK_ATTEMPTS를 넘지 않음).
+    """
+    if calibration is None:
+        return SEEK_ATTEMPTS
+    rate = calibration.false_stops_per_seek
+    if rate >= 1.0:
+        return SEEK_ATTEMPTS
+    needed = 1 if rate <= 0.0 else math.ceil(math.log(_SEEK_MISS_PROBABILITY) / math.log(rate))
+    return max(2, min(SEEK_ATTEMPTS, needed + 1))
+
+
+def _weak_stop(status, calibration):
+    """보정한 임계값보다 약한 신호에서 멈췄는지 (알고 있는 방송국 / 세기를 모르면 False)"""
+    strength = status.get('strength')
+    if calibration is None or strength is None:
+        return False
+    if any(abs(status['freq'] - station) <= _SEEK_MIN_STEP for station in calibration.stations):
+        return False
+    return strength < calibration.rssi_threshold
+
+
+def seek_station(fm, up=True, attempts=None, seek=None, calibration=None):
+    """
+    주파수가 바뀔 때까지 시크 반복 (제자리에서 멈추면 완료 대기 시간을 늘려 다시 시크)
+
+    보정 결과가 있으면 그 RSSI 임계값보다 약한 곳(헛멈춤)에서 멈춘 경우 거기서부터 다시 시크하고,
+    시크 횟수는 보정한 헛멈춤 비율로 정한다 (seek_attempts).
+
+    Args:
+        fm (BesFM): 대상 기기 (시작 주파수 / 시크 상태가 없을 때의 주파수 조회)
+        up (bool): 위쪽으로 시크
+        attempts (int): 최대 시크 횟수 (None이면 seek_attempts(calibration))
+        seek: (up, timeout)을 받아 시크 완료 상태를 돌려주는 함수 (기본 fm.seek)
+        calibration (SeekCalibration): 현재 기기 / 위치의 보정 결과 (없으면 임계값 확인 없음)
+
+    Returns:
+        dict: {'success', 'freq', 'strength', 'attempts'} (success는 주파수가 바뀌었는지)
+    """
+    if seek is None:
+        seek = fm.seek
+    if attempts is None:
+        attempts = seek_attempts(calibration)
+    start = position = fm.get_channel()
+    status = {'success': False, 'freq': start, 'strength': None}
+    for attempt in range(attempts):
+        timeout = min(_SEEK_WAIT_INITIAL + attempt * _SEEK_WAIT_STEP, SEEK_TIMEOUT)
+        try:
+            status = seek(up, timeout)
+        except TimeoutError:
+            status = {'success': False, 'freq': fm.get_channel(), 'strength': None}
+        if abs(status['freq'] - position) > _SEEK_MIN_STEP:
+            if not _weak_stop(status, calibration):
+                _log.info("Seek moved from %.1f to %.1f MHz", start, status['freq'])
+                return dict(status, success=abs(status['freq'] - start) > _SEEK_MIN_STEP,
+                            attempts=attempt + 1)
+            # 헛멈춤 - 제자리가 아니므로 기다리지 않고 이어서 시크
+            _log.debug("Seek stopped on weak signal at %.1f MHz (RSSI %d < %d)",
+                       status['freq'], status['strength'], calibration.rssi_threshold)
+            position = status['freq']
+            continue
+        _log.debug("Seek attempt %d stayed at %.1f MHz", attempt + 1, status['freq'])
+        if attempt < attempts - 1:
+            time.sleep(_SEEK_RETRY_DELAY)
+    moved = abs(status['freq'] - start) > _SEEK_MIN_STEP
+    _log.warning("Seek found no station from %.1f MHz after %d attempts (now %.1f MHz)",
+                 start, attempts, status['freq'])
+    return dict(status, success=moved, attempts=attempts)
@@ -0,0 +1,203 @@
+"""
+BesFM 기능 탐지 - 기기(제품 ID / 펌웨어)가 실제로 지원하는 명령을 한 번만 확인하고 디스크에 캐시
+"""
+import json
+import os
+import struct
+import threading
+
+import usb.core
+
+from .besfm_enums import BesCmd
+from .log import get_logger
+from .registers import REGISTERS
+from .retry_policy import (classify_usb_error, ERROR_DEVICE_GONE, ERROR_FATAL, ERROR_STALL,
+                           ERROR_TIMEOUT)
+
+
+_log = get_logger('capabilities')
+
+# 기능 탐지 결과 캐시 파일 (시리얼 번호 + 펌웨어별)
+CAPABILITY_CACHE_FILE = 'besfm_capabilities.json'
+_CACHE_FORMAT = 1
+
+# 읽기 기능 -> GET 코드 (레지스터 표에서 연결 시 확인하도록 표시된 레지스터)
+READ_FEATURES = {reg.name: reg.get for reg in REGISTERS.values()
+                 if reg.probe and reg.get is not None}
+
+# 쓰기 기능 -> (SET 코드, 현재 값을 읽을 읽기 기능)
+# 읽은 값을 그대로 다시 써서 확인하므로 기기 상태는 바뀌지 않는다.
+WRITE_FEATURES = {f'set_{reg.name}': (reg.set, reg.name) for reg in REGISTERS.values()
+                  if reg.probe and reg.get is not None and reg.set is not None}
+
+_REQUEST_GET = BesCmd.GET.value
+_REQUEST_SET = BesCmd.SET.value
+_GET_INDEX = BesCmd.GET_FM_INDEX.value
+_U16 = struct.Struct('<H')
+
+
+class UnsupportedCommandError(NotImplementedError):
+    """기기가 지원하지 않는 명령 (전송하지 않고 바로 실패)"""
+
+    def __init__(self, feature):
+        super().__init__(f"FM radio device does not support '{feature}'")
+        self.feature = feature
+
+
+class DeviceCapabilities:
+    """기기별 기능 지원 여부"""
+
+    def __init__(self, product_id, firmware, features, complete=True):
+        """
+        Args:
+            product_id (int): USB 제품 ID
+            firmware (str): 펌웨어 식별자 (프로토콜 버전, 읽지 못하면 'unknown')
+            features (dict): {기능 이름: 지원 여부}
+            complete (bool): 일시적 오류 없이 모든 기능을 확인했는지 여부 (False면 캐시하지 않음)
+        """
+        self.product_id = product_id
+        self.firmware = firmware
+        self.features = dict(features)
+        self.complete = complete
+
+    def supports(self, feature):
+        """기능 지원 여부 (확인하지 않은 기능은 지원한다고 가정)"""
+        return self.features.get(feature, True)
+
+    def unsupported(self):
+        """지원하지 않는 기능 목록"""
+        return sorted(name for name, ok in self.features.items() if not ok)
+
+    def to_dict(self):
+        return {'product_id': self.product_id, 'firmware': self.firmware,
+                'features': self.features}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['product_id'], data['firmware'], data['features'])
+
+    def __repr__(self):
+        return (f"DeviceCapabilities(0x{self.product_id:04x}, firmware={self.firmware!r}, "
+                f"unsupported={self.unsupported()})")
+
+
+class CapabilityCache:
+    """기능 탐지 결과 JSON 캐시"""
+
+    def __init__(self, path=CAPABILITY_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('format') == _CACHE_FORMAT:
+                    return data
+        except Exception as e:
+            _log.warning("Error loading capability cache: %s", e)
+        return {'format': _CACHE_FORMAT, 'devices': {}}
+
+    def get(self, key):
+        """캐시된 DeviceCapabilities (없으면 None)"""
+        with self._lock:
+            entry = self._load()['devices'].get(key)
+        if entry is None:
+            return None
+        try:
+            return DeviceCapabilities.from_dict(entry)
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, key, capabilities):
+        """탐지 결과 저장"""
+        with self._lock:
+            data = self._load()
+            data['devices'][key] = capabilities.to_dict()
+            try:
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+            except Exception as e:
+                _log.warning("Error saving capability cache: %s", e)
+
+
+def cache_key(product_id, serial_number, firmware):
+    """캐시 키 (제품 ID / 시리얼 번호 / 펌웨어)"""
+    return f"{product_id:04x}/{serial_number or '-'}/{firmware}"
+
+
+def _probe(fm, request, cmd, index):
+    """
+    명령 한 번 전송해 지원 여부 확인
+
+    Returns:
+        tuple: (지원 여부 - 일시적 오류로 알 수 없으면 None, 응답 버퍼)
+    """
+    try:
+        return True, fm.probe_command(request, cmd, index)
+    except usb.core.USBError as e:
+        kind = classify_usb_error(e)
+        if kind == ERROR_DEVICE_GONE:
+            raise
+        if kind in (ERROR_STALL, ERROR_FATAL, ERROR_TIMEOUT):
+            # 지원하지 않는 명령은 stall (또는 응답 없음)
+            return False, None
+        return None, None
+
+
+def probe_capabilities(fm, product_id, serial_number, cache=None):
+    """
+    기기 기능 탐지 - 워커 스레드에서 호출
+
+    펌웨어 식별을 위해 프로토콜 버전만 읽고, 같은 기기 / 펌웨어의 캐시가 있으면 나머지는 생략한다.
+    각 명령은 재시도 없이 한 번만 보내므로 지원하지 않는 명령(stall)에 재시도 전송을 쓰지 않는다.
+
+    Args:
+        fm (BesFM): 대상 기기
+        product_id (int): USB 제품 ID
+        serial_number (str): 시리얼 번호 (없으면 None)
+        cache (CapabilityCache): 결과 캐시 (없으면 캐시하지 않음)
+
+    Returns:
+        DeviceCapabilities: 탐지 결과
+    """
+    features = {}
+    values = {}
+
+    def read(feature):
+        ok, raw = _probe(fm, _REQUEST_GET, READ_FEATURES[feature], _GET_INDEX)
+        if ok is not None:
+            features[feature] = ok
+        if ok:
+            values[feature] = _U16.unpack_from(raw)[0]
+        return ok
+
+    ok = read('protocol_version')
+    firmware = f"{values['protocol_version']:04x}" if ok else 'unknown'
+    complete = ok is not None
+
+    key = cache_key(product_id, serial_number, firmware)
+    if cache is not None and complete:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    for feature in READ_FEATURES:
+        if feature not in features and read(feature) is None:
+            complete = False
+
+    for feature, (cmd, read_feature) in WRITE_FEATURES.items():
+        if read_feature not in values:
+            # 현재 값을 모르면 상태를 바꾸지 않고 확인할 방법이 없음
+            continue
+        ok, _ = _probe(fm, _REQUEST_SET, cmd, values[read_feature])
+        if ok is None:
+            complete = False
+        else:
+            features[feature] = ok
+
+    capabilities = DeviceCapabilities(product_id, firmware, features, complete)
+    if cache is not None and complete:
+        cache.put(key, capabilities)
+    return capabilities
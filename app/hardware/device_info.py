@@ -0,0 +1,134 @@
+"""
+BesFM 기기 정보 레코드 - 문자열 디스크립터(시리얼 / 제조사 / 제품명)는 백그라운드에서 한 번만 읽음
+"""
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 문자열 디스크립터 필드 (각각 GET_DESCRIPTOR control transfer 한 번)
+STRING_FIELDS = ('serial_number', 'manufacturer', 'product')
+
+# 디스크립터가 아직 없을 때 값을 요구하면 기다리는 최대 시간 (초)
+DESCRIPTOR_WAIT = 3.0
+
+_executor = None
+_futures = {}  # (bus, address, vendor, product) -> Future({필드: 값})
+_lock = threading.Lock()
+
+
+def _physical_key(device):
+    """연결 단위로 유일한 기기 키 (다시 꽂으면 주소가 바뀌므로 새로 읽음)"""
+    return (device.bus, device.address, device.idVendor, device.idProduct)
+
+
+def _read_descriptors(device):
+    """워커 스레드에서 실행 - 읽지 못한 필드는 None"""
+    values = {}
+    for field in STRING_FIELDS:
+        try:
+            values[field] = getattr(device, field)
+        except Exception:
+            # 느린 허브에서의 타임아웃 / 권한 / langid 오류는 값 없음으로 처리
+            values[field] = None
+    return values
+
+
+def load_descriptors(device):
+    """
+    기기의 문자열 디스크립터 읽기를 (처음 한 번만) 백그라운드로 시작
+
+    Returns:
+        concurrent.futures.Future: {필드: 값} 결과
+    """
+    global _executor
+    key = _physical_key(device)
+    with _lock:
+        future = _futures.get(key)
+        if future is None:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=2,
+                                               thread_name_prefix="BesFMDescriptors")
+            future = _futures[key] = _executor.submit(_read_descriptors, device)
+        return future
+
+
+def forget_device(device):
+    """분리된 기기의 디스크립터 캐시 제거"""
+    with _lock:
+        _futures.pop(_physical_key(device), None)
+
+
+class DeviceInfo(Mapping):
+    """
+    find_all_devices 항목 / BesFM.get_device_info()용 기기 정보
+
+    VID / PID / bus / address는 버스 스캔 결과로 바로 채우고, 문자열 디스크립터는
+    만들 때 백그라운드로 읽기 시작한다. dict처럼 쓸 수 있으며 아직 읽지 못한
+    문자열 필드에 접근하면 그때만 (최대 DESCRIPTOR_WAIT초) 기다린다.
+    기다리지 않으려면 peek()을 사용.
+    """
+
+    def __init__(self, device, defaults=None, description=None):
+        """
+        Args:
+            device: usb.core.Device (또는 같은 속성을 가진 가상 기기)
+            defaults (dict): 문자열 필드를 읽지 못했을 때 쓸 값 (예: {'manufacturer': 'Samsung'})
+            description (str): 목록 표시용 설명
+        """
+        self._values = {
+            'device': device,
+            'vendor_id': device.idVendor,
+            'product_id': device.idProduct,
+            'bus': device.bus,
+            'address': device.address,
+        }
+        if description is not None:
+            self._values['description'] = description
+        self._defaults = defaults or {}
+        self._future = load_descriptors(device)
+
+    def __getitem__(self, key):
+        if key in STRING_FIELDS:
+            return self._string(key, DESCRIPTOR_WAIT)
+        return self._values[key]
+
+    def __iter__(self):
+        yield from self._values
+        yield from STRING_FIELDS
+
+    def __len__(self):
+        return len(self._values) + len(STRING_FIELDS)
+
+    def _string(self, field, timeout):
+        try:
+            value = self._future.result(timeout)[field]
+        except Exception:
+            value = None
+        return value or self._defaults.get(field, value)
+
+    def is_loaded(self):
+        """문자열 디스크립터를 모두 읽었는지 여부"""
+        return self._future.done()
+
+    def peek(self, field, default=None):
+        """기다리지 않고 값 조회 (문자열 디스크립터를 아직 못 읽었으면 default)"""
+        if field in STRING_FIELDS:
+            if not self._future.done():
+                return default
+            value = self._string(field, 0)
+            return default if value is None else value
+        return self._values.get(field, default)
+
+    def get_within(self, field, timeout, default=None):
+        """문자열 디스크립터를 최대 timeout초만 기다려 조회 (못 읽었으면 default)"""
+        value = self._string(field, timeout)
+        return default if value is None else value
+
+    def add_done_callback(self, callback):
+        """문자열 디스크립터를 다 읽으면 callback(info) 호출 (디스크립터 스레드에서)"""
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def __repr__(self):
+        return (f"DeviceInfo(0x{self._values['vendor_id']:04x}:0x{self._values['product_id']:04x}"
+                f" bus={self._values['bus']} address={self._values['address']})")
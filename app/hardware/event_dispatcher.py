@@ -0,0 +1,321 @@
+"""
+BesFM 알림 엔드포인트 이벤트 디스패처 - 타이머 폴링 대신 기기 알림 시에만 상태 조회
+"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future, InvalidStateError
+
+import usb.core
+
+from .calibration import calibrate, seek_station, SURVEY_SAMPLES, SEEK_TIMEOUT
+from .io_worker import PRIORITY_TUNE, PRIORITY_POLL
+from .log import get_logger
+
+
+_log = get_logger('events')
+
+EVENT_SEEK = 'seek'   # 시크 완료
+EVENT_TUNE = 'tune'   # 튜닝 완료
+EVENT_RDS = 'rds'     # RDS 그룹 수신
+EVENT_RSSI = 'rssi'   # 신호 강도 (상태 응답마다 함께 전달)
+
+EVENT_TYPES = (EVENT_SEEK, EVENT_TUNE, EVENT_RDS, EVENT_RSSI)
+
+# 이 시간(초) 동안 알림이 없으면 상태를 직접 조회 (알림을 보내지 않는 기기 / 펌웨어 대비 안전망)
+FALLBACK_POLL_INTERVAL = 10.0
+
+# 안전망 조회로 전달하는 이벤트 - 시크 / 튠 완료는 이전 명령의 상태일 수 있으므로 알림으로만 전달
+_FALLBACK_EVENTS = (EVENT_RDS, EVENT_RSSI)
+
+# type: 이벤트 종류, data: get_status() 결과, timestamp: time.monotonic()
+FMEvent = namedtuple('FMEvent', ['type', 'data', 'timestamp'])
+
+
+class EventWaiter:
+    """특정 이벤트 한 번을 기다리는 대기자 (명령 전송 전에 등록해야 경쟁 없음)"""
+
+    def __init__(self, event_type, callback=None):
+        self.event_type = event_type
+        self.event = None
+        self._callback = callback
+        self._done = threading.Event()
+
+    def wait(self, timeout=None):
+        """이벤트를 기다리고 FMEvent 반환 (시간 초과 시 None)"""
+        self._done.wait(timeout)
+        return self.event
+
+    def _set(self, event):
+        self.event = event
+        self._done.set()
+        if self._callback is not None:
+            self._callback(event)
+
+
+class BesFMEventDispatcher:
+    """알림 엔드포인트를 블로킹으로 읽고 상태 이벤트를 구독자에게 전달"""
+
+    def __init__(self, fm, worker=None, wait_timeout=500, fallback_interval=FALLBACK_POLL_INTERVAL):
+        """
+        Args:
+            fm (BesFM): 대상 기기
+            worker (BesFMWorker): 상태 조회를 직렬화할 I/O 워커 (없으면 직접 호출)
+            wait_timeout (int): 알림 대기 타임아웃 (ms) - 중지 응답 시간
+            fallback_interval (float): 알림이 없을 때 상태를 직접 조회하는 주기 (초, None이면 사용 안 함)
+        """
+        self.fm = fm
+        self._worker = worker
+        self._wait_timeout = wait_timeout
+        self._fallback_interval = fallback_interval
+        self.fallback_polls = 0
+        self._subscribers = {event_type: [] for event_type in EVENT_TYPES}
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    def subscribe(self, event_type, callback):
+        """이벤트 구독 - 콜백은 디스패처 스레드에서 FMEvent 인자로 호출됨"""
+        with self._lock:
+            self._subscribers[event_type].append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        """이벤트 구독 해제"""
+        with self._lock:
+            if callback in self._subscribers[event_type]:
+                self._subscribers[event_type].remove(callback)
+
+    def expect(self, event_type, callback=None):
+        """다음 이벤트 한 번을 기다릴 EventWaiter 등록 (callback(event)은 디스패처 스레드에서 호출됨)"""
+        waiter = EventWaiter(event_type, callback)
+        with self._lock:
+            self._waiters.append(waiter)
+        return waiter
+
+    def cancel(self, waiter):
+        """사용하지 않은 EventWaiter 해제"""
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def tune(self, freq, timeout=0.5):
+        """
+        주파수 설정 후 튜닝 완료 알림으로 확정 (확인용 get_channel 읽기 없음)
+
+        알림을 디스패처가 받고 있으므로 BesFM.tune() 대신 사용한다.
+
+        Returns:
+            concurrent.futures.Future: {'success', 'freq', 'strength', 'seconds'}
+            (timeout 안에 튜닝 알림이 없으면 TimeoutError)
+        """
+        # 이전 튜닝의 늦은 알림은 건너뜀 (실패 상태는 원래 주파수를 담고 있음)
+        return self._command(
+            EVENT_TUNE, 'set_channel', (freq,), timeout,
+            lambda status: not status['success'] or abs(status['freq'] - freq) < 0.005
+        )
+
+    def seek(self, up=True, timeout=SEEK_TIMEOUT):
+        """
+        시크를 한 번 시작하고 시크 완료 알림으로 확정 (BesFM.seek() 대신 사용)
+
+        Returns:
+            concurrent.futures.Future: {'success', 'freq', 'strength', 'seconds'}
+            (timeout 안에 시크 알림이 없으면 TimeoutError)
+        """
+        return self._command(EVENT_SEEK, 'seek_up' if up else 'seek_down', (), timeout)
+
+    def _command(self, event_type, name, args, timeout, accept=None):
+        """
+        명령을 워커로 보내고 event_type 알림으로 결과 확정 (tune() / seek() 공용)
+
+        accept(status)가 False인 알림은 이전 명령의 늦은 알림으로 보고 다음 알림을 기다린다.
+        """
+        future = Future()
+        started = time.monotonic()
+
+        def resolve(result=None, error=None):
+            timer.cancel()
+            try:
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+            except InvalidStateError:
+                # 알림과 시간 초과가 동시에 온 경우
+                return False
+            return True
+
+        def on_event(event):
+            if future.done():
+                return
+            status = event.data
+            if accept is not None and not accept(status):
+                waiters[0] = self.expect(event_type, on_event)
+                return
+            seconds = time.monotonic() - started
+            if resolve(dict(status, seconds=seconds)):
+                self.fm.record_event(event_type, seconds, status['success'])
+
+        def expire():
+            self.cancel(waiters[0])
+            if resolve(error=TimeoutError(f"No {event_type} status within {timeout:.2f} s")):
+                self.fm.record_event(event_type, timeout, False)
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        # 명령 전송 전에 등록해야 알림을 놓치지 않음
+        waiters = [self.expect(event_type, on_event)]
+        timer.start()
+        try:
+            if self._worker is not None:
+                written = self._worker.submit(PRIORITY_TUNE, name, *args)
+            else:
+                written = Future()
+                written.set_result(getattr(self.fm, name)(*args))
+        except Exception as e:
+            self.cancel(waiters[0])
+            resolve(error=e)
+            return future
+
+        def on_written(written):
+            error = written.exception() if not written.cancelled() else RuntimeError(f"{name} cancelled")
+            if error is not None:
+                self.cancel(waiters[0])
+                resolve(error=error)
+
+        written.add_done_callback(on_written)
+        return future
+
+    def seek_station(self, up=True, attempts=None, calibration=None):
+        """
+        주파수가 바뀔 때까지 시크 반복 (BesFM.seek_station()과 같지만 시크 완료를 알림으로 확인)
+
+        알림을 기다려야 하므로 워커가 아닌 별도 스레드에서 실행하고, 각 명령은 워커로 보낸다.
+
+        Returns:
+            concurrent.futures.Future: {'success', 'freq', 'strength', 'attempts'}
+        """
+        fm = self._worker.proxy() if self._worker is not None else self.fm
+        return self._run_thread(
+            'seek_station', "BesFMSeekStation",
+            lambda: seek_station(fm, up, attempts, calibration=calibration,
+                                 seek=lambda up, timeout: self.seek(up, timeout).result())
+        )
+
+    def calibrate_seek(self, samples=SURVEY_SAMPLES):
+        """
+        시크 임계값 보정 (BesFM.calibrate_seek()과 같지만 채널마다 튜닝 완료 알림을 디스패처에서 확인)
+
+        채널마다 튜닝 알림을 기다려야 하므로 워커가 아닌 별도 스레드에서 실행하고, 각 명령은 워커로 보낸다.
+
+        Returns:
+            concurrent.futures.Future: SeekCalibration
+        """
+        fm = self._worker.proxy() if self._worker is not None else self.fm
+        return self._run_thread(
+            'calibrate_seek', "BesFMSeekCalibration",
+            lambda: calibrate(fm, samples, tune=lambda freq: self.tune(freq).result())
+        )
+
+    def _run_thread(self, key, name, func):
+        """알림을 기다리는 작업을 별도 스레드에서 실행하고 Future 반환 (지연은 key로 기록)"""
+        future = Future()
+
+        def run():
+            started = time.monotonic()
+            try:
+                result = func()
+            except Exception as e:
+                self.fm.record_event(key, time.monotonic() - started, False)
+                future.set_exception(e)
+                return
+            self.fm.record_event(key, time.monotonic() - started)
+            future.set_result(result)
+
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return future
+
+    def start(self):
+        """디스패처 스레드 시작 (알림 엔드포인트가 없으면 False)"""
+        if self._running:
+            return True
+        if getattr(self.fm, '_notify_ep', None) is None:
+            return False
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="BesFMEventDispatcher", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self, timeout=1.0):
+        """디스패처 스레드 중지"""
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def is_running(self):
+        """디스패처 동작 여부"""
+        return self._running
+
+    def _run(self):
+        """알림 대기 루프"""
+        error_delay = 0.05
+        last_status = time.monotonic()
+        while self._running:
+            events = EVENT_TYPES
+            try:
+                notified = self.fm.wait_notify(self._wait_timeout)
+                if not notified:
+                    # 알림 엔드포인트는 있지만 기기가 알리지 않는 경우에도 신호 강도 / RDS는 드물게 갱신
+                    if (self._fallback_interval is None
+                            or time.monotonic() - last_status < self._fallback_interval):
+                        continue
+                    events = _FALLBACK_EVENTS
+                    self.fallback_polls += 1
+                    status = self._fetch_status(PRIORITY_POLL)
+                else:
+                    status = self._fetch_status()
+                last_status = time.monotonic()
+            except usb.core.USBError as e:
+                if not self._running:
+                    break
+                _log.error("Event dispatcher error: %s", e)
+                # 오류가 반복되면 바쁜 루프가 되지 않도록 대기 시간 증가
+                time.sleep(error_delay)
+                error_delay = min(error_delay * 2, 2.0)
+                continue
+            error_delay = 0.05
+            if isinstance(status, dict):
+                self._dispatch(status, events)
+
+    def _fetch_status(self, priority=PRIORITY_TUNE):
+        """알림 후 상태 조회 (워커가 있으면 튜닝 우선순위로, 안전망 조회는 폴링 우선순위로)"""
+        if self._worker is not None:
+            return self._worker.call(priority, 'get_status')
+        return self.fm.get_status()
+
+    def _dispatch(self, status, types=EVENT_TYPES):
+        """상태를 타입별 이벤트로 변환해 구독자와 대기자에게 전달 (types에 있는 종류만)"""
+        timestamp = time.monotonic()
+        events = []
+        if status.get('type') in (EVENT_SEEK, EVENT_TUNE, EVENT_RDS) and status['type'] in types:
+            events.append(FMEvent(status['type'], status, timestamp))
+        if 'strength' in status and EVENT_RSSI in types:
+            events.append(FMEvent(EVENT_RSSI, status, timestamp))
+
+        for event in events:
+            with self._lock:
+                callbacks = list(self._subscribers[event.type])
+                waiters = [w for w in self._waiters if w.event_type == event.type]
+                for waiter in waiters:
+                    self._waiters.remove(waiter)
+            for waiter in waiters:
+                waiter._set(event)
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    _log.exception("Event callback error: %s", e)
@@ -0,0 +1,351 @@
+"""
+BesFM 기기 핫플러그 감시 - 호환 기기 목록을 백그라운드에서 증분 갱신하고 연결/분리 이벤트 전달
+"""
+import threading
+import time
+
+import usb.core
+
+from .besfm_core import BesFM
+from .simulator import simulated_devices
+from .device_info import forget_device
+from .log import get_logger
+
+try:
+    # python-libusb1이 있으면 libusb 핫플러그 콜백 사용 (pyusb는 핫플러그 API가 없음)
+    import usb1
+except ImportError:
+    usb1 = None
+
+
+_log = get_logger('hotplug')
+
+HOTPLUG_ATTACH = 'attach'
+HOTPLUG_DETACH = 'detach'
+
+VENDOR_ID = 0x04e8
+PRODUCT_IDS = (0xa054, 0xa059, 0xa05b)
+
+# find()가 아직 읽지 못한 시리얼 번호를 기다리는 최대 시간 (초, 후보 전체 합계)
+SERIAL_WAIT = 0.5
+
+# 폴링 모드에서 변화 없는 스캔이 이어질 때 주기를 두 배씩 늘리는 상한 (초)
+MAX_POLL_INTERVAL = 8.0
+
+
+def port_path(device):
+    """기기가 꽂힌 물리 포트 경로 (bus, 포트 번호들) - 다시 꽂아도 같은 포트면 유지됨 (알 수 없으면 None)"""
+    try:
+        ports = device.port_numbers
+    except (AttributeError, NotImplementedError, usb.core.USBError):
+        return None
+    if not ports:
+        return None
+    return (device.bus,) + tuple(ports)
+
+
+class HotplugWatcher:
+    """
+    호환 기기 캐시를 유지하는 백그라운드 감시기
+
+    - python-libusb1이 있고 플랫폼이 지원하면 libusb 핫플러그 콜백이 올 때만 다시 스캔
+    - 그 외에는 듣는 쪽(수동이 아닌 구독자 또는 wait_for 대기자)이 있을 때만 버스를 훑어 이전 목록과
+      비교하고, 변화가 없으면 주기를 interval부터 max_interval까지 늘림 (아무도 없으면 스캔하지 않음)
+    - 이미 아는 (bus, address)는 기기 정보를 재사용하므로 스캔이 가볍다
+    """
+
+    def __init__(self, interval=1.0, use_libusb_hotplug=True, max_interval=MAX_POLL_INTERVAL):
+        """
+        Args:
+            interval (float): 폴링 시작 주기 (초) - 핫플러그 콜백 사용 시 이벤트 처리 타임아웃
+            use_libusb_hotplug (bool): 가능하면 libusb 핫플러그 콜백 사용
+            max_interval (float): 변화가 없을 때 늘어나는 폴링 주기의 상한 (초)
+        """
+        self.interval = interval
+        self.max_interval = max(interval, max_interval)
+        self._use_libusb_hotplug = use_libusb_hotplug
+        # (bus, address) -> 기기 정보 - 다시 꽂으면 address가 바뀌므로 시리얼 번호 없이도 기기를
+        # 구분하고, 시리얼 번호(문자열 디스크립터)를 기다리지 않고 스캔할 수 있음
+        self._devices = {}
+        self._simulated = simulated_devices()
+        self._callbacks = []
+        # 폴링을 유지하는 쪽: 수동이 아닌 구독자 수 / wait_for 대기자 수
+        self._listeners = 0
+        self._waiting = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._dirty = threading.Event()
+        # 폴링 모드에서 듣는 쪽이 새로 생기면 바로 스캔하도록 감시 스레드를 깨움
+        self._wake = threading.Event()
+        self._thread = None
+        self._context = None
+        self.scans = 0
+
+    @property
+    def uses_hotplug(self):
+        """libusb 핫플러그 콜백으로 동작 중인지 여부"""
+        return self._context is not None
+
+    def subscribe(self, callback, passive=False):
+        """
+        연결/분리 콜백 등록 - callback(event, info)는 감시 스레드에서 호출됨
+
+        passive=True면 다른 이유로 스캔할 때만 이벤트를 받고 폴링을 유지하지는 않는다.
+        (분리를 전송 오류로도 감지하는 재연결 감시기 등)
+        """
+        with self._lock:
+            if any(cb == callback for cb, _ in self._callbacks):
+                return
+            self._callbacks.append((callback, passive))
+            if not passive:
+                self._listeners += 1
+        if not passive:
+            self._wake.set()
+
+    def unsubscribe(self, callback):
+        """콜백 해제"""
+        with self._lock:
+            for entry in self._callbacks:
+                if entry[0] == callback:
+                    self._callbacks.remove(entry)
+                    if not entry[1]:
+                        self._listeners -= 1
+                    break
+
+    def devices(self):
+        """캐시된 호환 기기 목록 (find_all_devices 항목 형식, 버스 스캔 없음)"""
+        with self._lock:
+            infos = list(self._devices.values())
+        return sorted(infos, key=lambda info: (info['bus'], info['address']))
+
+    def find(self, serial_number=None, bus=None, address=None, port=None, serial_wait=SERIAL_WAIT):
+        """
+        조건에 맞는 캐시된 기기 정보 (없으면 None) - port는 port_path() 값
+
+        bus / address / port로 먼저 거르고 시리얼 번호는 남은 후보만 비교한다. 이미 읽은 시리얼
+        번호부터 확인하고, 아직 읽지 못한 후보는 모두 합쳐 최대 serial_wait초만 기다린다.
+        """
+        candidates = []
+        for info in self.devices():
+            if bus is not None and info.get('bus') != bus:
+                continue
+            if address is not None and info.get('address') != address:
+                continue
+            if port is not None and port_path(info['device']) != port:
+                continue
+            candidates.append(info)
+        if serial_number is None:
+            return candidates[0] if candidates else None
+        pending = []
+        for info in candidates:
+            if info.is_loaded():
+                if info.peek('serial_number') == serial_number:
+                    return info
+            else:
+                pending.append(info)
+        deadline = time.monotonic() + serial_wait
+        for info in pending:
+            remaining = max(0.0, deadline - time.monotonic())
+            if info.get_within('serial_number', remaining) == serial_number:
+                return info
+        return None
+
+    def wait_for(self, serial_number=None, timeout=None, **match):
+        """
+        조건에 맞는 기기가 연결될 때까지 대기
+
+        Returns:
+            dict: 기기 정보 (timeout 안에 나타나지 않으면 None)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._waiting += 1
+        self._wake.set()
+        try:
+            return self._wait_for(serial_number, deadline, match)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def _wait_for(self, serial_number, deadline, match):
+        while True:
+            info = self.find(serial_number, **match)
+            if info is not None:
+                return info
+            if not self.is_running():
+                self.refresh()
+                info = self.find(serial_number, **match)
+                if info is not None or deadline is None or time.monotonic() >= deadline:
+                    return info
+                time.sleep(min(self.interval, max(0.0, deadline - time.monotonic())))
+                continue
+            with self._changed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    def refresh(self):
+        """
+        즉시 다시 스캔하고 캐시 갱신
+
+        Returns:
+            tuple: (연결된 기기 정보 목록, 분리된 기기 정보 목록)
+        """
+        try:
+            found = [d for d in usb.core.find(find_all=True, idVendor=VENDOR_ID)
+                     if d.idProduct in PRODUCT_IDS]
+        except Exception as e:
+            # 스캔 실패 시 실제 기기 목록은 그대로 유지
+            _log.warning("Hotplug scan failed: %s", e)
+            with self._lock:
+                found = [info['device'] for info in self._devices.values()
+                         if info['device'] not in self._simulated]
+        found.extend(self._simulated)
+
+        with self._lock:
+            known = dict(self._devices)
+        current = {}
+        attached = []
+        for device in found:
+            location = (device.bus, device.address)
+            info = known.get(location)
+            if info is None or info['product_id'] != device.idProduct:
+                # 문자열 디스크립터는 백그라운드에서 읽히므로 스캔 경로에서 기다리지 않음
+                info = BesFM.describe_device(device)
+                attached.append(info)
+            current[location] = info
+        detached = [info for location, info in known.items() if location not in current]
+        for info in detached:
+            forget_device(info['device'])
+
+        with self._changed:
+            self._devices = current
+            self.scans += 1
+            callbacks = [callback for callback, _ in self._callbacks]
+            if attached or detached:
+                self._changed.notify_all()
+        for info in detached:
+            self._notify(callbacks, HOTPLUG_DETACH, info)
+        for info in attached:
+            self._notify(callbacks, HOTPLUG_ATTACH, info)
+        return attached, detached
+
+    @staticmethod
+    def _notify(callbacks, event, info):
+        for callback in callbacks:
+            try:
+                callback(event, info)
+            except Exception as e:
+                _log.exception("Hotplug callback failed: %s", e)
+
+    def start(self):
+        """감시 시작 (첫 스캔은 호출한 스레드에서 바로 수행)"""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self.refresh()
+        if self._use_libusb_hotplug:
+            self._context = self._open_hotplug_context()
+        self._thread = threading.Thread(target=self._run, name="BesFMHotplug", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """감시 중지"""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        if self._context is not None:
+            try:
+                self._context.close()
+            except Exception:
+                pass
+            self._context = None
+
+    def is_running(self):
+        """감시 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _open_hotplug_context(self):
+        """libusb 핫플러그 콜백 등록 (지원하지 않으면 None)"""
+        if usb1 is None:
+            return None
+        try:
+            context = usb1.USBContext()
+            if hasattr(context, 'open'):
+                context.open()
+            if not context.hasCapability(usb1.CAP_HAS_HOTPLUG):
+                context.close()
+                return None
+            context.hotplugRegisterCallback(self._on_libusb_hotplug, vendor_id=VENDOR_ID)
+            return context
+        except Exception as e:
+            _log.info("libusb hotplug unavailable, falling back to polling: %s", e)
+            return None
+
+    def _on_libusb_hotplug(self, context, device, event):
+        """libusb 이벤트 처리 중 호출 - 다시 스캔하도록 표시만 함"""
+        self._dirty.set()
+        return False  # 계속 등록 유지
+
+    def _is_wanted(self):
+        """폴링을 유지할 쪽이 있는지 여부"""
+        with self._lock:
+            return self._listeners > 0 or self._waiting > 0
+
+    def _run(self):
+        """감시 루프"""
+        delay = self.interval
+        while not self._stop.is_set():
+            if self._context is not None:
+                try:
+                    self._context.handleEventsTimeout(tv=self.interval)
+                except Exception as e:
+                    _log.warning("libusb hotplug event handling failed: %s", e)
+                    self._stop.wait(self.interval)
+                if not self._dirty.is_set():
+                    continue
+                self._dirty.clear()
+                self.refresh()
+                continue
+            if self._is_wanted():
+                woken = self._wake.wait(delay)
+            else:
+                # 듣는 쪽이 없으면 구독 / wait_for / stop이 깨울 때까지 스캔하지 않음
+                woken = self._wake.wait()
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            attached, detached = self.refresh()
+            if woken or attached or detached:
+                delay = self.interval
+            else:
+                delay = min(delay * 2, self.max_interval)
+
+
+_shared_watcher = None
+_shared_lock = threading.Lock()
+
+
+def get_hotplug_watcher():
+    """애플리케이션 공용 핫플러그 감시기 (처음 호출 시 시작)"""
+    global _shared_watcher
+    with _shared_lock:
+        if _shared_watcher is None:
+            _shared_watcher = HotplugWatcher()
+        if not _shared_watcher.is_running():
+            _shared_watcher.start()
+        return _shared_watcher
+
+
+def stop_hotplug_watcher():
+    """공용 핫플러그 감시기 중지"""
+    global _shared_watcher
+    with _shared_lock:
+        if _shared_watcher is not None:
+            _shared_watcher.stop()
+            _shared_watcher = None
@@ -0,0 +1,641 @@
+"""
+BesFM USB I/O 서버 프로세스 - GUI 프로세스 밖에서 기기를 소유하고 상태를 공유 메모리 블록으로 게시
+
+GUI 프로세스의 GIL을 USB 전송과 나눠 쓰지 않도록 BesFM / I/O 워커 / 알림 디스패처 / 재연결 감시기를
+자식 프로세스에서 실행한다. GUI는 공유 메모리 상태 블록을 시스템 호출 없이 읽고, 명령은 파이프로 보낸다.
+"""
+import itertools
+import multiprocessing
+import os
+import pickle
+import struct
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import usb.core
+
+from .besfm_core import BesFM
+from .device_info import DeviceInfo
+from .event_dispatcher import BesFMEventDispatcher, EVENT_SEEK, EVENT_TUNE, EVENT_RDS, EVENT_RSSI
+from .hotplug import get_hotplug_watcher, port_path
+from .io_worker import BesFMWorker, PRIORITY_USER, PRIORITY_POLL, _METHOD_PRIORITY
+from .log import get_logger, configure_logging
+from .reconnect import ReconnectSupervisor, RECONNECT_RESTORED
+
+
+_log = get_logger('server')
+
+# 설정되어 있으면 세션 풀이 기기마다 I/O 서버 프로세스를 사용
+IO_PROCESS_ENV = 'BESFM_IO_PROCESS'
+
+# 상태 블록 형식 (리틀 엔디언 고정 배치)
+# seq: 쓰는 중이면 홀수 (seqlock), updated: time.time(), channel: 10kHz 단위,
+# rds_data: 마지막 RDS 그룹 (블록 4개, 8바이트), rds_count / tune_count: 이벤트 수신 횟수
+_LAYOUT = struct.Struct('<Id H B B B B B B 8s I I')
+_LAYOUT_FIELDS = ('seq', 'updated', 'channel', 'rssi', 'volume', 'flags', 'band', 'spacing',
+                  'rds_error', 'rds_data', 'rds_count', 'tune_count')
+_SEQ = struct.Struct('<I')
+
+# flags 비트
+FLAG_CONNECTED = 0x01
+FLAG_POWER = 0x02
+FLAG_RECORDING = 0x04
+FLAG_MUTE = 0x08
+FLAG_MONO = 0x10
+FLAG_RDS = 0x20
+
+_FLAG_FIELDS = (('connected', FLAG_CONNECTED), ('power', FLAG_POWER),
+                ('recording', FLAG_RECORDING), ('mute', FLAG_MUTE), ('mono', FLAG_MONO),
+                ('rds', FLAG_RDS))
+
+# GUI가 읽는 상태 (channel은 MHz)
+ServerState = namedtuple('ServerState', [
+    'seq', 'updated', 'channel', 'rssi', 'volume', 'power', 'recording', 'mute', 'mono',
+    'rds', 'connected', 'band', 'spacing', 'rds_error', 'rds_data', 'rds_count', 'tune_count',
+])
+
+# 서버 프로세스가 주기적으로 읽어 게시하는 필드
+_POLLED_FIELDS = ('power', 'recording', 'channel', 'volume', 'mute', 'mono', 'band',
+                  'spacing', 'rds')
+
+_MSG_CALL = 'call'
+_MSG_STOP = 'stop'
+_MSG_READY = 'ready'
+_MSG_ERROR = 'error'
+_MSG_RESULT = 'result'
+_MSG_EVENT = 'event'
+
+# 쓰는 쪽이 멈춘 경우 읽기를 포기하기까지 재시도 횟수
+_READ_RETRIES = 1000
+
+# 디스패처가 동작 중이면 워커 대신 디스패처로 처리하는 명령 (알림으로 완료를 확인)
+_DISPATCHED = ('tune', 'seek', 'seek_station', 'calibrate_seek')
+
+# 프록시가 서버 프로세스로 전달하는 BesFM 메서드 (인자와 결과를 피클로 주고받을 수 있는 것만)
+# 기기 객체 / 콜백을 다루는 reopen, set_disconnect_callback, 재연결용 capture_state / replay_state,
+# 디스패처가 소유한 wait_notify, 기기를 열지 않는 정적 메서드는 제외
+_REMOTE_METHODS = frozenset((
+    'get_device_info', 'is_connected', 'probe_command', 'probe_capabilities', 'get_capabilities',
+    'supports', 'invalidate_cache', 'get_cache_stats', 'get_pacing_profile', 'load_pacing_profile',
+    'get_retry_stats', 'enable_metrics', 'get_metrics', 'dump_metrics', 'reset_metrics',
+    'reset_circuit', 'record_event', 'start_trace', 'stop_trace', 'read', 'write', 'apply',
+    'set_power', 'get_power', 'set_recording', 'get_recording', 'set_band', 'get_band',
+    'set_rssi_threshold', 'get_rssi_threshold', 'set_channel_spacing', 'get_channel_spacing',
+    'set_mute', 'get_mute', 'set_volume', 'get_volume', 'set_mono', 'get_mono',
+    'seek_up', 'seek_down', 'seek_stop', 'set_channel', 'get_channel', 'tune', 'seek',
+    'seek_station', 'get_rssi', 'get_protocol_version', 'get_ic_info', 'get_ic_number',
+    'set_rds', 'get_rds', 'set_dc_threshold', 'get_dc_threshold', 'set_spike_threshold',
+    'get_spike_threshold', 'calibrate_seek', 'get_snapshot', 'get_status',
+))
+
+
+class SharedStateBlock:
+    """
+    고정 배치 상태 블록 (multiprocessing.shared_memory)
+
+    쓰는 쪽은 한 프로세스뿐이고, 읽는 쪽은 seqlock으로 쓰는 중인 값을 건너뛴다
+    (쓰기 전후로 seq를 홀수 -> 짝수로 바꾸고, 읽는 쪽은 앞뒤 seq가 같은 짝수일 때만 사용).
+    """
+
+    def __init__(self, name=None):
+        """
+        Args:
+            name (str): 붙을 블록 이름 (없으면 새 블록 생성 - 생성한 쪽이 unlink 책임)
+        """
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=_LAYOUT.size)
+            self._shm.buf[:_LAYOUT.size] = bytes(_LAYOUT.size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._buf = self._shm.buf
+        self._lock = threading.RLock()
+        self._values = dict(zip(_LAYOUT_FIELDS, _LAYOUT.unpack_from(self._buf)))
+        # 마지막으로 일관되게 읽은 상태 (쓰는 쪽이 쓰는 도중 멈췄을 때 대신 반환)
+        self._last = None
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def publish(self, **changes):
+        """
+        값 갱신 (서버 프로세스에서 호출)
+
+        flags 대신 connected / power / recording / mute / mono / rds 불리언을,
+        channel은 MHz를 받는다.
+        """
+        with self._lock:
+            values = self._values
+            flags = values['flags']
+            for field, bit in _FLAG_FIELDS:
+                if field in changes:
+                    flags = flags | bit if changes.pop(field) else flags & ~bit
+            values['flags'] = flags
+            if 'channel' in changes:
+                changes['channel'] = int(round(changes['channel'] * 100))
+            values.update(changes)
+            values['updated'] = time.time()
+            # 홀수 = 쓰는 중, 마지막에 짝수로 바꿔 완료 표시
+            values['seq'] = (values['seq'] + 1) & 0xFFFFFFFF
+            _LAYOUT.pack_into(self._buf, 0, *(values[field] for field in _LAYOUT_FIELDS))
+            values['seq'] = (values['seq'] + 1) & 0xFFFFFFFF
+            _SEQ.pack_into(self._buf, 0, values['seq'])
+
+    def increment(self, field, **changes):
+        """이벤트 횟수 필드 증가와 함께 갱신"""
+        with self._lock:
+            count = (self._values[field] + 1) & 0xFFFFFFFF
+            self.publish(**{field: count}, **changes)
+
+    def read(self):
+        """
+        일관된 상태 읽기 (공유 메모리 직접 접근, 시스템 호출 없음)
+
+        재시도 안에 일관된 값을 읽지 못하면(서버 프로세스가 쓰는 도중 종료 등) 찢어진 값 대신
+        마지막으로 일관되게 읽은 상태를 반환한다.
+
+        Returns:
+            ServerState: 현재 상태 (일관된 값을 한 번도 읽지 못했으면 None)
+        """
+        buf = self._buf
+        for _ in range(_READ_RETRIES):
+            seq = _SEQ.unpack_from(buf)[0]
+            if seq & 1:
+                continue
+            raw = _LAYOUT.unpack_from(buf)
+            if _SEQ.unpack_from(buf)[0] == seq:
+                self._last = self._decode(seq, raw)
+                return self._last
+        return self._last
+
+    @staticmethod
+    def _decode(seq, raw):
+        (_, updated, channel, rssi, volume, flags, band, spacing,
+         rds_error, rds_data, rds_count, tune_count) = raw
+        return ServerState(
+            seq, updated, channel / 100, rssi, volume,
+            bool(flags & FLAG_POWER), bool(flags & FLAG_RECORDING), bool(flags & FLAG_MUTE),
+            bool(flags & FLAG_MONO), bool(flags & FLAG_RDS), bool(flags & FLAG_CONNECTED),
+            band, spacing, rds_error, rds_data, rds_count, tune_count,
+        )
+
+    def close(self):
+        """블록 해제 (생성한 쪽이면 삭제까지)"""
+        self._buf = None
+        try:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        except (BufferError, FileNotFoundError) as e:
+            _log.warning("Error releasing shared state block: %s", e)
+
+
+def _device_target(device):
+    """
+    자식 프로세스에서 같은 기기를 다시 찾기 위한 식별 정보 (usb.core.Device는 전달할 수 없음)
+
+    시리얼 번호를 아직 읽지 못했으면 기다리지 않고 포트 경로 / bus:address로 찾게 한다.
+    """
+    return {'serial_number': DeviceInfo(device).peek('serial_number'), 'port': port_path(device),
+            'bus': device.bus, 'address': device.address}
+
+
+def _open_device(target, timeout):
+    """식별 정보로 기기 찾기 (시리얼 번호, 없으면 포트 경로, 없으면 bus/address)"""
+    watcher = get_hotplug_watcher()
+    if target['serial_number']:
+        info = watcher.wait_for(target['serial_number'], timeout=timeout)
+    elif target['port'] is not None:
+        info = watcher.wait_for(timeout=timeout, port=target['port'])
+    else:
+        info = watcher.wait_for(timeout=timeout, bus=target['bus'], address=target['address'])
+    if info is None:
+        raise RuntimeError(f"FM radio device not found in I/O server: {target}")
+    return info['device']
+
+
+class _Server:
+    """서버 프로세스 본체 - 명령 수신 루프와 상태 게시"""
+
+    def __init__(self, conn, block, fm, worker, device, options):
+        self.conn = conn
+        self.block = block
+        self.fm = fm
+        self.worker = worker
+        self.poll_interval = options['poll_interval']
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._dispatcher = None
+        self._supervisor = None
+        self._poller = threading.Thread(target=self._poll_loop, name="BesFMServerPoll",
+                                        daemon=True)
+        if options['reconnect']:
+            self._supervisor = ReconnectSupervisor(fm, worker, device)
+
+    def send(self, message):
+        """부모 프로세스로 전송 (여러 스레드에서 호출)"""
+        self.send_bytes(pickle.dumps(message))
+
+    def send_bytes(self, payload):
+        """피클로 직렬화한 메시지 전송 - 부모는 recv()로 그대로 받음"""
+        try:
+            with self._send_lock:
+                self.conn.send_bytes(payload)
+        except (OSError, EOFError):
+            # 부모가 먼저 종료됨
+            self._stop.set()
+
+    def run(self):
+        self._dispatcher = BesFMEventDispatcher(self.fm, self.worker)
+        self._dispatcher.subscribe(EVENT_SEEK, self._on_tune)
+        self._dispatcher.subscribe(EVENT_TUNE, self._on_tune)
+        self._dispatcher.subscribe(EVENT_RDS, self._on_rds)
+        self._dispatcher.subscribe(EVENT_RSSI, self._on_rssi)
+        self._dispatcher.start()
+        if self._supervisor is not None:
+            self._supervisor.subscribe(self._on_reconnect)
+            self._supervisor.start()
+        self._poller.start()
+        try:
+            while not self._stop.is_set():
+                try:
+                    message = self.conn.recv()
+                except (EOFError, OSError):
+                    break
+                if message[0] == _MSG_STOP:
+                    break
+                self._handle_call(*message[1:])
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self._stop.set()
+        self._wake.set()
+        if self._supervisor is not None:
+            self._supervisor.stop()
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+        self._poller.join(1.0)
+        self.worker.stop()
+        self.block.close()
+
+    def _handle_call(self, request_id, priority, name, args, kwargs):
+        if name not in _REMOTE_METHODS or not callable(getattr(self.fm, name, None)):
+            self._reply(request_id, name, False, AttributeError(f"BesFM has no method '{name}'"))
+            return
+        if name in _DISPATCHED and self._dispatcher.is_running():
+            # 알림은 디스패처가 받으므로 튜닝 / 시크 완료도 디스패처에서 확인
+            future = getattr(self._dispatcher, name)(*args, **kwargs)
+        else:
+            future = self.worker.submit(priority, name, *args, **kwargs)
+
+        def done(future):
+            if future.cancelled():
+                self._reply(request_id, name, False, RuntimeError("I/O server is stopping"))
+                return
+            error = future.exception()
+            if error is None:
+                self._reply(request_id, name, True, future.result())
+            else:
+                self._reply(request_id, name, False, error)
+            # 쓰기 결과가 바로 상태 블록에 보이도록 즉시 게시
+            self._wake.set()
+
+        future.add_done_callback(done)
+
+    def _reply(self, request_id, name, ok, value):
+        # 결과는 한 번만 직렬화 (실패하면 오류로 대신 응답)
+        try:
+            payload = pickle.dumps((_MSG_RESULT, request_id, ok, value))
+        except Exception as e:
+            error = RuntimeError(f"{name}() result could not be sent: {e}")
+            payload = pickle.dumps((_MSG_RESULT, request_id, False, error))
+        self.send_bytes(payload)
+
+    def _poll_loop(self):
+        """상태 레지스터 주기적 게시 (섀도 캐시로 만료된 레지스터와 RSSI만 전송)"""
+        while not self._stop.is_set():
+            try:
+                values = self.worker.call(PRIORITY_POLL, self._read_state)
+            except usb.core.USBError:
+                self.block.publish(connected=False)
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                _log.warning("I/O server state poll failed: %s", e)
+            else:
+                self.block.publish(connected=True, **values)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _read_state(self):
+        """워커에서 실행"""
+        values = self.fm.get_snapshot(_POLLED_FIELDS, fresh=False).as_dict()
+        if values.get('power') or values.get('recording'):
+            values['rssi'] = self.fm.get_rssi()
+        return values
+
+    # 아래 콜백은 디스패처 / 재연결 스레드에서 호출됨
+    def _on_tune(self, event):
+        status = event.data
+        if status.get('success'):
+            self.block.increment('tune_count', channel=status['freq'], rssi=status['strength'])
+        else:
+            self.block.increment('tune_count', rssi=status['strength'])
+
+    def _on_rds(self, event):
+        status = event.data
+        self.block.increment('rds_count', rds_data=bytes(status['data']), rds_error=status['error'],
+                             rssi=status['strength'])
+
+    def _on_rssi(self, event):
+        self.block.publish(rssi=event.data['strength'])
+
+    def _on_reconnect(self, event, detail):
+        self.block.publish(connected=event == RECONNECT_RESTORED)
+        if event == RECONNECT_RESTORED:
+            self._wake.set()
+        detail = {key: value for key, value in detail.items() if key != 'device'}
+        self.send((_MSG_EVENT, event, detail))
+
+
+def _serve(conn, block_name, target, options):
+    """서버 프로세스 진입점"""
+    # spawn된 프로세스는 로깅 설정을 물려받지 않으므로 환경 변수(BESFM_LOG / BESFM_LOG_LEVELS)로 다시 설정
+    configure_logging()
+    block = SharedStateBlock(block_name)
+    worker = None
+    try:
+        device = _open_device(target, options['open_timeout'])
+        fm = BesFM(device, use_cache=options['use_cache'], metrics=options['metrics'])
+        if options['pacing']:
+            fm.load_pacing_profile(options['pacing'])
+        worker = BesFMWorker(fm, name="BesFMServerWorker")
+        result = None
+        if options['warm'] is not None:
+            result = worker.call(PRIORITY_USER, options['warm'], fm, options['state'])
+    except BaseException as e:
+        if worker is not None:
+            worker.stop()
+        block.close()
+        try:
+            conn.send((_MSG_ERROR, RuntimeError(f"I/O server failed to start: {e}")))
+        except (OSError, EOFError):
+            pass
+        return
+    server = _Server(conn, block, fm, worker, device, options)
+    block.publish(connected=True)
+    server.send((_MSG_READY, result))
+    server.run()
+
+
+class IOServer:
+    """
+    USB I/O 서버 프로세스 클라이언트
+
+    BesFMWorker와 같은 submit() / call() / proxy() / stop() 인터페이스를 제공하므로 세션 풀과
+    GUI는 워커 대신 그대로 사용할 수 있다. 상태는 state()로 공유 메모리에서 바로 읽는다.
+
+    - 명령: 파이프로 (요청 ID, 우선순위, 메서드 이름, 인자) 전송, 결과는 수신 스레드가 Future로 전달
+    - 호출 가능한 객체를 submit()하면 이 프로세스의 전용 스레드에서 실행 (self.fm으로 원격 호출)
+    - 재연결 이벤트: subscribe(callback) - ReconnectSupervisor와 같은 (event, detail) 형식
+    """
+
+    def __init__(self, device, state=None, warm=None, use_cache=True, metrics=False,
+                 reconnect=True, poll_interval=0.25, name=None):
+        """
+        Args:
+            device: usb.core.Device
+            state (dict): 기기별 저장 설정 ('pacing' 및 warm에 전달할 값)
+            warm: 서버 프로세스의 워커에서 warm(fm, state)로 한 번 실행할 모듈 수준 함수
+            use_cache (bool): 섀도 레지스터 캐시 사용 여부
+            metrics (bool): 지연 지표 수집 여부
+            reconnect (bool): 서버 프로세스 안에서 자동 재연결 감시 여부
+            poll_interval (float): 상태 블록 갱신 주기 (초)
+            name (str): 로컬 스레드 이름 접두사
+        """
+        self.device = device
+        self.name = name or "BesFMIOServer"
+        state = state or {}
+        self._options = {
+            'state': state, 'warm': warm, 'pacing': state.get('pacing'),
+            'use_cache': use_cache, 'metrics': metrics, 'reconnect': reconnect,
+            'poll_interval': poll_interval, 'open_timeout': 5.0,
+        }
+        self._block = None
+        self._conn = None
+        self._process = None
+        self._receiver = None
+        self._local = None
+        self._futures = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._callbacks = []
+        self._running = False
+        self.fm = IOServerProxy(self)
+
+    def start(self, timeout=15.0):
+        """
+        서버 프로세스 시작 - 기기를 열고 warm()을 마칠 때까지 대기
+
+        Returns:
+            warm()의 반환값 (없으면 None)
+        """
+        # 스레드가 있는 GUI 프로세스를 fork하지 않도록 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        self._block = SharedStateBlock()
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_serve, name=self.name, daemon=True,
+            args=(child_conn, self._block.name, _device_target(self.device), self._options),
+        )
+        try:
+            self._process.start()
+            child_conn.close()
+            if not self._conn.poll(timeout):
+                raise TimeoutError("I/O server did not start in time")
+            kind, result = self._conn.recv()
+        except BaseException:
+            self._terminate()
+            raise
+        if kind == _MSG_ERROR:
+            self._terminate()
+            raise result
+        self._running = True
+        self._local = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        self._receiver = threading.Thread(target=self._receive, name=f"{self.name}Receiver",
+                                          daemon=True)
+        self._receiver.start()
+        return result
+
+    def state(self):
+        """공유 메모리 상태 블록 읽기 (시스템 호출 없음, 중지 후 / 읽을 수 없으면 None)"""
+        block = self._block
+        return None if block is None else block.read()
+
+    def submit(self, priority, func, *args, **kwargs):
+        """
+        명령을 서버 프로세스로 보내고 Future 반환
+
+        Args:
+            priority (int): PRIORITY_USER / PRIORITY_TUNE / PRIORITY_POLL
+            func: BesFM 메서드 이름(str) 또는 이 프로세스에서 실행할 호출 가능한 객체
+        """
+        if not self._running:
+            future = Future()
+            future.set_exception(RuntimeError("I/O server is stopped"))
+            return future
+        if not isinstance(func, str):
+            return self._local.submit(func, *args, **kwargs)
+        future = Future()
+        request_id = next(self._ids)
+        with self._lock:
+            self._futures[request_id] = future
+        try:
+            with self._send_lock:
+                self._conn.send((_MSG_CALL, request_id, priority, func, args, kwargs))
+        except (OSError, EOFError, pickle.PicklingError) as e:
+            with self._lock:
+                self._futures.pop(request_id, None)
+            future.set_exception(RuntimeError(f"I/O server request failed: {e}"))
+        return future
+
+    def call(self, priority, func, *args, timeout=None, **kwargs):
+        """명령을 실행하고 결과를 기다림"""
+        return self.submit(priority, func, *args, **kwargs).result(timeout)
+
+    def proxy(self, priority=None):
+        """BesFM과 같은 인터페이스로 서버 프로세스에 호출하는 프록시 반환"""
+        return IOServerProxy(self, priority)
+
+    def in_worker_thread(self):
+        """BesFMWorker 호환 - 이 프로세스에는 워커 스레드가 없음"""
+        return False
+
+    def pending(self):
+        """응답을 기다리는 명령 수"""
+        with self._lock:
+            return len(self._futures)
+
+    def subscribe(self, callback):
+        """재연결 이벤트 콜백 등록 - callback(event, detail)은 수신 스레드에서 호출됨"""
+        with self._lock:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        """콜백 해제"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def is_running(self):
+        """서버 프로세스 동작 여부"""
+        return self._running and self._process is not None and self._process.is_alive()
+
+    def stop(self, timeout=1.0):
+        """서버 프로세스 중지 - 응답을 기다리던 명령은 실패 처리"""
+        if not self._running:
+            return
+        self._running = False
+        try:
+            with self._send_lock:
+                self._conn.send((_MSG_STOP,))
+        except (OSError, EOFError):
+            pass
+        self._process.join(timeout)
+        self._terminate()
+        if self._receiver is not None and self._receiver is not threading.current_thread():
+            self._receiver.join(timeout)
+        self._local.shutdown(wait=False)
+
+    def _terminate(self):
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(1.0)
+        if self._conn is not None:
+            self._conn.close()
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+        self._fail_pending(RuntimeError("I/O server is stopped"))
+
+    def _fail_pending(self, error):
+        with self._lock:
+            futures = list(self._futures.values())
+            self._futures.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _receive(self):
+        """수신 루프 - 결과를 Future로, 재연결 이벤트를 구독자에게 전달"""
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == _MSG_RESULT:
+                _, request_id, ok, value = message
+                with self._lock:
+                    future = self._futures.pop(request_id, None)
+                if future is None:
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+            elif message[0] == _MSG_EVENT:
+                _, event, detail = message
+                detail['device'] = self.device
+                with self._lock:
+                    callbacks = list(self._callbacks)
+                for callback in callbacks:
+                    try:
+                        callback(event, detail)
+                    except Exception as e:
+                        _log.exception("I/O server event callback failed: %s", e)
+        if self._running:
+            _log.error("I/O server process exited unexpectedly")
+            self._running = False
+        self._fail_pending(RuntimeError("I/O server process exited"))
+
+    def __repr__(self):
+        pid = self._process.pid if self._process is not None else None
+        return f"IOServer({self.name!r}, pid={pid})"
+
+
+class IOServerProxy:
+    """
+    BesFM 메서드 호출을 서버 프로세스로 전달하고 결과를 기다리는 프록시
+
+    _REMOTE_METHODS에 있는 메서드만 제공하므로 hasattr()로 기능을 확인할 수 있다.
+    """
+
+    def __init__(self, server, priority=None):
+        self._server = server
+        self._priority = priority
+
+    def __getattr__(self, name):
+        if name not in _REMOTE_METHODS:
+            raise AttributeError(f"'{type(self).__name__}' has no remote BesFM method '{name}'")
+        priority = self._priority
+        if priority is None:
+            priority = _METHOD_PRIORITY.get(name, PRIORITY_USER)
+
+        def call(*args, **kwargs):
+            return self._server.call(priority, name, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+
+def io_process_enabled():
+    """BESFM_IO_PROCESS 환경 변수로 I/O 서버 프로세스 사용 여부 확인"""
+    return os.environ.get(IO_PROCESS_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
@@ -0,0 +1,142 @@
+"""
+BesFM USB I/O 워커 - 기기별 단일 스레드에서 모든 전송을 직렬화
+"""
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+
+
+# 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_USER = 0   # 사용자 조작 (전원, 볼륨, 뮤트 등)
+PRIORITY_TUNE = 1   # 튜닝 / 시크
+PRIORITY_POLL = 2   # 백그라운드 RSSI / RDS 폴링
+
+# 프록시 호출 시 메서드별 기본 우선순위
+_METHOD_PRIORITY = {
+    'set_channel': PRIORITY_TUNE,
+    'get_channel': PRIORITY_TUNE,
+    'tune': PRIORITY_TUNE,
+    'seek': PRIORITY_TUNE,
+    'seek_station': PRIORITY_TUNE,
+    'seek_up': PRIORITY_TUNE,
+    'seek_down': PRIORITY_TUNE,
+    'seek_stop': PRIORITY_TUNE,
+    'get_rssi': PRIORITY_POLL,
+    'get_status': PRIORITY_POLL,
+}
+
+_STOP = object()
+
+
+class BesFMWorker:
+    """BesFM 인스턴스를 소유하고 우선순위 큐로 명령을 처리하는 I/O 워커"""
+
+    def __init__(self, fm, name=None):
+        self.fm = fm
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()  # 같은 우선순위 내 FIFO 보장
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=name or "BesFMWorker", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, priority, func, *args, **kwargs):
+        """
+        명령을 큐에 넣고 Future 반환
+
+        Args:
+            priority (int): PRIORITY_USER / PRIORITY_TUNE / PRIORITY_POLL
+            func: BesFM 메서드 이름(str) 또는 호출 가능한 객체
+
+        Returns:
+            concurrent.futures.Future: 명령 결과
+        """
+        if isinstance(func, str):
+            func = getattr(self.fm, func)
+        future = Future()
+        if not self._running:
+            future.set_exception(RuntimeError("I/O worker is stopped"))
+            return future
+        self._queue.put((priority, next(self._sequence), future, func, args, kwargs))
+        return future
+
+    def call(self, priority, func, *args, timeout=None, **kwargs):
+        """명령을 실행하고 결과를 기다림 (워커 스레드에서 호출 시 즉시 실행)"""
+        if self.in_worker_thread():
+            if isinstance(func, str):
+                func = getattr(self.fm, func)
+            return func(*args, **kwargs)
+        return self.submit(priority, func, *args, **kwargs).result(timeout)
+
+    def proxy(self, priority=None):
+        """BesFM과 같은 인터페이스로 워커를 통해 호출하는 프록시 반환"""
+        return BesFMProxy(self, priority)
+
+    def in_worker_thread(self):
+        """현재 스레드가 워커 스레드인지 확인"""
+        return threading.current_thread() is self._thread
+
+    def pending(self):
+        """대기 중인 명령 수"""
+        return self._queue.qsize()
+
+    def stop(self, timeout=1.0):
+        """워커 중지 - 대기 중인 명령은 취소됨"""
+        if not self._running:
+            return
+        self._running = False
+        # 가장 낮은 우선순위보다 뒤에 처리되도록 넣어서 남은 명령 정리
+        self._queue.put((float('inf'), next(self._sequence), None, _STOP, (), {}))
+        if not self.in_worker_thread():
+            self._thread.join(timeout=timeout)
+
+    def _run(self):
+        """워커 메인 루프"""
+        while True:
+            _, _, future, func, args, kwargs = self._queue.get()
+            if func is _STOP:
+                break
+            if not self._running:
+                future.cancel()
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        # 중지 후 남은 명령 취소
+        while True:
+            try:
+                _, _, future, func, _, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None:
+                future.cancel()
+
+
+class BesFMProxy:
+    """BesFM 메서드 호출을 워커로 전달하고 결과를 기다리는 프록시"""
+
+    def __init__(self, worker, priority=None):
+        self._worker = worker
+        self._priority = priority
+
+    def __getattr__(self, name):
+        attr = getattr(self._worker.fm, name)
+        if not callable(attr):
+            return attr
+        priority = self._priority
+        if priority is None:
+            priority = _METHOD_PRIORITY.get(name, PRIORITY_USER)
+
+        def call(*args, **kwargs):
+            return self._worker.call(priority, attr, *args, **kwargs)
+
+        call.__name__ = name
+        return call
@@ -0,0 +1,250 @@
+"""
+BesFM 로깅 - 서브시스템별 레벨, 메모리 링 버퍼, 백그라운드 스레드의 콘솔 / JSON lines 출력
+
+메시지는 logging의 지연 포맷(log.info("... %s", value))으로 남기므로 레벨이 꺼져 있으면 문자열을
+만들지 않는다. 호출한 스레드는 링 버퍼에 레코드를 넣고 출력 큐에 넘기기만 하고, 포맷과 콘솔 /
+파일 쓰기는 모두 출력 스레드가 한다 (느린 stdout이 전송 경로를 막지 않음).
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from collections import deque
+
+
+# 이 환경 변수가 있으면 configure_logging()이 JSON lines 파일에도 기록 (값: 파일 경로)
+LOG_FILE_ENV = 'BESFM_LOG'
+
+# 서브시스템별 레벨 (예: "INFO,usb=DEBUG,audio=WARNING" - 이름 없는 항목은 전체 기본값)
+LOG_LEVELS_ENV = 'BESFM_LOG_LEVELS'
+
+# 모든 서브시스템 로거의 부모
+ROOT_LOGGER = 'besfm'
+
+DEFAULT_LEVEL = logging.INFO
+
+# 링 버퍼에 보관할 최근 레코드 수
+RING_CAPACITY = 2000
+
+
+def get_logger(subsystem):
+    """서브시스템 로거 (예: 'usb', 'retry', 'audio', 'gui')"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def _subsystem(record):
+    name = record.name
+    return name[len(ROOT_LOGGER) + 1:] if name.startswith(ROOT_LOGGER + '.') else name
+
+
+def record_to_dict(record):
+    """LogRecord -> JSON으로 쓸 dict (여기서 처음 메시지를 포맷)"""
+    entry = {
+        'time': round(record.created, 6),
+        'level': record.levelname,
+        'subsystem': _subsystem(record),
+        'message': record.getMessage(),
+        'thread': record.threadName,
+    }
+    if record.exc_info:
+        entry['exception'] = logging.Formatter().formatException(record.exc_info)
+    return entry
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로"""
+
+    def format(self, record):
+        return json.dumps(record_to_dict(record), ensure_ascii=False)
+
+
+class RingBufferHandler(logging.Handler):
+    """최근 레코드를 포맷하지 않은 채 메모리에 보관 (dump()할 때만 포맷)"""
+
+    def __init__(self, capacity=RING_CAPACITY):
+        super().__init__(logging.DEBUG)
+        self._records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self._records.append(record)
+
+    @property
+    def capacity(self):
+        return self._records.maxlen
+
+    def records(self):
+        """보관 중인 레코드 (오래된 것부터)"""
+        return list(self._records)
+
+    def clear(self):
+        self._records.clear()
+
+    def dump(self, path=None):
+        """
+        보관 중인 레코드를 JSON lines로 저장 (path가 없으면 줄 목록만 반환)
+
+        Returns:
+            list: JSON 문자열 목록
+        """
+        lines = [json.dumps(record_to_dict(record), ensure_ascii=False)
+                 for record in self.records()]
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.writelines(line + '\n' for line in lines)
+        return lines
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler는 넣기 전에 메시지를 포맷하므로, 포맷은 출력 스레드에 맡기고 레코드를 그대로 넘김"""
+
+    def prepare(self, record):
+        return record
+
+
+class _LogState:
+    """configure_logging()이 설치한 핸들러 / 출력 스레드"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ring = RingBufferHandler()
+        self.queue_handler = None
+        self.listener = None
+
+
+_state = _LogState()
+
+
+def parse_levels(spec):
+    """
+    레벨 지정 문자열 파싱
+
+    "INFO,usb=DEBUG" -> {'': 'INFO', 'usb': 'DEBUG'} (빈 키는 전체 기본값)
+    """
+    levels = {}
+    for item in (spec or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, level = item.rpartition('=')
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def set_level(subsystem, level):
+    """서브시스템 레벨 변경 (subsystem이 빈 문자열이면 전체 기본값)"""
+    logger = get_logger(subsystem) if subsystem else logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level)
+
+
+def configure_logging(levels=None, path=None, console=True, capacity=RING_CAPACITY):
+    """
+    로깅 설치 (다시 호출하면 이전 출력 스레드를 멈추고 교체)
+
+    Args:
+        levels (dict | str): 서브시스템별 레벨 ({'usb': 'DEBUG'} 또는 "INFO,usb=DEBUG",
+            None이면 BESFM_LOG_LEVELS)
+        path (str): JSON lines 파일 경로 (None이면 BESFM_LOG, 둘 다 없으면 파일 출력 없음)
+        console (bool): 메시지를 stdout에도 출력
+        capacity (int): 링 버퍼 크기
+
+    Returns:
+        RingBufferHandler: 링 버퍼 (dump_log()로도 접근 가능)
+    """
+    if levels is None:
+        levels = os.environ.get(LOG_LEVELS_ENV)
+    if isinstance(levels, str):
+        levels = parse_levels(levels)
+    if path is None:
+        path = os.environ.get(LOG_FILE_ENV) or None
+
+    handlers = []
+    if console:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(stream)
+    if path:
+        file_handler = logging.FileHandler(path, mode='a', encoding='utf-8')
+        file_handler.setFormatter(JSONLinesFormatter())
+        handlers.append(file_handler)
+
+    with _state.lock:
+        root = logging.getLogger(ROOT_LOGGER)
+        _stop_listener()
+        if _state.ring.capacity != capacity:
+            root.removeHandler(_state.ring)
+            _state.ring = RingBufferHandler(capacity)
+        root.propagate = False
+        root.setLevel(DEFAULT_LEVEL)
+        for name, level in (levels or {}).items():
+            set_level(name, level)
+        if _state.ring not in root.handlers:
+            root.addHandler(_state.ring)
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            _state.queue_handler = _DeferredQueueHandler(log_queue)
+            _state.listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _state.listener.start()
+            root.addHandler(_state.queue_handler)
+    return _state.ring
+
+
+def _stop_listener():
+    """출력 스레드 정지 (남은 레코드는 모두 쓴 뒤 종료) - _state.lock을 잡은 상태에서 호출"""
+    if _state.queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_state.queue_handler)
+        _state.queue_handler = None
+    if _state.listener is not None:
+        listener, _state.listener = _state.listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def shutdown_logging():
+    """출력 스레드를 멈추고 파일을 닫음 (링 버퍼는 유지)"""
+    with _state.lock:
+        _stop_listener()
+
+
+def log_records():
+    """링 버퍼의 최근 레코드"""
+    return _state.ring.records()
+
+
+def dump_log(path=None):
+    """
+    링 버퍼를 JSON lines로 저장 (path가 없으면 현재 디렉터리의 besfm-log-<시각>.jsonl)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    if path is None:
+        path = time.strftime('besfm-log-%Y%m%d-%H%M%S.jsonl')
+    _state.ring.dump(path)
+    return path
+
+
+def install_dump_signal():
+    """SIGUSR1을 받으면 링 버퍼 저장 (지원하지 않는 OS / 메인 스레드가 아니면 False)"""
+    if not hasattr(signal, 'SIGUSR1') or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def handler(signum, frame):
+        path = dump_log()
+        get_logger('log').info("Log ring buffer written to %s", path)
+
+    signal.signal(signal.SIGUSR1, handler)
+    return True
+
+
+# 설정 전에도 링 버퍼에는 남김 (출력은 configure_logging() 이후부터)
+logging.getLogger(ROOT_LOGGER).addHandler(_state.ring)
+atexit.register(shutdown_logging)
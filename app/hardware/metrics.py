@@ -0,0 +1,230 @@
+"""
+BesFM 명령별 지연 히스토그램 / 카운터 - 어떤 명령이 튜닝 / 시크 시간을 차지하는지 측정
+"""
+import json
+import threading
+
+from .besfm_enums import BesCmd
+
+
+# 이 환경 변수가 있으면 GUI가 지표 수집을 켜고 기기 해제 시 요약을 남김
+#   "1" / "true" -> 표로 출력, 그 외 값 -> JSON 파일 경로
+METRICS_ENV = 'BESFM_METRICS'
+
+# 로그-선형 버킷: 마이크로초 값이 [2^e, 2^(e+1)) 구간이면 그 구간을 _SUB_BUCKETS개로 균등 분할
+_SUB_BITS = 2
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_EXPONENT = 31  # 약 35분
+BUCKET_COUNT = _SUB_BUCKETS + (_MAX_EXPONENT - _SUB_BITS + 1) * _SUB_BUCKETS
+
+# 지연 키 (pacing.set_key / get_key) -> BesCmd 이름 (Enum 별칭 때문에 .name 대신 직접 지정)
+_SET_NAMES = {
+    BesCmd.SET_POWER_STATE.value: 'SET_POWER_STATE',
+    BesCmd.SET_FM_BAND.value: 'SET_FM_BAND',
+    BesCmd.SET_CHAN_RSSI_TH.value: 'SET_CHAN_RSSI_TH',
+    BesCmd.SET_CHAN_SPACING.value: 'SET_CHAN_SPACING',
+    BesCmd.SET_MUTE.value: 'SET_MUTE',
+    BesCmd.SET_VOLUME.value: 'SET_VOLUME',
+    BesCmd.SET_MONO_MODE.value: 'SET_MONO_MODE',
+    BesCmd.SET_SEEK_START.value: 'SET_SEEK_START',
+    BesCmd.SET_SEEK_STOP.value: 'SET_SEEK_STOP',
+    BesCmd.SET_CHANNEL.value: 'SET_CHANNEL',
+    BesCmd.SET_RDS.value: 'SET_RDS',
+    BesCmd.SET_DC_THRES.value: 'SET_DC_THRES',
+    BesCmd.SET_SPIKE_THRES.value: 'SET_SPIKE_THRES',
+    BesCmd.SET_TEST_MODE.value: 'SET_TEST_MODE',
+    BesCmd.SET_RECORDING_MODE.value: 'SET_RECORDING_MODE',
+}
+_GET_NAMES = {
+    member.value: name for name, member in BesCmd.__members__.items()
+    if name.startswith('GET_') and name not in ('GET_FM_INDEX', 'GET_DATA_LENGTH')
+}
+_NAMED_KEYS = {
+    'set_power': 'SET_POWER_STATE',
+    'set_mute': 'SET_MUTE',
+    'set_volume': 'SET_VOLUME',
+    'set_channel': 'SET_CHANNEL',
+    'query': 'QUERY',
+    'notify': 'NOTIFY',
+}
+
+
+def bucket_index(seconds):
+    """지연(초)의 버킷 번호"""
+    micros = int(seconds * 1000000)
+    if micros < _SUB_BUCKETS:
+        return micros if micros > 0 else 0
+    exponent = micros.bit_length() - 1
+    if exponent > _MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub = (micros >> (exponent - _SUB_BITS)) & (_SUB_BUCKETS - 1)
+    return _SUB_BUCKETS + (exponent - _SUB_BITS) * _SUB_BUCKETS + sub
+
+
+def bucket_upper_bound(index):
+    """버킷의 상한 (초)"""
+    if index < _SUB_BUCKETS:
+        return (index + 1) / 1000000
+    exponent = (index - _SUB_BUCKETS) // _SUB_BUCKETS + _SUB_BITS
+    sub = (index - _SUB_BUCKETS) % _SUB_BUCKETS
+    width = 1 << (exponent - _SUB_BITS)
+    return ((1 << exponent) + (sub + 1) * width) / 1000000
+
+
+def command_label(key):
+    """지연 키를 BesCmd 이름으로 변환 (예: 'get_13' -> 'GET_CURRENT_CHANNEL')"""
+    label = _NAMED_KEYS.get(key)
+    if label is not None:
+        return label
+    kind, _, code = key.partition('_')
+    if code.isdigit():
+        if kind == 'set':
+            return _SET_NAMES.get(int(code), f'SET_{code}')
+        if kind == 'get':
+            return _GET_NAMES.get(int(code), f'GET_{code}')
+    return key.upper()
+
+
+class LatencyHistogram:
+    """단일 명령의 지연 분포 (한 스레드만 기록, 읽기 시 병합)"""
+
+    __slots__ = ('counts', 'count', 'errors', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds, ok=True):
+        self.counts[bucket_index(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if not ok:
+            self.errors += 1
+
+    def merge(self, other):
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    def percentile(self, fraction):
+        """백분위 지연 (초, 버킷 상한 기준)"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return min(bucket_upper_bound(i), self.max)
+        return self.max
+
+
+class CommandMetrics:
+    """
+    명령 키별 지연 히스토그램 모음
+
+    기록은 스레드별 샤드에만 쓰므로 전송 경로에서 락을 잡지 않는다.
+    (샤드 목록에 새 샤드를 추가할 때만 락 사용)
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'histograms', None)
+        if shard is None:
+            shard = self._local.histograms = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def record(self, key, seconds, ok=True):
+        """
+        전송 1회 기록
+
+        Args:
+            key (str): 지연 키 (pacing.set_key / get_key, 'query', 'notify')
+            seconds (float): 재시도를 포함한 호출 시간
+            ok (bool): 최종 성공 여부
+        """
+        shard = getattr(self._local, 'histograms', None) or self._shard()
+        histogram = shard.get(key)
+        if histogram is None:
+            histogram = shard[key] = LatencyHistogram()
+        histogram.record(seconds, ok)
+
+    def merged(self):
+        """모든 스레드의 기록을 병합한 {키: LatencyHistogram}"""
+        with self._lock:
+            shards = list(self._shards)
+        result = {}
+        for shard in shards:
+            for key, histogram in list(shard.items()):
+                merged = result.get(key)
+                if merged is None:
+                    merged = result[key] = LatencyHistogram()
+                merged.merge(histogram)
+        return result
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+    def report(self, retry_stats=None):
+        """
+        명령별 요약
+
+        Args:
+            retry_stats (dict): RetryEngine.get_stats() 결과 (주면 재시도 / 오류 수 포함)
+
+        Returns:
+            dict: {BesCmd 이름: {count, failures, errors, retries, mean_ms, p50_ms, p90_ms, p99_ms,
+                   max_ms, total_ms}} - 호출 시간 합계가 큰 명령부터
+        """
+        per_command = (retry_stats or {}).get('per_command', {})
+        report = {}
+        for key, histogram in sorted(self.merged().items(), key=lambda kv: -kv[1].total):
+            retry = per_command.get(key, {})
+            report[command_label(key)] = {
+                'count': histogram.count,
+                'failures': histogram.errors,
+                'errors': retry.get('errors', histogram.errors),
+                'retries': retry.get('retries', 0),
+                'mean_ms': round(histogram.total / histogram.count * 1000, 3) if histogram.count else 0.0,
+                'p50_ms': round(histogram.percentile(0.5) * 1000, 3),
+                'p90_ms': round(histogram.percentile(0.9) * 1000, 3),
+                'p99_ms': round(histogram.percentile(0.99) * 1000, 3),
+                'max_ms': round(histogram.max * 1000, 3),
+                'total_ms': round(histogram.total * 1000, 3),
+            }
+        return report
+
+    def dump(self, path=None, retry_stats=None):
+        """요약을 JSON 파일로 저장하거나 (path가 없으면) 표로 출력"""
+        report = self.report(retry_stats)
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            return report
+        print(f"{'command':<40} {'count':>7} {'err':>5} {'retry':>5} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'total ms':>10}")
+        for label, row in report.items():
+            print(f"{label:<40} {row['count']:>7} {row['errors']:>5} {row['retries']:>5} "
+                  f"{row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['max_ms']:>8.3f} "
+                  f"{row['total_ms']:>10.3f}")
+        return report
@@ -0,0 +1,177 @@
+"""
+BesFM 명령 간 적응형 지연 제어 - 고정 sleep 대신 측정값으로 최소 안전 간격 학습
+"""
+import threading
+import time
+
+from .registers import REGISTERS
+
+
+# SET 코드별 지연 키 (레지스터 표에 안정화 시간이 있는 명령만 이름으로 구분)
+_SET_KEYS = {reg.set: f'set_{reg.name}' for reg in REGISTERS.values()
+             if reg.set is not None and reg.settle is not None}
+
+# 기존 고정 지연값을 학습 시작점으로 사용 (전송 후 다음 전송까지의 간격, 초)
+DEFAULT_DELAYS = {
+    'set': 0.001,
+    'get': 0.001,
+    'query': 0.0,
+}
+
+# 안정화 시간이 있는 명령(전원 / 뮤트 / 볼륨 / 주파수 - pop sound 방지)은 레지스터 표의 값이 최소 간격
+# (안정화 부족은 USB 오류로 드러나지 않으므로 성공 횟수만으로 줄이면 안 됨)
+SETTLE_FLOORS = {f'set_{reg.name}': reg.settle for reg in REGISTERS.values()
+                 if reg.set is not None and reg.settle is not None}
+DEFAULT_DELAYS.update(SETTLE_FLOORS)
+
+
+def set_key(cmd):
+    """SET 코드의 지연 키"""
+    return _SET_KEYS.get(cmd, f'set_{cmd}')
+
+
+def get_key(cmd):
+    """GET 코드의 지연 키"""
+    return f'get_{cmd}'
+
+
+class _PacingEntry:
+    """명령 종류 하나의 학습 상태"""
+
+    __slots__ = ('delay', 'floor', 'turnaround', 'samples', 'errors', 'streak')
+
+    def __init__(self, delay, floor):
+        self.delay = delay
+        self.floor = floor
+        self.turnaround = 0.0
+        self.samples = 0
+        self.errors = 0
+        self.streak = 0
+
+
+class PacingController:
+    """
+    명령 종류별 전송 시간/오류율을 측정해 전송 후 간격을 조정
+
+    - 연속 성공이 success_streak번 쌓이면 간격을 decrease_factor배로 줄임
+      (안정화 명령은 SETTLE_FLOORS, 나머지는 min_delay와 측정한 전송 시간의 절반 중 큰 값까지만)
+    - 오류가 나면 직전 명령과 실패한 명령의 간격을 두 배로 늘림
+    - 간격은 sleep이 아니라 "다음 전송 가능 시각"으로 관리하므로
+      명령 사이에 이미 시간이 흘렀다면 추가 대기가 없음
+    """
+
+    def __init__(self, min_delay=0.0002, max_delay=0.05,
+                 success_streak=16, decrease_factor=0.8):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.success_streak = success_streak
+        self.decrease_factor = decrease_factor
+        self._stats = {}  # key -> _PacingEntry
+        self._ready_at = 0.0
+        self._last_key = None
+        self._lock = threading.Lock()
+
+    def _entry(self, key):
+        entry = self._stats.get(key)
+        if entry is None:
+            default = DEFAULT_DELAYS.get(key)
+            if default is None:
+                default = DEFAULT_DELAYS['set' if key.startswith('set') else 'get']
+            entry = self._stats[key] = _PacingEntry(default, SETTLE_FLOORS.get(key, 0.0))
+        return entry
+
+    def _lower_bound(self, entry):
+        """간격을 줄일 수 있는 하한 (안정화 시간, 없으면 측정한 전송 시간 기반)"""
+        if entry.floor:
+            return max(self.min_delay, entry.floor)
+        # 기기가 앞 명령을 처리하는 시간은 전송 왕복 시간과 비례하므로 그 절반은 남겨 둠
+        return max(self.min_delay, min(entry.turnaround * 0.5, self.max_delay))
+
+    def wait_ready(self):
+        """
+        이전 명령의 안정화 간격이 끝날 때까지 대기
+
+        Returns:
+            float: 대기 후 time.monotonic() 값 (전송 시작 시각으로 사용)
+        """
+        now = time.monotonic()
+        if self._ready_at > now:
+            time.sleep(self._ready_at - now)
+            now = time.monotonic()
+        return now
+
+    def record(self, key, started, finished, ok):
+        """
+        전송 결과 기록
+
+        Args:
+            key (str): 지연 키 (set_key / get_key)
+            started (float): 전송 시작 시각 (time.monotonic())
+            finished (float): 전송 종료 시각 (time.monotonic())
+            ok (bool): 성공 여부
+        """
+        elapsed = finished - started
+        with self._lock:
+            entry = self._stats.get(key) or self._entry(key)
+            entry.samples += 1
+            # 전송 시간 지수 이동 평균
+            if entry.turnaround == 0.0:
+                entry.turnaround = elapsed
+            else:
+                entry.turnaround += (elapsed - entry.turnaround) * 0.125
+
+            if ok:
+                entry.streak += 1
+                if entry.streak >= self.success_streak:
+                    entry.streak = 0
+                    entry.delay = max(self._lower_bound(entry), entry.delay * self.decrease_factor)
+                self._ready_at = finished + entry.delay
+            else:
+                entry.errors += 1
+                self._back_off(entry)
+                # 직전 명령의 간격이 부족했을 가능성
+                if self._last_key is not None and self._last_key != key:
+                    self._back_off(self._entry(self._last_key))
+                self._ready_at = finished
+
+            self._last_key = key
+
+    def _back_off(self, entry):
+        entry.streak = 0
+        entry.delay = min(self.max_delay, max(entry.delay * 2, 0.001))
+
+    def get_delay(self, key):
+        """현재 학습된 간격 (초)"""
+        with self._lock:
+            return self._entry(key).delay
+
+    def to_dict(self):
+        """설정 저장용 학습 결과"""
+        with self._lock:
+            return {
+                key: {
+                    'delay': round(entry.delay, 6),
+                    'turnaround': round(entry.turnaround, 6),
+                    'samples': entry.samples,
+                    'errors': entry.errors,
+                }
+                for key, entry in self._stats.items()
+            }
+
+    def load(self, profile):
+        """저장된 학습 결과 적용"""
+        if not isinstance(profile, dict):
+            return
+        with self._lock:
+            for key, data in profile.items():
+                if not isinstance(data, dict):
+                    continue
+                entry = self._entry(key)
+                try:
+                    delay = float(data.get('delay', entry.delay))
+                    entry.turnaround = float(data.get('turnaround', 0.0))
+                    entry.samples = int(data.get('samples', 0))
+                    entry.errors = int(data.get('errors', 0))
+                except (TypeError, ValueError):
+                    continue
+                entry.delay = min(self.max_delay, max(self._lower_bound(entry), delay))
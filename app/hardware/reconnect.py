@@ -0,0 +1,208 @@
+"""
+BesFM 자동 재연결 감시기 - 기기 분리를 감지하면 같은 기기를 다시 찾아 열고 마지막 상태 재적용
+"""
+import threading
+import time
+
+from .device_info import DeviceInfo
+from .hotplug import get_hotplug_watcher, port_path, HOTPLUG_DETACH
+from .io_worker import PRIORITY_USER
+from .log import get_logger
+from .metrics import LatencyHistogram
+
+
+_log = get_logger('reconnect')
+
+RECONNECT_LOST = 'lost'
+RECONNECT_RESTORED = 'restored'
+RECONNECT_FAILED = 'failed'
+
+
+class ReconnectSupervisor:
+    """
+    한 기기의 연결을 감시하고 끊기면 자동으로 복구
+
+    - 분리 감지: 전송 중 기기 분리 오류(서킷 브레이커 열림) 또는 핫플러그 분리 이벤트
+    - 같은 기기 찾기: 시리얼 번호, 없으면 물리 포트 경로
+    - 복구: I/O 워커에서 BesFM.reopen()으로 기기를 교체하고 마지막 상태를 한 번에 순서대로 재전송
+      (같은 BesFM / 워커 / 프록시를 계속 쓰므로 사용하는 쪽은 아무것도 바꿀 필요가 없음)
+    - 분리 감지부터 복구 완료까지의 시간을 히스토그램으로 기록 (지표 수집 중이면 'reconnect' 키로도 기록)
+    """
+
+    def __init__(self, fm, worker, device, watcher=None, timeout=30.0, retry_interval=0.2):
+        """
+        Args:
+            fm (BesFM): 감시할 기기
+            worker (BesFMWorker): fm을 소유한 I/O 워커
+            device: 현재 usb.core.Device
+            watcher (HotplugWatcher): 기기 목록 감시기 (없으면 공용 감시기)
+            timeout (float): 기기가 다시 나타나기를 기다리는 최대 시간 (초)
+            retry_interval (float): 다시 열기 실패 후 재시도 간격 (초)
+        """
+        self.fm = fm
+        self._worker = worker
+        self._device = device
+        self._watcher = watcher
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._serial = None
+        self._port = port_path(device)
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.histogram = LatencyHistogram()
+        self.last_reconnect_time = None
+
+    @property
+    def device(self):
+        """현재 연결된 usb.core.Device (재연결 후에는 새 기기)"""
+        return self._device
+
+    def subscribe(self, callback):
+        """
+        상태 콜백 등록 - callback(event, detail)은 감시 스레드에서 호출됨
+
+        event: RECONNECT_LOST / RECONNECT_RESTORED / RECONNECT_FAILED
+        detail: {'device', 'seconds', 'replayed'} (LOST는 {'device'})
+        """
+        with self._lock:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        """콜백 해제"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def start(self):
+        """감시 시작 - 현재 상태를 복원 대상 상태로 기록"""
+        if self.is_running():
+            return
+        # 시리얼 번호는 디스크립터를 읽는 대로 채움 (그 전에 분리되면 포트 경로로 찾음)
+        DeviceInfo(self._device).add_done_callback(self._on_descriptors)
+        try:
+            self._worker.call(PRIORITY_USER, self.fm.capture_state)
+        except Exception as e:
+            _log.warning("Could not capture device state: %s", e)
+        if self._watcher is None:
+            self._watcher = get_hotplug_watcher()
+        # 분리는 전송 오류로도 감지하므로 이 구독 때문에 버스 폴링을 유지하지는 않음
+        self._watcher.subscribe(self._on_hotplug, passive=True)
+        self.fm.set_disconnect_callback(self._on_device_gone)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="BesFMReconnect", daemon=True)
+        self._thread.start()
+
+    def _on_descriptors(self, info):
+        self._serial = info.peek('serial_number')
+
+    def stop(self, timeout=1.0):
+        """감시 중지"""
+        self._stop.set()
+        self._lost.set()
+        self.fm.set_disconnect_callback(None)
+        if self._watcher is not None:
+            self._watcher.unsubscribe(self._on_hotplug)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def is_running(self):
+        """감시 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self):
+        """재연결 횟수 / 실패 수 / 소요 시간 (ms)"""
+        histogram = self.histogram
+        return {
+            'reconnects': histogram.count - histogram.errors,
+            'failures': histogram.errors,
+            'last_ms': None if self.last_reconnect_time is None
+                       else round(self.last_reconnect_time * 1000, 3),
+            'p50_ms': round(histogram.percentile(0.5) * 1000, 3),
+            'max_ms': round(histogram.max * 1000, 3),
+        }
+
+    def _on_device_gone(self, error):
+        """전송 스레드에서 호출 - 재연결 스레드만 깨움"""
+        self._lost.set()
+
+    def _on_hotplug(self, event, info):
+        """핫플러그 스레드에서 호출"""
+        if event != HOTPLUG_DETACH:
+            return
+        device = self._device
+        if info['device'] is device or (info['bus'], info['address']) == (device.bus, device.address):
+            self._lost.set()
+
+    def _notify(self, event, detail):
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(event, detail)
+            except Exception as e:
+                _log.exception("Reconnect callback failed: %s", e)
+
+    def _run(self):
+        """감시 루프"""
+        while True:
+            self._lost.wait()
+            if self._stop.is_set():
+                break
+            self._lost.clear()
+            self._reconnect()
+
+    def _find(self, deadline):
+        """같은 기기가 다시 나타날 때까지 대기 (시리얼 번호 우선, 없으면 포트 경로)"""
+        remaining = max(0.0, deadline - time.monotonic())
+        if self._serial:
+            return self._watcher.wait_for(self._serial, timeout=remaining)
+        if self._port is not None:
+            return self._watcher.wait_for(timeout=remaining, port=self._port)
+        # 식별 정보가 없으면 같은 위치만 시도
+        return self._watcher.wait_for(timeout=remaining, bus=self._device.bus,
+                                      address=self._device.address)
+
+    def _reconnect(self):
+        """기기를 다시 찾아 열고 상태 재적용"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        _log.warning("FM radio device lost, reconnecting: %s", self._serial or self._port)
+        self._notify(RECONNECT_LOST, {'device': self._device})
+        while not self._stop.is_set() and time.monotonic() < deadline:
+            info = self._find(deadline)
+            if info is None or self._stop.is_set():
+                break
+            try:
+                replayed = self._worker.call(PRIORITY_USER, self.fm.reopen, info['device'])
+            except Exception as e:
+                # 분리 직후라 캐시에 남아 있던 이전 기기이거나 아직 준비되지 않은 기기
+                _log.debug("Reconnect attempt failed: %s", e)
+                self._stop.wait(self.retry_interval)
+                if not self._watcher.is_running():
+                    self._watcher.refresh()
+                continue
+            elapsed = time.monotonic() - started
+            self._device = info['device']
+            self._port = port_path(self._device) or self._port
+            self._lost.clear()
+            self.histogram.record(elapsed)
+            self.last_reconnect_time = elapsed
+            self.fm.record_event('reconnect', elapsed)
+            _log.info("FM radio device reconnected in %.0f ms (%d commands replayed)", elapsed * 1000, replayed)
+            self._notify(RECONNECT_RESTORED,
+                         {'device': self._device, 'seconds': elapsed, 'replayed': replayed})
+            return True
+        if self._stop.is_set():
+            return False
+        elapsed = time.monotonic() - started
+        self.histogram.record(elapsed, ok=False)
+        self.fm.record_event('reconnect', elapsed, ok=False)
+        _log.error("FM radio device did not come back within %.0f s", self.timeout)
+        self._notify(RECONNECT_FAILED, {'device': self._device, 'seconds': elapsed, 'replayed': 0})
+        return False
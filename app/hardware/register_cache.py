@@ -0,0 +1,94 @@
+"""
+BesFM 섀도 레지스터 캐시 - GET 결과를 TTL 동안 보관하고 SET 시 write-through 갱신
+"""
+import struct
+import threading
+import time
+
+from .besfm_enums import BesCmd
+from .registers import GET_TTLS, SET_TO_GET
+
+
+# GET 레지스터별 기본 TTL (초) - 0이면 캐시하지 않음, None이면 만료 없음
+DEFAULT_TTLS = dict(GET_TTLS)
+
+# SET 명령의 부수 효과로 값이 바뀔 수 있는 GET 레지스터 (None이면 전체 무효화)
+SET_SIDE_EFFECTS = {
+    BesCmd.SET_POWER_STATE.value: None,
+    BesCmd.SET_RECORDING_MODE.value: None,
+    BesCmd.SET_FM_BAND.value: (BesCmd.GET_CURRENT_CHANNEL.value,),
+    BesCmd.SET_CHAN_SPACING.value: (BesCmd.GET_CURRENT_CHANNEL.value,),
+    BesCmd.SET_SEEK_START.value: (BesCmd.GET_CURRENT_CHANNEL.value,),
+    BesCmd.SET_SEEK_STOP.value: (BesCmd.GET_CURRENT_CHANNEL.value,),
+}
+
+_U16 = struct.Struct('<H')
+
+
+class RegisterCache:
+    """GET 코드별 원시 응답을 보관하는 스레드 안전 캐시"""
+
+    def __init__(self, ttls=None):
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+        self._entries = {}  # get_cmd -> (expires_at, raw bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cmd):
+        """캐시된 원시 응답 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(cmd)
+            if entry is not None:
+                expires_at, raw = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self.hits += 1
+                    return raw
+                del self._entries[cmd]
+            self.misses += 1
+            return None
+
+    def put(self, cmd, raw):
+        """GET 응답 저장"""
+        ttl = self._ttls.get(cmd, 0)
+        if ttl == 0:
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[cmd] = (expires_at, bytes(raw))
+
+    def write_through(self, set_cmd, value):
+        """SET 명령 성공 후 대응하는 GET 레지스터 갱신 및 부수 효과 무효화"""
+        if set_cmd in SET_SIDE_EFFECTS:
+            affected = SET_SIDE_EFFECTS[set_cmd]
+            if affected is None:
+                self.invalidate()
+            else:
+                self.invalidate(*affected)
+        get_cmd = SET_TO_GET.get(set_cmd)
+        if get_cmd is not None:
+            self.put(get_cmd, _U16.pack(value & 0xffff))
+
+    def invalidate(self, *cmds):
+        """지정한 GET 레지스터 무효화 (인자가 없으면 전체)"""
+        with self._lock:
+            if not cmds:
+                self._entries.clear()
+                return
+            for cmd in cmds:
+                self._entries.pop(cmd, None)
+
+    def invalidate_for_set(self, set_cmd):
+        """SET 명령 실패 시 관련 레지스터 무효화"""
+        get_cmd = SET_TO_GET.get(set_cmd)
+        if get_cmd is None:
+            self.invalidate()
+        else:
+            self.invalidate(get_cmd)
+
+    def get_stats(self):
+        """캐시 적중 통계 반환"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
@@ -0,0 +1,145 @@
+"""
+BesFM 레지스터 표 - 레지스터별 읽기/쓰기 코드, 페이로드 형식, 값 범위, 안정화 시간, 캐시 TTL
+
+BesFM의 getter / setter, 스냅샷, 섀도 레지스터 캐시, pacing 초기값, 재연결 시 상태 재적용,
+기능 탐지가 모두 이 표 하나에서 만들어진다.
+"""
+import struct
+from collections import namedtuple
+from enum import Enum
+
+from .besfm_enums import BesCmd
+
+
+_U16 = struct.Struct('<H')
+
+
+def _decode_flag(raw):
+    return bool(raw[0])
+
+
+def _decode_u8(raw):
+    return raw[0]
+
+
+def _decode_u16(raw):
+    return _U16.unpack_from(raw)[0]
+
+
+def _decode_channel(raw):
+    return _U16.unpack_from(raw)[0] / 100
+
+
+def _encode_flag(value):
+    return 1 if value else 0
+
+
+def _encode_int(value):
+    if isinstance(value, Enum):
+        value = value.value
+    return int(value)
+
+
+def _encode_channel(freq):
+    # MHz -> 10kHz 단위 (int(95.1 * 100)은 9509가 되므로 반올림)
+    return int(round(freq * 100))
+
+
+# 페이로드 형식 -> (디코더, 인코더)
+LAYOUTS = {
+    'flag': (_decode_flag, _encode_flag),
+    'u8': (_decode_u8, _encode_int),
+    'u16': (_decode_u16, _encode_int),
+    'channel': (_decode_channel, _encode_channel),
+}
+
+_FIELDS = ('name', 'get', 'set', 'layout', 'minimum', 'maximum', 'settle', 'ttl',
+           'probe', 'replay', 'depends', 'ready')
+
+
+class Register(namedtuple('Register', _FIELDS)):
+    """
+    레지스터 하나의 정의
+
+    get / set: GET / SET 코드 (없으면 None)
+    layout: LAYOUTS 키
+    minimum / maximum: 허용 범위 (전송 값 기준, 없으면 None)
+    settle: 쓰기 후 안정화 간격 초기값 (초, None이면 일반 SET 간격) - pacing이 학습 시작점으로 사용
+    ttl: 캐시 TTL (초, 0이면 캐시하지 않음, None이면 만료 없음)
+    probe: 연결 시 지원 여부를 확인하는 레지스터
+    replay: 재연결 후 다시 쓰는 상태 레지스터 (표 순서대로)
+    depends: 같은 트랜잭션에 있으면 먼저 써야 하는 레지스터 이름들
+    ready: 켜는 값을 쓴 뒤 같은 트랜잭션의 다음 쓰기까지 기다릴 시간 (초, 전원 안정화 등)
+    """
+
+    __slots__ = ()
+
+    def decode(self, raw):
+        """GET 응답 -> 값"""
+        return LAYOUTS[self.layout][0](raw)
+
+    def encode(self, value):
+        """값 -> SET 전송 값 (범위를 벗어나면 ValueError)"""
+        raw = LAYOUTS[self.layout][1](value)
+        if self.minimum is not None and not self.minimum <= raw <= self.maximum:
+            raise ValueError(f"{self.name} out of range: {value}")
+        return raw
+
+
+def _register(name, read=None, write=None, layout='u8', valid=None, settle=None, ttl=30.0,
+              probe=False, replay=False, depends=(), ready=0.0):
+    minimum, maximum = valid if valid is not None else (None, None)
+    return Register(name, read, write, layout, minimum, maximum, settle, ttl, probe, replay,
+                    depends, ready)
+
+
+# 상태 레지스터는 쓰기 순서대로 (전원 / 녹음 모드가 먼저 켜져야 나머지가 적용됨)
+REGISTERS = {reg.name: reg for reg in (
+    _register('power', BesCmd.GET_FM_IC_POWER_ON_STATE.value, BesCmd.SET_POWER_STATE.value,
+              'flag', settle=0.011, ttl=5.0, replay=True, ready=0.1),
+    _register('recording', BesCmd.GET_FM_RECORDING_MODE_STATUS.value,
+              BesCmd.SET_RECORDING_MODE.value, 'flag', ttl=5.0, replay=True),
+    _register('band', BesCmd.GET_CURRENT_FM_BAND.value, BesCmd.SET_FM_BAND.value,
+              valid=(0, 3), replay=True),
+    _register('spacing', BesCmd.GET_CURRENT_SPACING.value, BesCmd.SET_CHAN_SPACING.value,
+              valid=(0, 2), replay=True),
+    _register('channel', BesCmd.GET_CURRENT_CHANNEL.value, BesCmd.SET_CHANNEL.value,
+              'channel', valid=(6400, 10800), settle=0.006, ttl=1.0, replay=True,
+              depends=('band', 'spacing')),
+    _register('mono', BesCmd.GET_FORCED_MONO_STATE.value, BesCmd.SET_MONO_MODE.value,
+              'flag', replay=True),
+    _register('rds', BesCmd.GET_RDS_STATUS.value, BesCmd.SET_RDS.value, 'flag', replay=True),
+    _register('volume', BesCmd.GET_CURRENT_VOLUME.value, BesCmd.SET_VOLUME.value,
+              valid=(0, 15), settle=0.003, ttl=5.0, replay=True),
+    _register('mute', BesCmd.GET_MUTE_STATE.value, BesCmd.SET_MUTE.value, 'flag',
+              settle=0.004, ttl=5.0, replay=True),
+    _register('rssi', BesCmd.GET_CURRENT_RSSI.value, ttl=0, probe=True),
+    # 시크 임계값 (RSSI 임계값은 쓰기 전용이라 마지막으로 쓴 값만 알 수 있음)
+    _register('rssi_threshold', write=BesCmd.SET_CHAN_RSSI_TH.value, layout='u16',
+              valid=(0, 0xFFFF), replay=True),
+    _register('dc_threshold', BesCmd.GET_CURRENT_SEEKING_DC_THRESHOLD.value,
+              BesCmd.SET_DC_THRES.value, 'u16', valid=(0, 0xFFFF), probe=True, replay=True),
+    _register('spike_threshold', BesCmd.GET_CURRENT_SEEKING_SPIKING_THRESHOLD.value,
+              BesCmd.SET_SPIKE_THRES.value, 'u16', valid=(0, 0xFFFF), probe=True, replay=True),
+    _register('ic_number', BesCmd.GET_FM_IC_NO.value, layout='u16', ttl=None, probe=True),
+    _register('ic_info', BesCmd.GET_CURRENT_FM_IC_INFO.value, layout='u16', ttl=None,
+              probe=True),
+    _register('protocol_version', BesCmd.GET_FM_PROTOCOL_VERSION.value, layout='u16',
+              ttl=None, probe=True),
+)}
+
+# 대역 레지스터 값 -> (최저, 최고 주파수) (10kHz 단위)
+BAND_LIMITS = {0: (8750, 10800), 1: (7600, 10800), 2: (7600, 9100), 3: (6400, 7600)}
+
+# 채널 간격 레지스터 값 -> 간격 (10kHz 단위)
+SPACING_STEPS = {0: 20, 1: 10, 2: 5}
+
+# 재연결 후 다시 쓰는 레지스터 (쓰기 순서)
+REPLAYED_REGISTERS = tuple(reg for reg in REGISTERS.values() if reg.replay)
+
+# SET 코드 -> 같은 값을 읽어오는 GET 코드
+SET_TO_GET = {reg.set: reg.get for reg in REGISTERS.values()
+              if reg.set is not None and reg.get is not None}
+
+# GET 코드 -> 캐시 TTL
+GET_TTLS = {reg.get: reg.ttl for reg in REGISTERS.values() if reg.get is not None}
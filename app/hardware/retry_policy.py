@@ -0,0 +1,234 @@
+"""
+BesFM USB 전송 재시도 정책 - 오류 분류, 지수 백오프, 명령별 데드라인, 서킷 브레이커
+"""
+import errno
+import random
+import threading
+import time
+
+import usb.core
+
+from .log import get_logger
+
+
+_log = get_logger('retry')
+
+# USBError 분류
+ERROR_TIMEOUT = 'timeout'            # 전송 시간 초과 - 재시도
+ERROR_STALL = 'stall'                # 파이프 stall (EPIPE) - 다음 SETUP에서 해제되므로 재시도
+ERROR_TRANSIENT = 'transient'        # busy / I/O 오류 등 일시적 오류 - 재시도
+ERROR_DEVICE_GONE = 'device_gone'    # 기기 분리 - 서킷 브레이커 열림
+ERROR_FATAL = 'fatal'                # 권한 / 잘못된 인자 등 - 재시도 무의미
+
+ERROR_KINDS = (ERROR_TIMEOUT, ERROR_STALL, ERROR_TRANSIENT, ERROR_DEVICE_GONE, ERROR_FATAL)
+
+_TIMEOUT_ERRNOS = {errno.ETIMEDOUT, 110}
+_DEVICE_GONE_ERRNOS = {errno.ENODEV, errno.ENXIO, errno.ESHUTDOWN}
+_FATAL_ERRNOS = {errno.EACCES, errno.EPERM, errno.EINVAL, errno.ENOSYS, errno.ENOMEM}
+
+
+class DeviceDisconnectedError(usb.core.USBError):
+    """기기가 분리되어 서킷 브레이커가 열린 상태"""
+
+    def __init__(self, message="FM radio device disconnected"):
+        super().__init__(message, errno=errno.ENODEV)
+
+
+def classify_usb_error(error):
+    """USBError를 errno 기준으로 분류"""
+    if isinstance(error, DeviceDisconnectedError):
+        return ERROR_DEVICE_GONE
+    timeout_error = getattr(usb.core, 'USBTimeoutError', None)
+    if timeout_error is not None and isinstance(error, timeout_error):
+        return ERROR_TIMEOUT
+    code = getattr(error, 'errno', None)
+    if code in _TIMEOUT_ERRNOS:
+        return ERROR_TIMEOUT
+    if code == errno.EPIPE:
+        return ERROR_STALL
+    if code in _DEVICE_GONE_ERRNOS:
+        return ERROR_DEVICE_GONE
+    if code in _FATAL_ERRNOS:
+        return ERROR_FATAL
+    # EBUSY / EAGAIN / EINTR / EOVERFLOW / EIO / 알 수 없는 오류
+    return ERROR_TRANSIENT
+
+
+class RetryPolicy:
+    """재시도 횟수, 백오프, 데드라인 설정"""
+
+    # 명령별 데드라인 (초) - 전원 변경처럼 기기가 오래 걸리는 명령은 여유 있게
+    DEFAULT_DEADLINES = {
+        'set_power': 0.5,
+        'set_channel': 0.3,
+        'query': 0.3,
+        'notify': 2.0,  # 알림 대기 자체가 블로킹이므로 대기 시간을 포함
+    }
+
+    def __init__(self, max_attempts=3, base_delay=0.005, max_delay=0.1,
+                 multiplier=2.0, jitter=0.5, deadline=0.2, deadlines=None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.deadlines = dict(self.DEFAULT_DEADLINES)
+        if deadlines:
+            self.deadlines.update(deadlines)
+
+    def deadline_for(self, key):
+        """명령별 데드라인 (초)"""
+        return self.deadlines.get(key, self.deadline)
+
+    def backoff(self, attempt):
+        """attempt번째 실패 후 대기 시간 (지수 백오프 + 지터)"""
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** (attempt - 1)))
+        if self.jitter:
+            delay *= 1.0 - self.jitter * random.random()
+        return delay
+
+
+class CircuitBreaker:
+    """기기 분리 시 열려서 이후 호출을 즉시 실패시킴"""
+
+    def __init__(self, reset_timeout=5.0):
+        """
+        Args:
+            reset_timeout (float): 열린 뒤 한 번의 시험 호출을 허용하기까지의 시간 (None이면 reset() 전까지 유지)
+        """
+        self.reset_timeout = reset_timeout
+        self._opened_at = None
+        self._reason = None
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        """브레이커가 열려 있는지 확인"""
+        with self._lock:
+            return self._opened_at is not None
+
+    def is_tripped(self):
+        """락 없이 열림 여부 확인 (전송 경로의 빠른 검사용)"""
+        return self._opened_at is not None
+
+    def check(self):
+        """열려 있으면 DeviceDisconnectedError 발생 (reset_timeout 경과 시 시험 호출 허용)"""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if (self.reset_timeout is not None
+                    and time.monotonic() - self._opened_at >= self.reset_timeout):
+                # half-open: 이번 호출만 통과시키고, 실패하면 다시 열림
+                self._opened_at = time.monotonic()
+                return
+            reason = self._reason
+        raise DeviceDisconnectedError(f"FM radio device disconnected: {reason}")
+
+    def trip(self, reason):
+        """브레이커 열기"""
+        with self._lock:
+            self._opened_at = time.monotonic()
+            self._reason = reason
+
+    def reset(self):
+        """브레이커 닫기"""
+        with self._lock:
+            self._opened_at = None
+            self._reason = None
+
+
+class RetryEngine:
+    """RetryPolicy와 CircuitBreaker로 전송 함수를 실행하고 통계를 집계"""
+
+    def __init__(self, policy=None, breaker=None):
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._failures = 0
+        self._errors = {kind: 0 for kind in ERROR_KINDS}
+        self._per_command = {}
+        # 기기 분리 감지 시 호출 (on_device_gone(error), 전송 스레드에서) - 재연결 감시기용
+        self.on_device_gone = None
+
+    def execute(self, key, transfer, *args):
+        """
+        전송 함수를 재시도 정책에 따라 실행
+
+        Args:
+            key (str): 명령 키 (데드라인 / 통계 구분)
+            transfer: 전송 함수 (args를 인자로 호출)
+
+        Raises:
+            DeviceDisconnectedError: 기기가 분리된 경우
+            usb.core.USBError: 재시도로 복구되지 않은 오류
+        """
+        breaker = self.breaker
+        if breaker.is_tripped():
+            breaker.check()
+        # 데드라인은 첫 시도 직전부터 계산 (첫 전송이 오래 걸린 시간도 예산에 포함)
+        deadline = time.monotonic() + self.policy.deadline_for(key)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = transfer(*args)
+            except usb.core.USBError as e:
+                kind = classify_usb_error(e)
+                self._count_error(key, kind)
+                # 실패 경로에서만 기록 (성공한 전송은 로깅 비용 없음)
+                _log.debug("%s attempt %d failed (%s): %s", key, attempt, kind, e)
+                if kind == ERROR_DEVICE_GONE:
+                    self.breaker.trip(e)
+                    self._count_failure(key)
+                    if self.on_device_gone is not None:
+                        self.on_device_gone(e)
+                    if isinstance(e, DeviceDisconnectedError):
+                        raise
+                    raise DeviceDisconnectedError(f"FM radio device disconnected: {e}") from e
+                if kind == ERROR_FATAL or attempt >= self.policy.max_attempts:
+                    self._count_failure(key)
+                    raise
+                delay = self.policy.backoff(attempt)
+                if time.monotonic() + delay > deadline:
+                    self._count_failure(key)
+                    raise
+                self._count_retry(key)
+                time.sleep(delay)
+            else:
+                if attempt > 1 or breaker.is_tripped():
+                    breaker.reset()
+                return result
+
+    def _command_stats(self, key):
+        stats = self._per_command.get(key)
+        if stats is None:
+            stats = {'retries': 0, 'failures': 0, 'errors': 0}
+            self._per_command[key] = stats
+        return stats
+
+    def _count_error(self, key, kind):
+        with self._lock:
+            self._errors[kind] += 1
+            self._command_stats(key)['errors'] += 1
+
+    def _count_retry(self, key):
+        with self._lock:
+            self._retries += 1
+            self._command_stats(key)['retries'] += 1
+
+    def _count_failure(self, key):
+        with self._lock:
+            self._failures += 1
+            self._command_stats(key)['failures'] += 1
+
+    def get_stats(self):
+        """재시도 / 실패 통계 반환"""
+        with self._lock:
+            return {
+                'retries': self._retries,
+                'failures': self._failures,
+                'errors': dict(self._errors),
+                'per_command': {key: dict(stats) for key, stats in self._per_command.items()},
+                'circuit_open': self.breaker.is_open(),
+            }
@@ -0,0 +1,304 @@
+"""
+BesFM 기기 세션 풀 - 새 기기를 백그라운드에서 열고 준비한 뒤 교체, 최근 사용한 세션은 열어 둠
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .besfm_core import BesFM
+from .device_info import DeviceInfo
+from .io_server import IOServer
+from .io_worker import BesFMWorker, PRIORITY_USER
+from .log import get_logger
+from .reconnect import ReconnectSupervisor
+from .snapshot import ALL_FIELDS
+
+
+_log = get_logger('session')
+
+# 세션을 열 때 기기별 저장 설정에서 복원하는 필드 (적용 순서대로, 시크 임계값은 위치별 보정 값)
+RESTORED_FIELDS = ('band', 'spacing', 'volume', 'rssi_threshold', 'dc_threshold',
+                   'spike_threshold')
+
+
+def session_key(device):
+    """
+    세션 식별 키 (시리얼 번호, 아직 읽지 못했거나 없으면 bus:address)
+
+    문자열 디스크립터를 기다리지 않는다. bus:address로 연 세션은 시리얼 번호를 읽으면 키가 바뀐다.
+    """
+    serial = DeviceInfo(device).peek('serial_number')
+    return serial or f"{device.bus}:{device.address}"
+
+
+class DeviceSession:
+    """
+    열려 있는 기기 하나 (BesFM + 전용 I/O 워커 + 재연결 감시기 + 마지막 스냅샷)
+
+    I/O 서버 프로세스 세션은 fm이 None이고 worker / supervisor가 IOServer다
+    (재연결 감시는 서버 프로세스 안에서 실행되고 이벤트만 전달됨).
+    """
+
+    def __init__(self, key, device, fm, worker):
+        self.key = key
+        self.device = device
+        self.fm = fm
+        self.worker = worker
+        self.proxy = worker.proxy()
+        self.supervisor = None
+        self.snapshot = None
+        self.opened_at = time.monotonic()
+        self.warm_time = None
+
+    def close(self):
+        """재연결 감시기 / 워커 중지 (BesFM은 워커와 함께 정리됨)"""
+        if self.supervisor is not None:
+            self.supervisor.stop()
+        self.worker.stop()
+
+    def __repr__(self):
+        return f"DeviceSession({self.key!r})"
+
+
+def _warm(fm, state):
+    """
+    워커에서 실행 - 응답 확인, 기능 탐지, 마지막 설정(대역 / 간격 / 볼륨 / 시크 임계값) 적용, 스냅샷 읽기
+
+    설정 적용 실패는 세션을 버릴 이유가 아니므로 출력만 하고 계속한다.
+    """
+    if not fm.is_connected():
+        raise RuntimeError("Device not responding")
+    try:
+        # 지원 명령 확인 (같은 시리얼 / 펌웨어는 캐시 사용)
+        capabilities = fm.probe_capabilities()
+        if capabilities.unsupported():
+            _log.info("Unsupported device features: %s", ', '.join(capabilities.unsupported()))
+    except Exception as e:
+        _log.warning("Capability probe failed: %s", e)
+    # 현재 상태를 먼저 읽어 두면 이미 같은 설정은 apply()가 전송하지 않음
+    snapshot = fm.get_snapshot(ALL_FIELDS)
+    config = {field: state[field] for field in RESTORED_FIELDS
+              if state.get(field) is not None and fm.supports(f"set_{field}")}
+    if not config:
+        return snapshot
+    try:
+        report = fm.apply(config)
+    except Exception as e:
+        _log.warning("Could not restore settings %s: %s", config, e)
+        return fm.get_snapshot(ALL_FIELDS)
+    if not report.transfers:
+        return snapshot
+    # 쓴 값은 캐시에 반영되어 있으므로 캐시에서 다시 구성
+    return fm.get_snapshot(ALL_FIELDS, fresh=False)
+
+
+class SessionPool:
+    """
+    기기 세션 관리
+
+    prepare()는 새 기기를 백그라운드에서 열고 준비하므로 현재 기기는 교체 직전까지
+    계속 동작한다. activate()로 교체하면 이전 세션은 닫지 않고 max_idle개까지 보관해
+    다시 선택할 때 커널 드라이버 분리 / 초기화 없이 바로 전환한다.
+    """
+
+    def __init__(self, max_idle=2, use_cache=True, metrics=False, reconnect=True,
+                 out_of_process=False):
+        """
+        Args:
+            max_idle (int): 열어 둘 대기 세션 수
+            use_cache (bool): 기기별 섀도 레지스터 캐시 사용 여부
+            metrics (bool): 기기별 지연 지표 수집 여부
+            reconnect (bool): 세션마다 자동 재연결 감시기 실행 여부
+            out_of_process (bool): 기기마다 USB I/O 서버 프로세스 사용 여부
+        """
+        self.max_idle = max_idle
+        self._use_cache = use_cache
+        self._metrics = metrics
+        self._reconnect = reconnect
+        self._out_of_process = out_of_process
+        self._active = None
+        self._idle = OrderedDict()  # key -> DeviceSession (오래된 것부터)
+        self._opening = {}          # key -> Future
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BesFMSessionOpen")
+
+    @property
+    def active(self):
+        """현재 사용 중인 세션"""
+        return self._active
+
+    def idle_keys(self):
+        """열어 둔 대기 세션 키 (최근 사용 순)"""
+        with self._lock:
+            return list(reversed(self._idle))
+
+    def open(self, device, state=None, timeout=None):
+        """prepare()를 기다려 준비된 세션 반환"""
+        return self.prepare(device, state).result(timeout)
+
+    def prepare(self, device, state=None):
+        """
+        기기 세션을 백그라운드에서 열고 준비
+
+        Args:
+            device: usb.core.Device
+            state (dict): 기기별 저장 설정 ('pacing', 'band', 'spacing', 'volume', 시크 임계값)
+                - state(device)를 호출해 설정을 돌려주는 함수면 세션 열기 스레드에서 호출
+                  (시리얼 번호 등 디스크립터를 기다리는 조회를 GUI 스레드 밖에서 하도록)
+
+        Returns:
+            concurrent.futures.Future: 준비된 DeviceSession
+        """
+        state = state or {}
+        key = session_key(device)
+        with self._lock:
+            if self._active is not None and self._active.key == key:
+                future = Future()
+                future.set_result(self._active)
+                return future
+            session = self._idle.get(key)
+            if session is None:
+                future = self._opening.get(key)
+                if future is None:
+                    future = self._executor.submit(self._open, key, device, state)
+                    self._opening[key] = future
+                return future
+        # 대기 세션은 이미 열려 있으므로 스냅샷만 새로 읽음
+        return self._refresh(session)
+
+    def _open(self, key, device, state):
+        """세션 열기 스레드에서 실행"""
+        started = time.monotonic()
+        if callable(state):
+            try:
+                state = state(device) or {}
+            except Exception:
+                with self._lock:
+                    self._opening.pop(key, None)
+                raise
+        if self._out_of_process:
+            return self._open_server(key, device, state, started)
+        try:
+            fm = BesFM(device, use_cache=self._use_cache, metrics=self._metrics)
+            if state.get('pacing'):
+                fm.load_pacing_profile(state['pacing'])
+            worker = BesFMWorker(fm, name=f"BesFMWorker-{key}")
+            session = DeviceSession(key, device, fm, worker)
+            try:
+                session.snapshot = worker.call(PRIORITY_USER, _warm, fm, state)
+            except BaseException:
+                session.close()
+                raise
+            session.warm_time = time.monotonic() - started
+            if self._reconnect:
+                session.supervisor = ReconnectSupervisor(fm, worker, device)
+                session.supervisor.start()
+            self._watch_serial(session)
+            return session
+        finally:
+            with self._lock:
+                self._opening.pop(key, None)
+
+    def _open_server(self, key, device, state, started):
+        """I/O 서버 프로세스 세션 열기 (기기 열기 / 준비는 서버 프로세스의 워커에서)"""
+        try:
+            server = IOServer(device, state, warm=_warm, use_cache=self._use_cache,
+                              metrics=self._metrics, reconnect=self._reconnect,
+                              name=f"BesFMIOServer-{key}")
+            snapshot = server.start()
+            session = DeviceSession(key, device, None, server)
+            session.snapshot = snapshot
+            session.warm_time = time.monotonic() - started
+            if self._reconnect:
+                session.supervisor = server
+            self._watch_serial(session)
+            return session
+        finally:
+            with self._lock:
+                self._opening.pop(key, None)
+
+    def _watch_serial(self, session):
+        """bus:address 키로 연 세션은 시리얼 번호를 읽는 대로 키 교체 (디스크립터 스레드에서)"""
+        DeviceInfo(session.device).add_done_callback(lambda info: self._rekey(session, info))
+
+    def _rekey(self, session, info):
+        serial = info.peek('serial_number')
+        with self._lock:
+            old = session.key
+            if not serial or serial == old:
+                return
+            session.key = serial
+            if self._idle.get(old) is session:
+                self._idle = OrderedDict((serial if key == old else key, value)
+                                         for key, value in self._idle.items())
+
+    def _refresh(self, session):
+        future = Future()
+
+        def done(snapshot_future):
+            error = snapshot_future.exception()
+            if error is not None:
+                # 대기 중 분리된 기기 - 버리고 새로 열도록 함
+                self.discard(session.key)
+                future.set_exception(error)
+                return
+            session.snapshot = snapshot_future.result()
+            future.set_result(session)
+
+        session.worker.submit(PRIORITY_USER, 'get_snapshot', ALL_FIELDS).add_done_callback(done)
+        return future
+
+    def activate(self, session):
+        """
+        세션을 현재 세션으로 교체 (이전 세션은 대기 목록으로)
+
+        Returns:
+            DeviceSession: 이전 세션 (없으면 None)
+        """
+        evicted = []
+        with self._lock:
+            previous = self._active
+            if previous is session:
+                return None
+            self._idle.pop(session.key, None)
+            self._active = session
+            if previous is not None:
+                self._idle[previous.key] = previous
+            while len(self._idle) > self.max_idle:
+                _, oldest = self._idle.popitem(last=False)
+                evicted.append(oldest)
+        for old in evicted:
+            old.close()
+        return previous
+
+    def deactivate(self):
+        """현재 세션을 대기 목록으로 옮김"""
+        with self._lock:
+            session = self._active
+            self._active = None
+            if session is not None:
+                self._idle[session.key] = session
+        return session
+
+    def discard(self, key):
+        """세션 닫고 풀에서 제거 (기기 분리 시)"""
+        with self._lock:
+            session = self._idle.pop(key, None)
+            if session is None and self._active is not None and self._active.key == key:
+                session = self._active
+                self._active = None
+        if session is not None:
+            session.close()
+
+    def close_all(self):
+        """모든 세션 닫기"""
+        with self._lock:
+            sessions = list(self._idle.values())
+            if self._active is not None:
+                sessions.append(self._active)
+            self._idle.clear()
+            self._active = None
+        for session in sessions:
+            session.close()
+        self._executor.shutdown(wait=False)
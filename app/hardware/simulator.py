@@ -0,0 +1,405 @@
+"""
+가상 BesFM 튜너 - 라디오 없이 GUI / 오디오 매니저 / 스캔 경로를 부하 테스트하기 위한 시뮬레이션 기기
+"""
+import array
+import errno
+import json
+import os
+import random
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+
+import usb.core
+
+from .besfm_enums import BesCmd
+from .log import get_logger
+from .registers import BAND_LIMITS, SET_TO_GET, SPACING_STEPS
+
+
+_log = get_logger('simulator')
+
+# 이 환경 변수가 있으면 BesFM.find_all_devices()가 가상 기기도 돌려줌
+#   "1" / "true" -> 기본 스펙트럼 기기 1대, 숫자 N -> N대, *.json 경로 -> 설정 파일
+SIMULATOR_ENV = 'BESFM_SIMULATOR'
+
+SimStation = namedtuple('SimStation', ['freq', 'rssi', 'ps', 'radiotext', 'pi'])
+SimStation.__new__.__defaults__ = ('', '', None)
+
+DEFAULT_STATIONS = (
+    SimStation(89.1, 52, 'KBS 2FM', 'Cool FM - music all day'),
+    SimStation(91.9, 47, 'MBC FM4U', 'FM4U live'),
+    SimStation(93.1, 44, 'KBS 1FM', 'Classic FM'),
+    SimStation(95.1, 38, 'TBS', 'Traffic and news'),
+    SimStation(95.9, 55, 'MBC', 'Standard FM'),
+    SimStation(97.3, 41, 'KBS 1R', ''),
+    SimStation(101.9, 49, 'SBS', 'Power FM'),
+    SimStation(103.5, 30, 'SBS LOVE', 'Love FM'),
+    SimStation(107.7, 35, 'SBS', ''),
+)
+
+_KIND_SEEK = 0
+_KIND_TUNE = 1
+_KIND_RDS = 2
+
+_NOTIFY = b'\x01\x00\x08\x00\x00'
+_STATUS_LENGTH = 12
+_SEEK_TUNE = struct.Struct('<B?HB')   # kind, success, freq, strength
+_RDS = struct.Struct('<BBB4H')        # kind, error, strength, RDS 블록 4개
+
+# SET 명령 -> 값을 보관하는 GET 레지스터
+_SET_REGISTERS = SET_TO_GET
+
+
+def _rds_groups(station):
+    """방송국 하나의 RDS 그룹 순환 목록 (0A: PS 이름, 2A: 라디오 텍스트)"""
+    pi = station.pi if station.pi is not None else 0xD000 | int(station.freq * 10) & 0xFFF
+    groups = []
+    ps = station.ps.ljust(8)[:8].encode('ascii', errors='replace')
+    for segment in range(4):
+        block_b = (0 << 12) | segment
+        block_d = ps[segment * 2] << 8 | ps[segment * 2 + 1]
+        groups.append((pi, block_b, 0xE0CD, block_d))
+    if station.radiotext:
+        text = (station.radiotext + '\r').encode('ascii', errors='replace')
+        text = text.ljust((len(text) + 3) // 4 * 4)[:64]
+        for segment in range(len(text) // 4):
+            chunk = text[segment * 4:segment * 4 + 4]
+            block_b = (2 << 12) | segment
+            groups.append((pi, block_b, chunk[0] << 8 | chunk[1], chunk[2] << 8 | chunk[3]))
+    return groups
+
+
+class _SimEndpoint:
+    """가상 알림(인터럽트) 엔드포인트"""
+
+    bEndpointAddress = 0x84
+
+    def __init__(self, device):
+        self._device = device
+
+    def read(self, size_or_buffer, timeout=None):
+        return self._device._read_notify(size_or_buffer, timeout)
+
+
+class SimulatedBesFMDevice:
+    """
+    BesFM이 사용하는 usb.core.Device 기능만 구현한 가상 FM 튜너
+
+    방송국별 RSSI / 노이즈 / RDS 그룹 스트림 / 시크 동작을 흉내 내며
+    전송 / 튜닝 안정화 / 시크 스텝 지연을 주입할 수 있다.
+
+    Args:
+        stations (list): SimStation (또는 같은 필드의 dict / 시퀀스) 목록
+        noise (float): RSSI 가우시안 노이즈 표준편차
+        noise_floor (int): 방송국이 없는 주파수의 RSSI
+        transfer_latency (float): control transfer 1회 지연 (초)
+        settle_latency (float): 주파수 설정 후 튜닝 완료 알림까지 지연 (초)
+        seek_step_latency (float): 시크 중 채널 한 칸당 지연 (초)
+        rds_interval (float): RDS 그룹 사이 간격 (초)
+        rssi_threshold (int): 시크가 멈추는 최소 RSSI
+        seed (int): 노이즈 난수 시드 (재현 가능한 부하 테스트용)
+    """
+
+    idVendor = 0x04e8
+    bcdUSB = 0x0200
+    bDeviceClass = 0
+    manufacturer = 'Samsung'
+    product = 'FM Radio (Simulated)'
+
+    def __init__(self, stations=None, noise=2.0, noise_floor=8,
+                 transfer_latency=0.0, settle_latency=0.02, seek_step_latency=0.002,
+                 rds_interval=0.1, rssi_threshold=25, seed=None,
+                 product_id=0xa054, serial_number='SIM0001', address=1, unsupported=()):
+        self.idProduct = product_id
+        self.serial_number = serial_number
+        self.bus = 0
+        self.address = address
+        self.description = f"Simulated FM Radio ({serial_number})"
+        self.stations = [self._station(s) for s in (stations or DEFAULT_STATIONS)]
+        self.noise = noise
+        self.noise_floor = noise_floor
+        self.transfer_latency = transfer_latency
+        self.settle_latency = settle_latency
+        self.seek_step_latency = seek_step_latency
+        self.rds_interval = rds_interval
+        self.rssi_threshold = rssi_threshold
+        # 지원하지 않는 명령 흉내 ((bRequest, wValue) 쌍 - 실제 기기처럼 stall)
+        self.unsupported = frozenset(tuple(pair) for pair in unsupported)
+        self._random = random.Random(seed)
+        self._registers = {
+            BesCmd.GET_FM_IC_NO.value: 0x1000,
+            BesCmd.GET_FM_IC_POWER_ON_STATE.value: 0,
+            BesCmd.GET_CURRENT_FM_BAND.value: 0,
+            BesCmd.GET_CURRENT_SPACING.value: 1,
+            BesCmd.GET_MUTE_STATE.value: 0,
+            BesCmd.GET_FORCED_MONO_STATE.value: 0,
+            BesCmd.GET_CURRENT_VOLUME.value: 8,
+            BesCmd.GET_RDS_STATUS.value: 0,
+            BesCmd.GET_CURRENT_CHANNEL.value: 8850,
+            BesCmd.GET_CURRENT_SEEKING_DC_THRESHOLD.value: 0,
+            BesCmd.GET_CURRENT_SEEKING_SPIKING_THRESHOLD.value: 0,
+            BesCmd.GET_CURRENT_FM_IC_INFO.value: 0x0001,
+            BesCmd.GET_FM_RECORDING_MODE_STATUS.value: 0,
+            BesCmd.GET_FM_PROTOCOL_VERSION.value: 0x0100,
+        }
+        self._scheduled = []     # [due, kind, status, channel] 시각 순
+        self._ready = deque()    # 알림은 보냈지만 아직 QUERY로 읽지 않은 상태
+        self._rds_groups = []
+        self._rds_index = 0
+        self._next_rds = None
+        self._condition = threading.Condition()
+        self._endpoint = _SimEndpoint(self)
+
+    @staticmethod
+    def _station(station):
+        if isinstance(station, SimStation):
+            return station
+        if isinstance(station, dict):
+            return SimStation(**station)
+        return SimStation(*station)
+
+    # usb.core.Device 인터페이스
+
+    def is_kernel_driver_active(self, interface):
+        return False
+
+    def detach_kernel_driver(self, interface):
+        pass
+
+    def set_configuration(self, configuration=None):
+        pass
+
+    def get_active_configuration(self):
+        return {(4, 0): [self._endpoint]}
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        if self.transfer_latency:
+            time.sleep(self.transfer_latency)
+        if (bRequest, wValue) in self.unsupported:
+            raise usb.core.USBError('Pipe error', None, errno.EPIPE)
+        with self._condition:
+            if bRequest == BesCmd.SET.value:
+                self._apply_set(wValue, wIndex)
+                response = b'\x00'
+            elif bRequest == BesCmd.GET.value:
+                response = struct.pack('<H', self._read_register(wValue) & 0xFFFF)
+            elif bRequest == BesCmd.QUERY.value:
+                response = self._next_status()
+            else:
+                raise usb.core.USBError('Unsupported request', None, errno.EPIPE)
+        return self._fill(data_or_wLength, response)
+
+    @staticmethod
+    def _fill(data_or_wLength, response):
+        """pyusb 규칙대로 결과 반환 (array.array는 그 자리에 채우고 길이 반환)"""
+        if isinstance(data_or_wLength, array.array):
+            size = min(len(data_or_wLength), len(response))
+            data_or_wLength[:size] = array.array('B', response[:size])
+            return size
+        size = data_or_wLength if isinstance(data_or_wLength, int) else len(data_or_wLength)
+        return array.array('B', response[:size])
+
+    # 튜너 모델
+
+    @property
+    def powered(self):
+        return bool(self._registers[BesCmd.GET_FM_IC_POWER_ON_STATE.value])
+
+    @property
+    def channel(self):
+        """현재 주파수 (10kHz 단위)"""
+        return self._registers[BesCmd.GET_CURRENT_CHANNEL.value]
+
+    def station_at(self, channel):
+        """주파수에 정확히 맞는 방송국 (없으면 None)"""
+        for station in self.stations:
+            if abs(round(station.freq * 100) - channel) < 3:
+                return station
+        return None
+
+    def rssi_at(self, channel):
+        """주파수의 신호 강도 (인접 방송국은 100kHz당 35씩 감쇠, 노이즈 포함)"""
+        level = self.noise_floor
+        for station in self.stations:
+            distance = abs(round(station.freq * 100) - channel) / 10
+            level = max(level, station.rssi - 35 * distance)
+        if self.noise:
+            level += self._random.gauss(0, self.noise)
+        return max(0, min(127, int(round(level))))
+
+    def _read_register(self, cmd):
+        if cmd == BesCmd.GET_CURRENT_RSSI.value:
+            return self.rssi_at(self.channel) if self.powered else 0
+        return self._registers.get(cmd, 0)
+
+    def _apply_set(self, cmd, value):
+        if cmd == BesCmd.SET_CHANNEL.value:
+            self._tune(value)
+        elif cmd == BesCmd.SET_SEEK_START.value:
+            self._seek(value == BesCmd.SET_SEEK_UP.value)
+        elif cmd == BesCmd.SET_SEEK_STOP.value:
+            self._cancel_seek()
+        elif cmd == BesCmd.SET_CHAN_RSSI_TH.value:
+            self.rssi_threshold = value
+        elif cmd in _SET_REGISTERS:
+            self._registers[_SET_REGISTERS[cmd]] = value
+            if cmd == BesCmd.SET_POWER_STATE.value and not value:
+                self._scheduled.clear()
+                self._ready.clear()
+            if cmd in (BesCmd.SET_POWER_STATE.value, BesCmd.SET_RDS.value):
+                self._restart_rds()
+
+    def _schedule(self, delay, kind, status, channel=None):
+        entry = [time.monotonic() + delay, kind, status, channel]
+        self._scheduled.append(entry)
+        self._scheduled.sort(key=lambda e: e[0])
+        self._condition.notify_all()
+
+    def _tune(self, channel):
+        low, high = BAND_LIMITS.get(self._registers[BesCmd.GET_CURRENT_FM_BAND.value],
+                                    BAND_LIMITS[0])
+        success = low <= channel <= high
+        if success:
+            self._registers[BesCmd.GET_CURRENT_CHANNEL.value] = channel
+            self._restart_rds()
+        strength = self.rssi_at(self.channel)
+        self._schedule(self.settle_latency, _KIND_TUNE,
+                       _SEEK_TUNE.pack(_KIND_TUNE, success, self.channel, strength))
+
+    def _seek(self, up):
+        """현재 주파수에서 채널 간격씩 이동하며 rssi_threshold 이상인 첫 채널 탐색"""
+        self._cancel_seek()
+        low, high = BAND_LIMITS.get(self._registers[BesCmd.GET_CURRENT_FM_BAND.value],
+                                    BAND_LIMITS[0])
+        step = SPACING_STEPS.get(self._registers[BesCmd.GET_CURRENT_SPACING.value], 10)
+        channel = self.channel
+        steps = (high - low) // step + 1
+        for count in range(1, steps + 1):
+            channel += step if up else -step
+            if channel > high:
+                channel = low
+            elif channel < low:
+                channel = high
+            strength = self.rssi_at(channel)
+            if strength >= self.rssi_threshold:
+                self._schedule(count * self.seek_step_latency, _KIND_SEEK,
+                               _SEEK_TUNE.pack(_KIND_SEEK, True, channel, strength), channel)
+                return
+        # 한 바퀴 돌아도 없으면 실패 (원래 주파수 유지)
+        self._schedule(steps * self.seek_step_latency, _KIND_SEEK,
+                       _SEEK_TUNE.pack(_KIND_SEEK, False, self.channel, 0))
+
+    def _cancel_seek(self):
+        self._scheduled = [e for e in self._scheduled if e[1] != _KIND_SEEK]
+
+    def _restart_rds(self):
+        station = self.station_at(self.channel)
+        active = (self.powered and station is not None
+                  and self._registers[BesCmd.GET_RDS_STATUS.value])
+        self._rds_groups = _rds_groups(station) if active else []
+        self._rds_index = 0
+        self._next_rds = time.monotonic() + self.rds_interval if self._rds_groups else None
+        self._condition.notify_all()
+
+    def _collect(self, now):
+        """시각이 된 예약 상태와 RDS 그룹을 알림 대기열로 이동"""
+        while self._scheduled and self._scheduled[0][0] <= now:
+            _, _, status, channel = self._scheduled.pop(0)
+            if channel is not None:
+                self._registers[BesCmd.GET_CURRENT_CHANNEL.value] = channel
+                self._restart_rds()
+            self._ready.append(status)
+        if self._next_rds is not None and self._next_rds <= now:
+            group = self._rds_groups[self._rds_index % len(self._rds_groups)]
+            self._rds_index += 1
+            self._ready.append(_RDS.pack(_KIND_RDS, 0, self.rssi_at(self.channel), *group))
+            self._next_rds = now + self.rds_interval
+
+    def _next_due(self):
+        due = [self._scheduled[0][0]] if self._scheduled else []
+        if self._next_rds is not None:
+            due.append(self._next_rds)
+        return min(due) if due else None
+
+    def _next_status(self):
+        self._collect(time.monotonic())
+        if self._ready:
+            status = self._ready.popleft()
+        else:
+            # 새 상태가 없으면 현재 튜닝 상태
+            status = _SEEK_TUNE.pack(_KIND_TUNE, True, self.channel, self.rssi_at(self.channel))
+        return status.ljust(_STATUS_LENGTH, b'\x00')
+
+    def _read_notify(self, size_or_buffer, timeout):
+        deadline = time.monotonic() + (timeout or 1000) / 1000
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._collect(now)
+                if self._ready:
+                    return self._fill(size_or_buffer, _NOTIFY)
+                if now >= deadline:
+                    timeout_error = getattr(usb.core, 'USBTimeoutError', usb.core.USBError)
+                    raise timeout_error('Operation timed out', None, errno.ETIMEDOUT)
+                due = self._next_due()
+                wake = deadline if due is None else min(due, deadline)
+                self._condition.wait(max(0.0, wake - now))
+
+
+# 설정값 -> 가상 기기 목록 (같은 설정이면 같은 객체를 돌려줘 레지스터 / 튜닝 상태가 스캔 사이에 유지됨)
+_devices_by_spec = {}
+_devices_lock = threading.Lock()
+
+
+def simulated_devices(spec=None):
+    """
+    BESFM_SIMULATOR 설정에 따른 가상 기기 목록
+
+    같은 설정으로 다시 호출하면 처음 만든 기기 객체를 그대로 돌려준다 (설정 파일을 읽지 못한
+    경우는 기억하지 않음).
+
+    Args:
+        spec (str): 설정값 (없으면 환경 변수 사용) - "1", 기기 수, 또는 JSON 설정 파일 경로
+
+    Returns:
+        list: SimulatedBesFMDevice 목록 (설정이 없으면 빈 리스트)
+    """
+    if spec is None:
+        spec = os.environ.get(SIMULATOR_ENV, '')
+    spec = spec.strip()
+    if not spec or spec.lower() in ('0', 'false', 'no', 'off'):
+        return []
+    if spec.lower() in ('true', 'yes', 'on'):
+        spec = '1'
+    with _devices_lock:
+        devices = _devices_by_spec.get(spec)
+        if devices is None:
+            devices = _create_devices(spec)
+            if devices is not None:
+                _devices_by_spec[spec] = devices
+    return list(devices or ())
+
+
+def _create_devices(spec):
+    """설정값으로 가상 기기 생성 (설정 파일을 읽지 못하면 None)"""
+    if spec.isdigit():
+        return [SimulatedBesFMDevice(serial_number=f"SIM{i + 1:04d}", address=i + 1)
+                for i in range(int(spec))]
+    try:
+        with open(spec, 'r', encoding='utf-8') as f:
+            configs = json.load(f)
+        if isinstance(configs, dict):
+            configs = [configs]
+        devices = []
+        for i, config in enumerate(configs):
+            config = dict(config)
+            config.setdefault('serial_number', f"SIM{i + 1:04d}")
+            config.setdefault('address', i + 1)
+            devices.append(SimulatedBesFMDevice(**config))
+        return devices
+    except (OSError, ValueError, TypeError) as e:
+        _log.warning("Failed to load simulator config %s: %s", spec, e)
+        return None
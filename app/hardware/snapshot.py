@@ -0,0 +1,81 @@
+"""
+BesFM 상태 스냅샷 - 여러 GET 레지스터를 한 번에 읽은 불변 상태 레코드
+"""
+from types import MappingProxyType
+
+
+# 스냅샷 필드 순서 (기본으로 읽는 필드)
+DEFAULT_FIELDS = ('power', 'recording', 'channel', 'volume', 'mute')
+ALL_FIELDS = DEFAULT_FIELDS + ('mono', 'band', 'spacing', 'rds')
+
+
+class BesFMSnapshot:
+    """
+    한 번의 배치로 읽은 하드웨어 상태
+
+    읽지 않은 필드는 None. timestamp는 배치 시작 시각(time.monotonic()),
+    latencies는 필드별 읽기 시간(초), changed는 이전 스냅샷 대비 바뀐 필드 이름
+    (이전 스냅샷 없이 만들었으면 None).
+    """
+
+    __slots__ = ALL_FIELDS + ('timestamp', 'latencies', 'changed')
+
+    def __init__(self, values, timestamp, latencies, previous=None):
+        for field in ALL_FIELDS:
+            object.__setattr__(self, field, values.get(field))
+        object.__setattr__(self, 'timestamp', timestamp)
+        object.__setattr__(self, 'latencies', MappingProxyType(dict(latencies)))
+        changed = None
+        if previous is not None:
+            changed = frozenset(
+                field for field in values
+                if getattr(previous, field) != values[field]
+            )
+        object.__setattr__(self, 'changed', changed)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BesFMSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("BesFMSnapshot is immutable")
+
+    def __reduce__(self):
+        # 프로세스 간 전달 (I/O 서버 프로세스 응답)
+        values = {field: getattr(self, field) for field in ALL_FIELDS}
+        return (_restore_snapshot, (values, self.timestamp, dict(self.latencies), self.changed))
+
+    def __repr__(self):
+        fields = ', '.join(
+            f"{field}={getattr(self, field)!r}"
+            for field in ALL_FIELDS if getattr(self, field) is not None
+        )
+        return f"BesFMSnapshot({fields})"
+
+    def is_changed(self, field):
+        """필드가 이전 스냅샷 대비 바뀌었는지 (이전 스냅샷이 없으면 항상 True)"""
+        return self.changed is None or field in self.changed
+
+    def diff(self, previous):
+        """다른 스냅샷 대비 바뀐 필드를 {필드: (이전 값, 현재 값)}으로 반환"""
+        changes = {}
+        for field in ALL_FIELDS:
+            value = getattr(self, field)
+            if value is None:
+                continue
+            old = None if previous is None else getattr(previous, field)
+            if old != value:
+                changes[field] = (old, value)
+        return changes
+
+    def as_dict(self):
+        """읽은 필드만 dict로 반환"""
+        return {
+            field: getattr(self, field)
+            for field in ALL_FIELDS if getattr(self, field) is not None
+        }
+
+
+def _restore_snapshot(values, timestamp, latencies, changed):
+    snapshot = BesFMSnapshot(values, timestamp, latencies)
+    object.__setattr__(snapshot, 'changed', changed)
+    return snapshot
@@ -0,0 +1,81 @@
+"""
+BesFM 설정 트랜잭션 - 여러 레지스터 쓰기의 순서 결정과 단계별 시간 기록
+"""
+from collections import namedtuple
+
+from .registers import REGISTERS
+
+
+# 쓰기 한 단계 (skipped: 캐시 값과 같아 전송 생략, waited: 준비 대기 / elapsed: 전송 시간, 초)
+ApplyStep = namedtuple('ApplyStep', ['name', 'value', 'skipped', 'waited', 'elapsed'])
+
+
+def plan_writes(names):
+    """
+    쓰기 순서 결정 - 주어진 순서를 유지하되 같은 트랜잭션의 의존 레지스터를 먼저 씀
+
+    예: ('channel', 'band') -> ('band', 'channel')
+
+    Raises:
+        KeyError: 알 수 없는 레지스터
+    """
+    pending = list(names)
+    unknown = [name for name in pending if name not in REGISTERS]
+    if unknown:
+        raise KeyError(f"Unknown registers: {', '.join(unknown)}")
+    ordered = []
+    while pending:
+        for name in pending:
+            if not any(dep in pending for dep in REGISTERS[name].depends):
+                break
+        else:
+            # 순환 의존 - 레지스터 표 오류이므로 남은 순서 그대로
+            name = pending[0]
+        pending.remove(name)
+        ordered.append(name)
+    return tuple(ordered)
+
+
+class ApplyReport:
+    """apply() 결과 - 단계별 전송 여부와 소요 시간"""
+
+    def __init__(self):
+        self.steps = []
+        self.elapsed = 0.0
+
+    def add(self, name, value, skipped, waited=0.0, elapsed=0.0):
+        self.steps.append(ApplyStep(name, value, skipped, waited, elapsed))
+
+    @property
+    def written(self):
+        """실제로 전송한 레지스터 이름"""
+        return tuple(step.name for step in self.steps if not step.skipped)
+
+    @property
+    def skipped(self):
+        """캐시 값과 같아 생략한 레지스터 이름"""
+        return tuple(step.name for step in self.steps if step.skipped)
+
+    @property
+    def transfers(self):
+        """SET 전송 수"""
+        return len(self.written)
+
+    @property
+    def waited(self):
+        """의존 레지스터 준비 대기 시간 합계 (초)"""
+        return sum(step.waited for step in self.steps)
+
+    def to_dict(self):
+        return {
+            'elapsed_ms': round(self.elapsed * 1000, 3),
+            'transfers': self.transfers,
+            'steps': [{'name': step.name, 'value': step.value, 'skipped': step.skipped,
+                       'waited_ms': round(step.waited * 1000, 3),
+                       'elapsed_ms': round(step.elapsed * 1000, 3)}
+                      for step in self.steps],
+        }
+
+    def __repr__(self):
+        return (f"ApplyReport(written={list(self.written)}, skipped={list(self.skipped)}, "
+                f"{self.elapsed * 1000:.1f} ms)")
@@ -0,0 +1,217 @@
+"""
+여러 BesFM 동글을 동시에 다루는 튜너 풀 - 기기마다 독립된 I/O 워커와 레지스터 캐시
+"""
+import time
+from concurrent.futures import wait
+
+from .besfm_core import BesFM
+from .device_info import DeviceInfo
+from .io_worker import BesFMWorker, PRIORITY_USER, PRIORITY_TUNE, PRIORITY_POLL
+from .log import get_logger
+
+
+_log = get_logger('tuner')
+
+
+class Tuner:
+    """풀에 속한 기기 하나 (BesFM + 전용 I/O 워커)"""
+
+    def __init__(self, key, info, fm, worker):
+        self.key = key
+        self.info = info
+        self.fm = fm
+        self.worker = worker
+        self.proxy = worker.proxy()
+
+    def submit(self, priority, func, *args, **kwargs):
+        """이 기기의 워커에 명령을 넣고 Future 반환"""
+        return self.worker.submit(priority, func, *args, **kwargs)
+
+    def __repr__(self):
+        return f"Tuner({self.key!r})"
+
+
+def _tuner_key(info):
+    """기기 식별 키 (시리얼 번호, 아직 읽지 못했거나 없으면 bus:address) - 디스크립터를 기다리지 않음"""
+    serial = info.peek('serial_number') if isinstance(info, DeviceInfo) else info.get('serial_number')
+    if serial:
+        return serial
+    return f"{info.get('bus')}:{info.get('address')}"
+
+
+def _measure(fm, freq, dwell):
+    """워커에서 실행 - 튜닝 완료까지 기다린 뒤 RSSI 측정 (set_channel 직후에는 이전 채널의 RSSI가 읽힘)"""
+    try:
+        fm.tune(freq)
+    except TimeoutError:
+        _log.debug("No tune status for %.2f MHz, sampling anyway", freq)
+    if dwell:
+        time.sleep(dwell)
+    return fm.get_rssi()
+
+
+class TunerPool:
+    """
+    호환 기기를 모두 열어 기기별 워커에서 명령을 병렬 실행
+
+    기기마다 전송이 자기 워커 스레드에서만 직렬화되므로 동글 수만큼 처리량이 늘어난다.
+
+        with TunerPool() as pool:
+            pool.tune_all(95.1)
+            snapshots = pool.snapshot_all()
+            spectrum = pool.sweep(87.5, 108.0, 0.1)
+    """
+
+    def __init__(self, device_infos=None, use_cache=True, metrics=False):
+        """
+        Args:
+            device_infos (list): BesFM.find_all_devices() 형식의 기기 목록 (없으면 open()에서 검색)
+            use_cache (bool): 기기별 섀도 레지스터 캐시 사용 여부
+            metrics (bool): 기기별 지연 지표 수집 여부
+        """
+        self._device_infos = device_infos
+        self._use_cache = use_cache
+        self._metrics = metrics
+        self._tuners = {}
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        """
+        기기를 열고 워커 시작 (열 수 없는 기기는 건너뜀)
+
+        Returns:
+            int: 연 기기 수
+        """
+        infos = self._device_infos
+        if infos is None:
+            infos = BesFM.find_all_devices()
+        for info in infos:
+            key = _tuner_key(info)
+            if key in self._tuners:
+                continue
+            try:
+                fm = BesFM(info['device'], use_cache=self._use_cache, metrics=self._metrics)
+            except Exception as e:
+                _log.warning("Failed to open tuner %s: %s", key, e)
+                continue
+            worker = BesFMWorker(fm, name=f"BesFMWorker-{key}")
+            tuner = Tuner(key, info, fm, worker)
+            self._tuners[key] = tuner
+            if isinstance(info, DeviceInfo) and not info.is_loaded():
+                info.add_done_callback(lambda loaded, tuner=tuner: self._rekey(tuner, loaded))
+        return len(self._tuners)
+
+    def _rekey(self, tuner, info):
+        """bus:address로 연 튜너를 시리얼 번호 키로 교체 (디스크립터 스레드에서 - 사전은 통째로 바꿔 끼움)"""
+        key = _tuner_key(info)
+        old = tuner.key
+        if key == old or self._tuners.get(old) is not tuner or key in self._tuners:
+            return
+        tuner.key = key
+        self._tuners = {key if name == old else name: value for name, value in self._tuners.items()}
+
+    def close(self):
+        """모든 워커 중지"""
+        for tuner in self._tuners.values():
+            tuner.worker.stop()
+        self._tuners.clear()
+
+    def __len__(self):
+        return len(self._tuners)
+
+    def __iter__(self):
+        return iter(list(self._tuners.values()))
+
+    def keys(self):
+        """기기 키 목록"""
+        return list(self._tuners)
+
+    def get(self, key):
+        """키로 튜너 조회 (없으면 None)"""
+        return self._tuners.get(key)
+
+    def submit_all(self, priority, func, *args, **kwargs):
+        """
+        모든 기기에 같은 명령을 동시에 넣음
+
+        Returns:
+            dict: {기기 키: Future}
+        """
+        return {key: tuner.submit(priority, func, *args, **kwargs)
+                for key, tuner in self._tuners.items()}
+
+    @staticmethod
+    def gather(futures, timeout=None):
+        """
+        Future 결과 수집
+
+        Returns:
+            dict: {기기 키: 결과 또는 발생한 예외}
+        """
+        wait(list(futures.values()), timeout)
+        results = {}
+        for key, future in futures.items():
+            if not future.done():
+                results[key] = TimeoutError(f"Tuner {key} did not respond")
+                continue
+            error = future.exception()
+            results[key] = error if error is not None else future.result()
+        return results
+
+    def run_all(self, func, *args, priority=PRIORITY_USER, timeout=None, **kwargs):
+        """모든 기기에서 명령 실행 후 {기기 키: 결과 또는 예외} 반환"""
+        return self.gather(self.submit_all(priority, func, *args, **kwargs), timeout)
+
+    def tune_all(self, freqs, timeout=None):
+        """
+        기기별 주파수를 동시에 설정
+
+        Args:
+            freqs: 모든 기기에 같은 주파수(float) 또는 {기기 키: 주파수}
+
+        Returns:
+            dict: {기기 키: None 또는 발생한 예외}
+        """
+        if not isinstance(freqs, dict):
+            freqs = {key: freqs for key in self._tuners}
+        futures = {key: self._tuners[key].submit(PRIORITY_TUNE, 'set_channel', freq)
+                   for key, freq in freqs.items() if key in self._tuners}
+        return self.gather(futures, timeout)
+
+    def snapshot_all(self, fields=None, fresh=True, timeout=None):
+        """모든 기기의 상태 스냅샷을 동시에 읽어 {기기 키: BesFMSnapshot 또는 예외} 반환"""
+        return self.run_all('get_snapshot', fields, fresh, timeout=timeout)
+
+    def sweep(self, start, stop, step=0.1, dwell=0.0, timeout=None):
+        """
+        대역 스윕 - 주파수를 기기 수만큼 나눠 병렬로 RSSI 측정
+
+        주파수마다 따로 큐에 넣으므로 스윕 중에도 사용자 명령이 끼어들 수 있다.
+
+        Args:
+            start (float): 시작 주파수 (MHz)
+            stop (float): 끝 주파수 (MHz, 포함)
+            step (float): 간격 (MHz)
+            dwell (float): 튜닝 완료 후 측정까지 추가 대기 (초)
+
+        Returns:
+            list: (주파수, RSSI) 목록 (주파수 순, 측정에 실패한 주파수는 제외)
+        """
+        tuners = list(self._tuners.values())
+        if not tuners:
+            return []
+        count = int(round((stop - start) / step)) + 1
+        freqs = [round(start + i * step, 2) for i in range(count)]
+        futures = {}
+        for i, freq in enumerate(freqs):
+            tuner = tuners[i % len(tuners)]
+            futures[freq] = tuner.submit(PRIORITY_POLL, _measure, tuner.fm, freq, dwell)
+        results = self.gather(futures, timeout)
+        return [(freq, rssi) for freq, rssi in sorted(results.items())
+                if not isinstance(rssi, BaseException)]
@@ -0,0 +1,390 @@
+"""
+BesFM USB 전송 기록 / 재생 - 현장 세션을 바이너리 트레이스로 남기고 오프라인에서 그대로 재현
+"""
+import array
+import errno
+import json
+import os
+import struct
+import threading
+import time
+from collections import namedtuple
+
+import usb.core
+
+
+# 트레이스 파일 형식
+#   헤더: MAGIC, 버전(B), 기기 정보 JSON 길이(H), 기기 정보 JSON
+#   레코드: _RECORD + payload (추가 기록만 하므로 중간에 끊겨도 앞부분은 읽을 수 있음)
+TRACE_MAGIC = b'BFMT'
+TRACE_VERSION = 1
+
+KIND_CONTROL = 0
+KIND_INTERRUPT = 1
+
+_HEADER = struct.Struct('<4sBH')
+# timestamp, kind, bmRequestType (인터럽트는 엔드포인트 주소), bRequest, wValue, wIndex,
+# 요청 길이, 결과 (전송 바이트 수, 오류 시 -1), errno, payload 길이
+_RECORD = struct.Struct('<dBBBHHHihH')
+
+_DIRECTION_IN = 0x80
+_DEVICE_FIELDS = ('idVendor', 'idProduct', 'bus', 'address',
+                  'serial_number', 'manufacturer', 'product')
+
+TraceRecord = namedtuple('TraceRecord', [
+    'timestamp', 'kind', 'request_type', 'request', 'value', 'index',
+    'length', 'result', 'errno', 'payload'
+])
+
+
+class TraceFormatError(ValueError):
+    """트레이스 파일 형식 오류"""
+
+
+class ReplayMismatchError(RuntimeError):
+    """재생 중 요청이 트레이스에 기록된 순서와 다름"""
+
+
+def _device_info(dev):
+    """트레이스 헤더에 남길 기기 정보 (문자열 디스크립터 조회 실패는 무시)"""
+    info = {}
+    for field in _DEVICE_FIELDS:
+        try:
+            info[field] = getattr(dev, field)
+        except (usb.core.USBError, ValueError, NotImplementedError):
+            info[field] = None
+    return info
+
+
+def _to_bytes(data):
+    if data is None or isinstance(data, int):
+        return b''
+    if isinstance(data, array.array):
+        return data.tobytes()
+    return bytes(data)
+
+
+def read_trace(path):
+    """
+    트레이스 파일 읽기
+
+    Returns:
+        tuple: (기기 정보 dict, TraceRecord 리스트)
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if len(raw) < _HEADER.size:
+        raise TraceFormatError(f"Trace file too short: {path}")
+    magic, version, info_size = _HEADER.unpack_from(raw, 0)
+    if magic != TRACE_MAGIC:
+        raise TraceFormatError(f"Not a BesFM trace file: {path}")
+    if version != TRACE_VERSION:
+        raise TraceFormatError(f"Unsupported trace version {version}: {path}")
+    offset = _HEADER.size
+    info = json.loads(raw[offset:offset + info_size].decode('utf-8'))
+    offset += info_size
+
+    records = []
+    while offset + _RECORD.size <= len(raw):
+        fields = _RECORD.unpack_from(raw, offset)
+        offset += _RECORD.size
+        payload_size = fields[-1]
+        if offset + payload_size > len(raw):
+            break  # 기록 도중 끊긴 마지막 레코드
+        records.append(TraceRecord(*fields[:-1], raw[offset:offset + payload_size]))
+        offset += payload_size
+    return info, records
+
+
+class TraceWriter:
+    """추가 전용 트레이스 기록기 (여러 스레드에서 호출 가능)"""
+
+    def __init__(self, path, device_info=None):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._lock = threading.Lock()
+        self.records = 0
+        info = json.dumps(device_info or {}).encode('utf-8')
+        self._file.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(info)))
+        self._file.write(info)
+        self._file.flush()
+
+    def write(self, kind, request_type, request, value, index, length,
+              result, error_code, payload, timestamp=None):
+        """레코드 하나 기록"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        header = _RECORD.pack(timestamp, kind, request_type, request, value, index,
+                              length, result, error_code, len(payload))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(header)
+            self._file.write(payload)
+            self.records += 1
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _InterfaceProxy:
+    """인터페이스의 엔드포인트를 기록용 엔드포인트로 감쌈"""
+
+    def __init__(self, interface, writer):
+        self._interface = interface
+        self._writer = writer
+
+    def __getitem__(self, index):
+        return RecordingEndpoint(self._interface[index], self._writer)
+
+    def __getattr__(self, name):
+        return getattr(self._interface, name)
+
+
+class _ConfigurationProxy:
+    """설정의 인터페이스를 기록용 인터페이스로 감쌈"""
+
+    def __init__(self, config, writer):
+        self._config = config
+        self._writer = writer
+
+    def __getitem__(self, key):
+        return _InterfaceProxy(self._config[key], self._writer)
+
+    def __getattr__(self, name):
+        return getattr(self._config, name)
+
+
+class RecordingEndpoint:
+    """인터럽트 엔드포인트 read()를 트레이스에 기록"""
+
+    def __init__(self, endpoint, writer):
+        self._endpoint = endpoint
+        self._writer = writer
+
+    def read(self, size_or_buffer, timeout=None):
+        length = size_or_buffer if isinstance(size_or_buffer, int) else len(size_or_buffer)
+        address = getattr(self._endpoint, 'bEndpointAddress', 0)
+        try:
+            result = self._endpoint.read(size_or_buffer, timeout=timeout)
+        except usb.core.USBError as e:
+            self._writer.write(KIND_INTERRUPT, address, 0, 0, 0, length,
+                               -1, e.errno or 0, b'')
+            raise
+        if isinstance(result, int):
+            payload = _to_bytes(size_or_buffer)[:result]
+        else:
+            payload = _to_bytes(result)
+        self._writer.write(KIND_INTERRUPT, address, 0, 0, 0, length,
+                           len(payload), 0, payload)
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._endpoint, name)
+
+
+class RecordingDevice:
+    """
+    usb.core.Device를 감싸 모든 control / 인터럽트 전송을 트레이스 파일에 기록
+
+    그 외 속성과 메서드는 원래 기기로 그대로 전달하므로 BesFM에 그대로 넘겨 쓸 수 있다.
+    """
+
+    def __init__(self, dev, path):
+        self._dev = dev
+        self.writer = TraceWriter(path, _device_info(dev))
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        if isinstance(data_or_wLength, int):
+            length = data_or_wLength
+        else:
+            length = len(data_or_wLength) if data_or_wLength is not None else 0
+        try:
+            if timeout is None:
+                result = self._dev.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex,
+                                                 data_or_wLength)
+            else:
+                result = self._dev.ctrl_transfer(bmRequestType, bRequest, wValue, wIndex,
+                                                 data_or_wLength, timeout)
+        except usb.core.USBError as e:
+            self.writer.write(KIND_CONTROL, bmRequestType, bRequest, wValue, wIndex,
+                              length, -1, e.errno or 0, b'')
+            raise
+        if bmRequestType & _DIRECTION_IN:
+            if isinstance(result, int):
+                # array.array 버퍼는 그 자리에 채워짐
+                payload = _to_bytes(data_or_wLength)[:result]
+            else:
+                payload = _to_bytes(result)
+            transferred = len(payload)
+        else:
+            payload = _to_bytes(data_or_wLength)
+            transferred = result
+        self.writer.write(KIND_CONTROL, bmRequestType, bRequest, wValue, wIndex,
+                          length, transferred, 0, payload)
+        return result
+
+    def get_active_configuration(self):
+        return _ConfigurationProxy(self._dev.get_active_configuration(), self.writer)
+
+    def wrap_endpoint(self, endpoint):
+        """이미 얻은 엔드포인트를 기록용으로 감쌈"""
+        if endpoint is None:
+            return None
+        return RecordingEndpoint(endpoint, self.writer)
+
+    def close(self):
+        """트레이스 파일 닫기"""
+        self.writer.close()
+
+    @property
+    def device(self):
+        """감싼 원래 기기"""
+        return self._dev
+
+    def __getattr__(self, name):
+        return getattr(self._dev, name)
+
+
+class ReplayEndpoint:
+    """트레이스의 인터럽트 레코드를 순서대로 돌려주는 엔드포인트"""
+
+    bEndpointAddress = 0x84
+
+    def __init__(self, replay):
+        self._replay = replay
+
+    def read(self, size_or_buffer, timeout=None):
+        return self._replay._read_interrupt(size_or_buffer, timeout)
+
+
+class ReplayDevice:
+    """
+    트레이스 파일로 usb.core.Device를 대신하는 재생 백엔드
+
+    control 전송과 인터럽트 읽기는 각각 기록된 순서대로 소비하므로 (I/O 워커와
+    이벤트 디스패처가 서로 다른 스레드여도) 결과가 결정적이다. 요청이 기록과 다르면
+    ReplayMismatchError를 낸다.
+
+    Args:
+        path (str): 트레이스 파일 경로
+        speed (float): None이면 지연 없이 최대 속도로, 1.0이면 기록된 시간 간격대로 재생
+    """
+
+    def __init__(self, path, speed=None):
+        info, records = read_trace(path)
+        self.path = path
+        self.speed = speed
+        for field in _DEVICE_FIELDS:
+            setattr(self, field, info.get(field))
+        if self.idVendor is None:
+            self.idVendor = 0x04e8
+        if self.idProduct is None:
+            self.idProduct = 0xa054
+        self._control = [r for r in records if r.kind == KIND_CONTROL]
+        self._interrupt = [r for r in records if r.kind == KIND_INTERRUPT]
+        self._control_pos = 0
+        self._interrupt_pos = 0
+        self._origin = records[0].timestamp if records else 0.0
+        self._started = None
+        self._lock = threading.Lock()
+        self._endpoint = ReplayEndpoint(self)
+
+    def rewind(self):
+        """처음부터 다시 재생"""
+        with self._lock:
+            self._control_pos = 0
+            self._interrupt_pos = 0
+            self._started = None
+
+    def remaining(self):
+        """남은 (control, 인터럽트) 레코드 수"""
+        with self._lock:
+            return (len(self._control) - self._control_pos,
+                    len(self._interrupt) - self._interrupt_pos)
+
+    def _next(self, kind):
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+            if kind == KIND_CONTROL:
+                if self._control_pos >= len(self._control):
+                    return None
+                record = self._control[self._control_pos]
+                self._control_pos += 1
+            else:
+                if self._interrupt_pos >= len(self._interrupt):
+                    return None
+                record = self._interrupt[self._interrupt_pos]
+                self._interrupt_pos += 1
+            started = self._started
+        if self.speed:
+            delay = started + (record.timestamp - self._origin) / self.speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return record
+
+    @staticmethod
+    def _raise(record):
+        message = os.strerror(record.errno) if record.errno else 'Replayed USB error'
+        if record.errno in (errno.ETIMEDOUT, 110):
+            timeout_error = getattr(usb.core, 'USBTimeoutError', usb.core.USBError)
+            raise timeout_error(message, None, record.errno)
+        raise usb.core.USBError(message, None, record.errno)
+
+    @staticmethod
+    def _fill(size_or_buffer, payload):
+        """pyusb 규칙대로 결과 반환 (array.array는 그 자리에 채우고 길이 반환)"""
+        if isinstance(size_or_buffer, array.array):
+            size_or_buffer[:len(payload)] = array.array('B', payload)
+            return len(payload)
+        return array.array('B', payload)
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue=0, wIndex=0,
+                      data_or_wLength=None, timeout=None):
+        record = self._next(KIND_CONTROL)
+        if record is None:
+            raise usb.core.USBError('Replay trace exhausted', None, errno.ENODEV)
+        if (record.request_type, record.request, record.value, record.index) != \
+                (bmRequestType, bRequest, wValue, wIndex):
+            raise ReplayMismatchError(
+                f"Expected ctrl_transfer(0x{record.request_type:02x}, {record.request}, "
+                f"{record.value}, {record.index}), got "
+                f"(0x{bmRequestType:02x}, {bRequest}, {wValue}, {wIndex})"
+            )
+        if record.result < 0:
+            self._raise(record)
+        if bmRequestType & _DIRECTION_IN:
+            return self._fill(data_or_wLength, record.payload)
+        return record.result
+
+    def _read_interrupt(self, size_or_buffer, timeout):
+        record = self._next(KIND_INTERRUPT)
+        if record is None:
+            # 더 이상 알림이 없으면 실제 기기처럼 타임아웃까지 기다림 (디스패처 busy loop 방지)
+            time.sleep((timeout or 1000) / 1000)
+            self._raise(TraceRecord(0.0, KIND_INTERRUPT, 0, 0, 0, 0, 0, -1, errno.ETIMEDOUT, b''))
+        if record.result < 0:
+            self._raise(record)
+        return self._fill(size_or_buffer, record.payload)
+
+    def get_active_configuration(self):
+        return {(4, 0): [self._endpoint]}
+
+    def is_kernel_driver_active(self, interface):
+        return False
+
+    def detach_kernel_driver(self, interface):
+        pass
+
+    def set_configuration(self, configuration=None):
+        pass
@@ -0,0 +1,136 @@
+"""
+볼륨/주파수 쓰기 병합 계층 - 연속된 쓰기는 마지막 값만 USB로 전송
+"""
+import threading
+from concurrent.futures import Future
+
+from .io_worker import PRIORITY_USER, PRIORITY_TUNE
+
+
+class WriteCoalescer:
+    """
+    BesFMWorker 위에서 SET_VOLUME / SET_CHANNEL 쓰기를 last-write-wins로 병합
+
+    쓰기 요청이 워커 큐에서 대기하는 동안 들어온 새 값은 이전 값을 대체하므로,
+    슬라이더 드래그나 연속 클릭은 몇 번의 전송으로 끝난다.
+    """
+
+    # 레지스터별 BesFM 쓰기 메서드와 워커 우선순위
+    # (BesCmd는 값이 겹치는 멤버가 별칭으로 합쳐지므로 이름 문자열로 구분)
+    _WRITERS = {
+        'SET_VOLUME': ('set_volume', PRIORITY_USER),
+        'SET_CHANNEL': ('set_channel', PRIORITY_TUNE),
+    }
+
+    def __init__(self, worker, tune=False):
+        """
+        Args:
+            worker (BesFMWorker): 쓰기를 실행할 I/O 워커
+            tune (bool): 주파수 쓰기를 BesFM.tune()으로 실행 (Future 결과가 튜닝 상태 dict)
+                - 알림 디스패처가 튜닝 완료 알림을 받는 경우에는 사용하지 않음
+        """
+        self._worker = worker
+        self._writers = dict(self._WRITERS)
+        if tune:
+            self._writers['SET_CHANNEL'] = ('tune', PRIORITY_TUNE)
+        self._lock = threading.Lock()
+        self._pending = {}  # cmd -> (value, [futures])
+        self._stats = {
+            cmd: {'requested': 0, 'written': 0, 'elided': 0, 'failed': 0}
+            for cmd in self._WRITERS
+        }
+
+    def write(self, cmd, value):
+        """
+        레지스터 쓰기 요청
+
+        Args:
+            cmd (str): 'SET_VOLUME' 또는 'SET_CHANNEL'
+            value: 쓸 값 (볼륨 0-15 또는 MHz 단위 주파수)
+
+        Returns:
+            concurrent.futures.Future: 이 값 또는 더 새로운 값이 기록되면 완료
+            (결과는 기록한 값, tune 모드의 주파수는 튜닝 상태 dict)
+        """
+        if cmd not in self._WRITERS:
+            raise ValueError(f"Register {cmd} is not coalescable")
+
+        future = Future()
+        with self._lock:
+            stats = self._stats[cmd]
+            stats['requested'] += 1
+            pending = self._pending.get(cmd)
+            if pending is not None:
+                # 아직 전송되지 않은 이전 값은 버리고 최신 값으로 교체
+                stats['elided'] += 1
+                self._pending[cmd] = (value, pending[1] + [future])
+                return future
+            self._pending[cmd] = (value, [future])
+
+        _, priority = self._writers[cmd]
+        submitted = self._worker.submit(priority, self._flush, cmd)
+        submitted.add_done_callback(lambda f, cmd=cmd: self._on_flush_done(cmd, f))
+        return future
+
+    def set_volume(self, volume):
+        """병합된 볼륨 쓰기"""
+        return self.write('SET_VOLUME', volume)
+
+    def set_channel(self, freq):
+        """병합된 주파수 쓰기"""
+        return self.write('SET_CHANNEL', freq)
+
+    def has_pending(self, cmd):
+        """전송 대기 중인 쓰기가 있는지 확인"""
+        with self._lock:
+            return cmd in self._pending
+
+    def get_stats(self):
+        """레지스터별 쓰기 통계 반환 (requested / written / elided / failed)"""
+        with self._lock:
+            return {cmd: dict(stats) for cmd, stats in self._stats.items()}
+
+    def reset_stats(self):
+        """통계 초기화"""
+        with self._lock:
+            for stats in self._stats.values():
+                for key in stats:
+                    stats[key] = 0
+
+    def _flush(self, cmd):
+        """워커 스레드에서 실행 - 대기 중인 최신 값을 기록"""
+        with self._lock:
+            value, futures = self._pending.pop(cmd)
+
+        method_name, _ = self._writers[cmd]
+        try:
+            result = getattr(self._worker.fm, method_name)(value)
+        except Exception as e:
+            with self._lock:
+                self._stats[cmd]['failed'] += 1
+            for future in futures:
+                future.set_exception(e)
+        else:
+            with self._lock:
+                self._stats[cmd]['written'] += 1
+            if result is None:
+                result = value
+            for future in futures:
+                future.set_result(result)
+
+    def _on_flush_done(self, cmd, submitted):
+        """워커가 중지되어 flush가 실행되지 못한 경우 대기 중인 Future 정리"""
+        error = None
+        if not submitted.cancelled():
+            error = submitted.exception()
+            if error is None:
+                return
+        with self._lock:
+            pending = self._pending.pop(cmd, None)
+        if pending is None:
+            return
+        for future in pending[1]:
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
@@ -1136,14 +1136,12 @@ class ModernRadioApp(QWidget):
                 
             print(f"Setting hardware frequency to {frequency:.1f} MHz")
             
-            # 하드웨어에 주파수 설정
-            self.fm.set_channel(frequency)
+            # 하드웨어에 주파수 설정 - 기기의 튜닝 완료 상태로 실제 주파수 확인 (고정 대기 / 확인 읽기 없음)
+            status = self.fm.tune(frequency)
+            actual_freq = status['freq']
             
-            # 잠시 대기 후 실제 설정된 값 확인
-            time.sleep(0.1)
-            actual_freq = self.fm.get_channel()
-            
-            print(f"Hardware reports frequency as {actual_freq:.1f} MHz")
+            print(f"Hardware reports frequency as {actual_freq:.1f} MHz "
+                  f"(strength {status['strength']}, {status['seconds'] * 1000:.0f} ms)")
             
             # 설정된 주파수가 요청한 주파수와 비슷한지 확인 (0.2 MHz 오차 허용)
             if abs(actual_freq - frequency) <= 0.2:
@@ -1921,17 +1919,16 @@ class ModernRadioApp(QWidget):
                         besfm.BesFM_Enums.BAND_76MHz_107MHz,
                         besfm.BesFM_Enums.BAND_76MHz_91MHz,
                         besfm.BesFM_Enums.BAND_64MHz_76MHz][band_index]
-            self.fm.set_band(band_enum)
             
             # 채널 간격 설정
             spacing_index = self.spacing_combo.currentIndex()
             spacing_enum = [besfm.BesFM_Enums.CHAN_SPACING_200KHz,
                            besfm.BesFM_Enums.CHAN_SPACING_100KHz,
                            besfm.BesFM_Enums.CHAN_SPACING_50KHz][spacing_index]
-            self.fm.set_channel_spacing(spacing_enum)
             
-            # 모노 설정
-            self.fm.set_mono(self.mono_checkbox.isChecked())
+            # 대역 / 간격 / 모노를 한 트랜잭션으로 적용 (바뀐 설정만 전송)
+            self.fm.apply({'band': band_enum, 'spacing': spacing_enum,
+                           'mono': self.mono_checkbox.isChecked()})
             
             QMessageBox.information(dialog, "Settings", "Settings applied successfully!")
             dialog.accept()
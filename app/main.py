@@ -7,6 +7,7 @@ GitHub Actions에서 빌드된 실행 파일이 바로 작동할 수 있도록 
 import sys
 import os
 import platform
+import multiprocessing
 
 # 현재 스크립트의 디렉토리를 Python 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +22,12 @@ def main():
         
         # 메인 애플리케이션 import
         from gui.main_window import ModernRadioApp
+        from hardware.log import configure_logging, install_dump_signal
+        
+        # 로깅 설정 (BESFM_LOG_LEVELS로 서브시스템별 레벨, BESFM_LOG로 JSON lines 파일)
+        # SIGUSR1을 받으면 최근 로그 링 버퍼를 파일로 저장
+        configure_logging()
+        install_dump_signal()
         
         # macOS에서 high DPI 지원
         if platform.system() == "Darwin":
@@ -55,4 +62,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # 빌드된 실행 파일에서 I/O 서버 프로세스(spawn)를 띄울 수 있도록
+    multiprocessing.freeze_support()
     main()
@@ -21,6 +21,8 @@ class LanguageManager:
                 'stop_recording': '녹음 중지',
                 'settings': '설정',
                 'settings_coming_soon': '설정 기능은 곧 추가될 예정입니다.',
+                'calibrate_seek': '스캔 보정',
+                'calibration_result': '스캔 임계값: {}\n잡음 바닥: {:.1f}\n찾은 방송: {}개\n헛멈춤: {:.0f}%',
                 'change_device': '기기 변경',
                 'scan_up': '스캔 ↑',
                 'scan_down': '스캔 ↓',
@@ -49,6 +51,8 @@ class LanguageManager:
                 'stop_recording': 'Stop',
                 'settings': 'Settings',
                 'settings_coming_soon': 'Settings feature coming soon.',
+                'calibrate_seek': 'Calibrate Scan',
+                'calibration_result': 'Scan threshold: {}\nNoise floor: {:.1f}\nStations found: {}\nFalse stops: {:.0f}%',
                 'change_device': 'Change Device',
                 'scan_up': 'Scan ↑',
                 'scan_down': 'Scan ↓',
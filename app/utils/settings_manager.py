@@ -14,7 +14,8 @@ class SettingsManager:
             'last_volume': 8,
             'language': 'korean',  # 'korean' 또는 'english'
             'rds_enabled': False,
-            'device_settings': {}
+            'device_settings': {},
+            'location': 'default'  # 시크 임계값 보정 프로필 (기기별 설정 안에 위치별로 저장)
         }
     
     def load_settings(self):
@@ -44,6 +45,15 @@ class SettingsManager:
             print(f"Error saving settings: {e}")
             return False
     
+    def merge_device_settings(self, settings, device_key, data):
+        """기기별 설정을 기존 항목과 병합 (파일 기록은 save_settings로)"""
+        device_settings = dict(settings.get('device_settings') or {})
+        merged = dict(device_settings.get(device_key) or {})
+        merged.update(data)
+        device_settings[device_key] = merged
+        settings['device_settings'] = device_settings
+        return settings
+    
     def get_preset(self, settings, index):
         """특정 인덱스의 프리셋 가져오기"""
         presets = settings.get('presets', [])
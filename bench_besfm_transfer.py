@@ -0,0 +1,146 @@
+"""
+BesFM 전송 경로 마이크로벤치마크
+USB 지연을 제외한 호출당 파이썬 오버헤드를 기존 방식(before)과 현재 방식(after)으로 비교
+
+- before: 기존 _get / _query 전송 + 디코딩 코드 (고정 1ms sleep 제외)
+- after (codec): 재사용 버퍼 + 미리 컴파일한 struct.Struct 경로만
+- after (BesFM): pacing / 재시도 / 캐시 처리까지 포함한 실제 BesFM 호출
+"""
+
+import array
+import os
+import struct
+import sys
+import timeit
+
+# 프로젝트 루트 경로를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.hardware import besfm_core
+from app.hardware.besfm_core import BesFM
+from app.hardware.besfm_enums import BesCmd
+from app.hardware.registers import REGISTERS
+
+
+class NullDevice:
+    """지연 없이 응답하는 가짜 기기 (pyusb ctrl_transfer 반환 규칙을 따름)"""
+
+    idVendor = 0x04e8
+    idProduct = 0xa054
+    bus = 0
+    address = 0
+    serial_number = 'BENCH'
+    manufacturer = 'Samsung'
+    product = 'FM Radio'
+
+    GET_RESPONSE = array.array('B', struct.pack('<H', 9510))
+    QUERY_RESPONSE = array.array('B', bytes([2, 0, 40]) + bytes(range(1, 9)) + b'\x00')
+
+    def is_kernel_driver_active(self, interface):
+        return False
+
+    def get_active_configuration(self):
+        return {(4, 0): [None]}
+
+    def ctrl_transfer(self, bmRequestType, bRequest, wValue, wIndex, data):
+        response = self.QUERY_RESPONSE if bRequest == BesCmd.QUERY.value else self.GET_RESPONSE
+        if isinstance(data, array.array):
+            # pyusb: array.array 버퍼는 그 자리에 채우고 전송 길이 반환
+            data[:] = response
+            return len(response)
+        # pyusb: 그 외 버퍼는 새 array로 복사한 뒤 채워서 반환
+        buf = array.array('B', data)
+        buf[:] = response
+        return buf
+
+
+def before_get_channel(dev):
+    """기존 _get + get_channel 경로"""
+    result = dev.ctrl_transfer(
+        BesCmd.READ.value,
+        BesCmd.GET.value,
+        BesCmd.GET_CURRENT_CHANNEL.value, BesCmd.GET_FM_INDEX.value,
+        bytearray(BesCmd.GET_DATA_LENGTH.value)
+    )
+    return struct.unpack('<H', result)[0] / 100
+
+
+def before_get_status(dev):
+    """기존 _query + get_status RDS 경로"""
+    res = dev.ctrl_transfer(
+        BesCmd.READ.value,
+        BesCmd.QUERY.value,
+        0, 0,
+        bytearray(12)
+    )
+    error, strength = struct.unpack('<BB', res[1:3])
+    rds = res[3:-1].tobytes()
+    return {'type': 'rds', 'error': error, 'strength': strength,
+            'data': rds[1::-1] + rds[3:1:-1] + rds[5:3:-1] + rds[7:5:-1]}
+
+
+def after_get_channel(fm):
+    """재사용 버퍼 + struct.Struct 디코딩 (pacing / 재시도 제외)"""
+    buf = fm._buffer(BesCmd.GET_CURRENT_CHANNEL.value, besfm_core._GET_LENGTH)
+    fm._dev.ctrl_transfer(besfm_core._REQUEST_TYPE, besfm_core._REQUEST_GET,
+                          BesCmd.GET_CURRENT_CHANNEL.value, besfm_core._GET_INDEX, buf)
+    return REGISTERS['channel'].decode(buf)
+
+
+def after_get_status(fm):
+    """재사용 버퍼 + struct.Struct RDS 디코딩 (pacing / 재시도 제외)"""
+    res = fm._buffer('query', besfm_core._QUERY_LENGTH)
+    fm._dev.ctrl_transfer(besfm_core._REQUEST_TYPE, besfm_core._REQUEST_QUERY, 0, 0, res)
+    data = besfm_core._RDS_WORDS_BE.pack(*besfm_core._RDS_WORDS_LE.unpack_from(res, 3))
+    return {'type': 'rds', 'error': res[1], 'strength': res[2], 'data': data}
+
+
+def make_besfm():
+    """pacing 지연을 0으로 둔 BesFM (전송 경로 오버헤드만 측정)"""
+    fm = BesFM(NullDevice())
+    fm._pacer.min_delay = 0.0
+    fm.load_pacing_profile({
+        'get_13': {'delay': 0.0},
+        'query': {'delay': 0.0},
+    })
+    return fm
+
+
+def measure(label, func, number):
+    """호출당 평균 시간 (ns)"""
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    per_call = best / number * 1e9
+    print(f"  {label:<28} {per_call:10.0f} ns/call")
+    return per_call
+
+
+def main():
+    number = 20000
+    dev = NullDevice()
+    fm = make_besfm()
+
+    # 결과가 같은지 먼저 확인
+    assert before_get_channel(dev) == fm.get_channel()
+    assert before_get_status(dev) == fm.get_status() == after_get_status(fm)
+    assert after_get_channel(fm) == fm.get_channel()
+
+    print("=== BesFM 전송 경로 마이크로벤치마크 ===")
+    print(f"반복 횟수: {number} (최솟값 / 5회)")
+    print()
+
+    print("get_channel():")
+    before = measure("before (bytearray + unpack)", lambda: before_get_channel(dev), number)
+    codec = measure("after (codec)", lambda: after_get_channel(fm), number)
+    measure("after (BesFM)", fm.get_channel, number)
+    print(f"  -> codec {before / codec:.2f}x")
+    print()
+
+    print("get_status() RDS:")
+    before = measure("before (slice + concat)", lambda: before_get_status(dev), number)
+    codec = measure("after (codec)", lambda: after_get_status(fm), number)
+    measure("after (BesFM)", fm.get_status, number)
+    print(f"  -> codec {before / codec:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+테스트 공통 설정 - app/을 import 경로에 추가 (시뮬레이터 기반이라 실제 기기 없이 실행)
+
+hardware 패키지는 pyusb를 import하므로 각 테스트 모듈은 pytest.importorskip('usb')로 시작한다.
+"""
+import os
+import sys
+
+import pytest
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+
+@pytest.fixture
+def sim_device():
+    """받은 SET 명령을 sets에 (명령 코드, 값) 순서대로 기록하는 가상 튜너"""
+    from hardware.simulator import SimulatedBesFMDevice
+
+    device = SimulatedBesFMDevice(seed=1, noise=0.0, settle_latency=0.002, rds_interval=10.0)
+    device.sets = []
+    apply_set = device._apply_set
+
+    def record(cmd, value):
+        device.sets.append((cmd, value))
+        apply_set(cmd, value)
+
+    device._apply_set = record
+    return device
+
+
+@pytest.fixture
+def fm(sim_device):
+    """섀도 캐시를 켠 시뮬레이터 BesFM"""
+    from hardware.besfm_core import BesFM
+
+    return BesFM(sim_device, use_cache=True)
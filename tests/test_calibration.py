@@ -0,0 +1,28 @@
+"""
+시크 보정 결과를 쓰는 스캔(seek_station) 테스트
+"""
+import pytest
+
+pytest.importorskip('usb')
+
+from hardware.calibration import SeekCalibration, SEEK_ATTEMPTS, seek_attempts  # noqa: E402
+
+
+def test_seek_attempts_follow_false_stop_rate():
+    assert seek_attempts(None) == SEEK_ATTEMPTS
+    assert seek_attempts(SeekCalibration(40, false_stops_per_seek=0.0)) == 2
+    assert seek_attempts(SeekCalibration(40, false_stops_per_seek=0.5)) == 8
+    assert seek_attempts(SeekCalibration(40, false_stops_per_seek=0.99)) == SEEK_ATTEMPTS
+
+
+def test_scan_skips_stops_below_calibrated_threshold(fm, sim_device):
+    sim_device.noise = 2.0
+    fm.set_power(True)
+    fm.set_channel(88.1)
+    # 기기 임계값이 낮아 잡음에서 멈추는 상황
+    fm.set_rssi_threshold(9)
+    assert fm.seek_station(True)['freq'] < 89.0
+    fm.set_channel(88.1)
+    result = fm.seek_station(True, calibration=SeekCalibration(40, false_stops_per_seek=0.5))
+    assert result['success'] and result['freq'] == 89.1
+    assert result['strength'] >= 40
@@ -0,0 +1,78 @@
+"""
+BesFMWorker 우선순위 / 순서 테스트
+"""
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('usb')
+
+from hardware.besfm_enums import BesCmd  # noqa: E402
+from hardware.io_worker import (BesFMWorker, PRIORITY_USER, PRIORITY_TUNE,  # noqa: E402
+                                PRIORITY_POLL)
+
+
+@pytest.fixture
+def worker(fm):
+    worker = BesFMWorker(fm)
+    yield worker
+    worker.stop()
+
+
+def _block(worker):
+    """워커를 멈춰 두는 작업을 넣고 (시작됨, 풀어 줄 이벤트) 반환"""
+    started, release = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        release.wait(5)
+
+    worker.submit(PRIORITY_USER, hold)
+    assert started.wait(5)
+    return release
+
+
+def test_higher_priority_runs_first_and_fifo_within_priority(worker):
+    release = _block(worker)
+    order = []
+    futures = [worker.submit(priority, order.append, label) for priority, label in (
+        (PRIORITY_POLL, 'poll'), (PRIORITY_TUNE, 'tune1'), (PRIORITY_USER, 'user1'),
+        (PRIORITY_TUNE, 'tune2'), (PRIORITY_USER, 'user2'),
+    )]
+    release.set()
+    for future in futures:
+        future.result(5)
+    assert order == ['user1', 'user2', 'tune1', 'tune2', 'poll']
+
+
+def test_call_from_worker_thread_runs_inline(worker):
+    # 워커 안에서 다시 call()해도 큐에 넣지 않으므로 교착 없이 끝남
+    nested = worker.submit(PRIORITY_USER, lambda: worker.call(PRIORITY_POLL, 'get_volume'))
+    assert nested.result(5) == 8
+
+
+def test_proxy_uses_method_priority(worker, sim_device):
+    release = _block(worker)
+    proxy = worker.proxy()
+    polled = worker.submit(PRIORITY_POLL, lambda: [cmd for cmd, _ in sim_device.sets])
+    tuned = threading.Thread(target=proxy.set_channel, args=(99.9,))
+    tuned.start()
+    while worker.pending() < 2:
+        time.sleep(0.001)
+    release.set()
+    tuned.join(5)
+    # set_channel은 PRIORITY_TUNE이라 먼저 넣은 PRIORITY_POLL 작업보다 먼저 실행됨
+    assert polled.result(5) == [BesCmd.SET_CHANNEL.value]
+
+
+def test_stop_cancels_pending(fm):
+    worker = BesFMWorker(fm)
+    release = _block(worker)
+    pending = worker.submit(PRIORITY_POLL, fm.get_rssi)
+    worker.stop(timeout=0)
+    release.set()
+    worker._thread.join(5)
+    assert pending.cancelled()
+    with pytest.raises(RuntimeError):
+        worker.submit(PRIORITY_USER, fm.get_rssi).result(1)
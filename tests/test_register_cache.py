@@ -0,0 +1,77 @@
+"""
+섀도 레지스터 캐시 TTL / 무효화 테스트
+"""
+import time
+
+import pytest
+
+pytest.importorskip('usb')
+
+from hardware.besfm_enums import BesCmd  # noqa: E402
+from hardware.register_cache import RegisterCache  # noqa: E402
+
+
+VOLUME = BesCmd.GET_CURRENT_VOLUME.value
+CHANNEL = BesCmd.GET_CURRENT_CHANNEL.value
+MUTE = BesCmd.GET_MUTE_STATE.value
+
+
+def test_entry_expires_after_ttl():
+    cache = RegisterCache({VOLUME: 0.05})
+    cache.put(VOLUME, b'\x05\x00')
+    assert cache.get(VOLUME) == b'\x05\x00'
+    time.sleep(0.06)
+    assert cache.get(VOLUME) is None
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'entries': 0}
+
+
+def test_zero_ttl_is_not_cached_and_none_never_expires():
+    cache = RegisterCache({VOLUME: 0, MUTE: None})
+    cache.put(VOLUME, b'\x05\x00')
+    cache.put(MUTE, b'\x01\x00')
+    assert cache.get(VOLUME) is None
+    assert cache.get(MUTE) == b'\x01\x00'
+
+
+def test_write_through_updates_matching_get():
+    cache = RegisterCache()
+    cache.write_through(BesCmd.SET_VOLUME.value, 11)
+    assert cache.get(VOLUME) == b'\x0b\x00'
+
+
+def test_set_side_effects_invalidate():
+    cache = RegisterCache()
+    cache.put(CHANNEL, b'\x92\x22')
+    cache.put(VOLUME, b'\x05\x00')
+    # 대역을 바꾸면 주파수만 무효화
+    cache.write_through(BesCmd.SET_FM_BAND.value, 1)
+    assert cache.get(CHANNEL) is None
+    assert cache.get(VOLUME) == b'\x05\x00'
+    # 전원을 바꾸면 전체 무효화
+    cache.write_through(BesCmd.SET_POWER_STATE.value, 1)
+    assert cache.get(VOLUME) is None
+
+
+def test_failed_set_invalidates_its_register():
+    cache = RegisterCache()
+    cache.put(VOLUME, b'\x05\x00')
+    cache.put(MUTE, b'\x01\x00')
+    cache.invalidate_for_set(BesCmd.SET_VOLUME.value)
+    assert cache.get(VOLUME) is None
+    assert cache.get(MUTE) == b'\x01\x00'
+
+
+def test_besfm_reads_hit_cache_until_invalidated(fm, sim_device):
+    assert fm.get_volume() == 8
+    sim_device._registers[VOLUME] = 3
+    # 캐시된 값이므로 기기 값이 바뀐 것을 모름
+    assert fm.get_volume() == 8
+    fm.invalidate_cache(VOLUME)
+    assert fm.get_volume() == 3
+    assert fm.get_cache_stats()['hits'] >= 1
+
+
+def test_besfm_set_writes_through(fm):
+    fm.set_volume(12)
+    assert fm.get_volume() == 12
+    assert fm.read('volume', fresh=True) == {'volume': 12}
@@ -0,0 +1,111 @@
+"""
+USB 오류 분류 / 재시도 데드라인 / 서킷 브레이커 테스트
+"""
+import errno
+import time
+
+import pytest
+
+usb = pytest.importorskip('usb')
+import usb.core  # noqa: E402
+
+from hardware.retry_policy import (RetryEngine, RetryPolicy, DeviceDisconnectedError,  # noqa: E402
+                                   classify_usb_error, ERROR_TIMEOUT, ERROR_STALL,
+                                   ERROR_TRANSIENT, ERROR_DEVICE_GONE, ERROR_FATAL)
+
+
+def _error(code):
+    return usb.core.USBError(errno.errorcode.get(code, 'error'), None, code)
+
+
+@pytest.mark.parametrize('code, kind', [
+    (errno.ETIMEDOUT, ERROR_TIMEOUT),
+    (errno.EPIPE, ERROR_STALL),
+    (errno.ENODEV, ERROR_DEVICE_GONE),
+    (errno.ESHUTDOWN, ERROR_DEVICE_GONE),
+    (errno.EACCES, ERROR_FATAL),
+    (errno.EINVAL, ERROR_FATAL),
+    (errno.EBUSY, ERROR_TRANSIENT),
+    (errno.EIO, ERROR_TRANSIENT),
+    (None, ERROR_TRANSIENT),
+])
+def test_classify_usb_error(code, kind):
+    assert classify_usb_error(_error(code)) == kind
+
+
+def test_disconnected_error_is_device_gone():
+    assert classify_usb_error(DeviceDisconnectedError()) == ERROR_DEVICE_GONE
+
+
+class _Flaky:
+    """앞의 failures번은 code 오류, 이후 성공하는 전송 함수"""
+
+    def __init__(self, failures, code=errno.EBUSY, duration=0.0):
+        self.failures = failures
+        self.code = code
+        self.duration = duration
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.duration:
+            time.sleep(self.duration)
+        if self.calls <= self.failures:
+            raise _error(self.code)
+        return 'ok'
+
+
+def _engine(**kwargs):
+    kwargs.setdefault('jitter', 0)
+    kwargs.setdefault('base_delay', 0.001)
+    return RetryEngine(RetryPolicy(**kwargs))
+
+
+def test_transient_errors_are_retried():
+    engine, transfer = _engine(max_attempts=3), _Flaky(2)
+    assert engine.execute('get_1', transfer) == 'ok'
+    assert transfer.calls == 3
+    stats = engine.get_stats()
+    assert stats['retries'] == 2 and stats['failures'] == 0
+
+
+def test_fatal_error_is_not_retried():
+    engine, transfer = _engine(max_attempts=5), _Flaky(5, errno.EACCES)
+    with pytest.raises(usb.core.USBError):
+        engine.execute('get_1', transfer)
+    assert transfer.calls == 1
+
+
+def test_attempts_are_bounded():
+    engine, transfer = _engine(max_attempts=3, deadline=10.0), _Flaky(10)
+    with pytest.raises(usb.core.USBError):
+        engine.execute('get_1', transfer)
+    assert transfer.calls == 3
+
+
+def test_deadline_counts_from_first_attempt():
+    # 첫 전송이 데드라인을 다 쓰고 실패하면 재시도하지 않음
+    engine, transfer = _engine(max_attempts=5, deadline=0.05), _Flaky(5, duration=0.06)
+    with pytest.raises(usb.core.USBError):
+        engine.execute('get_1', transfer)
+    assert transfer.calls == 1
+
+
+def test_per_command_deadline():
+    engine = _engine(max_attempts=5, deadline=0.0, deadlines={'set_power': 10.0})
+    with pytest.raises(usb.core.USBError):
+        engine.execute('get_1', _Flaky(1))
+    assert engine.execute('set_power', _Flaky(1)) == 'ok'
+
+
+def test_device_gone_trips_breaker():
+    engine, gone = _engine(), []
+    engine.on_device_gone = gone.append
+    transfer = _Flaky(1, errno.ENODEV)
+    with pytest.raises(DeviceDisconnectedError):
+        engine.execute('get_1', transfer)
+    assert len(gone) == 1
+    # 브레이커가 열려 있으면 전송하지 않고 바로 실패
+    with pytest.raises(DeviceDisconnectedError):
+        engine.execute('get_1', transfer)
+    assert transfer.calls == 1
@@ -0,0 +1,76 @@
+"""
+I/O 서버 공유 메모리 상태 블록 seqlock 테스트
+"""
+import threading
+
+import pytest
+
+pytest.importorskip('usb')
+
+from hardware.io_server import SharedStateBlock, _SEQ  # noqa: E402
+
+
+@pytest.fixture
+def blocks():
+    """(쓰는 쪽 블록, 이름으로 붙은 읽는 쪽 블록)"""
+    writer = SharedStateBlock()
+    reader = SharedStateBlock(writer.name)
+    yield writer, reader
+    reader.close()
+    writer.close()
+
+
+def test_reader_sees_published_values(blocks):
+    writer, reader = blocks
+    writer.publish(channel=101.9, volume=7, power=True, mute=True)
+    state = reader.read()
+    assert state.channel == 101.9 and state.volume == 7
+    assert state.power and state.mute and not state.recording
+    assert state.seq % 2 == 0
+    writer.increment('tune_count', rssi=40)
+    state = reader.read()
+    assert (state.tune_count, state.rssi, state.channel) == (1, 40, 101.9)
+
+
+def test_concurrent_reads_are_never_torn(blocks):
+    writer, reader = blocks
+    stop = threading.Event()
+
+    def write():
+        # volume / rssi / rds_count는 항상 같은 값에서 나온 값으로 함께 게시
+        n = 0
+        while not stop.is_set():
+            n += 1
+            writer.publish(volume=n % 16, rssi=n % 128, rds_count=n)
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    try:
+        seen = 0
+        for _ in range(20000):
+            state = reader.read()
+            if state is None or state.rds_count == 0:
+                continue
+            seen += 1
+            assert state.volume == state.rds_count % 16
+            assert state.rssi == state.rds_count % 128
+            assert state.seq % 2 == 0
+    finally:
+        stop.set()
+        thread.join(5)
+    assert seen
+
+
+def test_read_during_write_returns_last_consistent_state(blocks):
+    writer, reader = blocks
+    writer.publish(volume=3)
+    consistent = reader.read()
+    # 쓰는 쪽이 쓰는 도중 멈춘 상태 (seq 홀수)
+    _SEQ.pack_into(writer._buf, 0, consistent.seq + 1)
+    assert reader.read() == consistent
+    # 새 읽는 쪽은 일관된 값을 읽은 적이 없으므로 None
+    late = SharedStateBlock(writer.name)
+    try:
+        assert late.read() is None
+    finally:
+        late.close()
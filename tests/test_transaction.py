@@ -0,0 +1,58 @@
+"""
+plan_writes() 순서 / BesFM.apply() 트랜잭션 테스트
+"""
+import pytest
+
+pytest.importorskip('usb')
+
+from hardware.besfm_enums import BesCmd  # noqa: E402
+from hardware.transaction import plan_writes  # noqa: E402
+
+
+def test_dependencies_are_written_first():
+    assert plan_writes(('channel', 'band')) == ('band', 'channel')
+    assert plan_writes(('volume', 'channel', 'spacing', 'mute')) == \
+        ('volume', 'spacing', 'channel', 'mute')
+
+
+def test_given_order_is_kept_without_dependencies():
+    assert plan_writes(('mute', 'volume', 'power')) == ('mute', 'volume', 'power')
+    assert plan_writes(()) == ()
+
+
+def test_unknown_register_is_rejected():
+    with pytest.raises(KeyError):
+        plan_writes(('volume', 'bass'))
+
+
+def test_apply_sends_in_plan_order(fm, sim_device):
+    config = {'channel': 100.1, 'mute': True, 'band': 0, 'power': True}
+    report = fm.apply(config, skip_unchanged=False)
+    # 의존 레지스터가 남은 channel만 band 뒤로 밀리고 나머지는 주어진 순서
+    assert report.written == plan_writes(config) == ('mute', 'band', 'channel', 'power')
+    assert sim_device.sets == [
+        (BesCmd.SET_MUTE.value, 1), (BesCmd.SET_FM_BAND.value, 0),
+        (BesCmd.SET_CHANNEL.value, 10010), (BesCmd.SET_POWER_STATE.value, 1),
+    ]
+
+
+def test_apply_waits_for_power_before_next_write(fm):
+    report = fm.apply({'power': True, 'volume': 5})
+    power, volume = report.steps
+    assert not power.skipped and power.waited == 0.0
+    assert volume.waited > 0.0
+
+
+def test_apply_skips_cached_values(fm, sim_device):
+    fm.apply({'volume': 5, 'mute': True})
+    sim_device.sets.clear()
+    report = fm.apply({'volume': 5, 'mute': False})
+    assert report.skipped == ('volume',)
+    assert report.written == ('mute',)
+    assert sim_device.sets == [(BesCmd.SET_MUTE.value, 0)]
+
+
+def test_apply_validates_everything_before_writing(fm, sim_device):
+    with pytest.raises(ValueError):
+        fm.apply({'volume': 5, 'band': 9})
+    assert sim_device.sets == []